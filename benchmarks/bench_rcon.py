@@ -0,0 +1,311 @@
+"""RCONの通信とコマンド送信のベンチマーク
+
+FakeRCONServerを別プロセスで起動し、ループバック経由で各シナリオを計測します。
+結果は比較しやすいようにJSONで出力します。
+
+使い方:
+    python benchmarks/bench_rcon.py --commands 5000 --output result.json
+    python benchmarks/bench_rcon.py --scenario set_block_serial --latency 0.0005
+"""
+
+import argparse
+import json
+import multiprocessing
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+
+from PyCraftCommander import PyCraftCommander, Pos  # noqa: E402
+from PyCraftCommander.fake_server import FakeRCONServer  # noqa: E402
+from PyCraftCommander.instrumentation import LatencyHistogram  # noqa: E402
+from PyCraftCommander.types import snbt  # noqa: E402
+
+PASSWORD = "bench"
+PLAYERS = 20
+# 大きなレスポンスの文字数(4096文字ごとのパケットに分割される)
+LARGE_RESPONSE_LENGTH = 256 * 1024
+
+
+def _large_inventory() -> str:
+    items = ", ".join(
+        f'{{Slot: {i}b, id: "minecraft:diamond_sword", count: 1, components: '
+        f'{{"minecraft:damage": {i}, "minecraft:enchantments": {{levels: '
+        f'{{"minecraft:sharpness": 5, "minecraft:unbreaking": 3}}}}}}}}'
+        for i in range(36)
+    )
+    return f"Steve has the following entity data: {{Inventory: [{items}], UUID: [I; 1, 2, 3, 4]}}"
+
+
+def _serve(conn, latency: float, jitter: float):
+    """子プロセスでFakeRCONServerを起動します。"""
+    with FakeRCONServer(password=PASSWORD, latency=latency, jitter=jitter) as fake:
+        for i in range(PLAYERS):
+            fake.add_player(f"player{i}", Pos(i + 0.5, 64.0, -i - 0.5))
+        fake.handlers["large"] = lambda args: "x" * LARGE_RESPONSE_LENGTH
+        conn.send(fake.address)
+        # 親プロセスから終了の合図が来るまで待つ
+        conn.recv()
+
+
+def _chunks(items: list, size: int):
+    for start in range(0, len(items), size):
+        yield items[start : start + size]
+
+
+def _positions(n: int) -> list[Pos]:
+    return [Pos(i % 64, 64 + (i // 4096) % 64, (i // 64) % 64) for i in range(n)]
+
+
+# 各シナリオは(サーバー, コマンド数)を受け取り、操作ごとの(コマンド数, 関数)のリストを返す
+Scenario = Callable[[PyCraftCommander, int], list[tuple[int, Callable[[], object]]]]
+
+
+def scenario_set_block_serial(server, n):
+    return [
+        (1, lambda p=p: server.set_block(p, "minecraft:stone")) for p in _positions(n)
+    ]
+
+
+def scenario_set_block_pipelined(server, n):
+    blocks = [(p, "minecraft:stone") for p in _positions(n)]
+    return [
+        (len(chunk), lambda chunk=chunk: server.set_blocks(chunk))
+        for chunk in _chunks(blocks, 256)
+    ]
+
+
+def scenario_set_block_batched(server, n):
+    def run(chunk):
+        with server.batch() as b:
+            for p in chunk:
+                b.set_block(p, "minecraft:stone")
+        return b.results
+
+    return [
+        (len(chunk), lambda chunk=chunk: run(chunk))
+        for chunk in _chunks(_positions(n), 256)
+    ]
+
+
+def scenario_fill_serial(server, n):
+    return [
+        (1, lambda p=p: server.fill(p, Pos(p.x, p.y, p.z), "minecraft:glass"))
+        for p in _positions(n)
+    ]
+
+
+def scenario_fill_pipelined(server, n):
+    commands = [f"fill {p} {p} minecraft:glass replace" for p in _positions(n)]
+    return [
+        (len(chunk), lambda chunk=chunk: server.send_commands(chunk))
+        for chunk in _chunks(commands, 256)
+    ]
+
+
+def scenario_get_player_info_serial(server, n):
+    count = max(1, n // 3)
+    return [
+        (3, lambda i=i: server.get_player_info(f"player{i % PLAYERS}"))
+        for i in range(count)
+    ]
+
+
+def scenario_get_player_info_snapshot(server, n):
+    return [
+        (1, lambda i=i: server.get_player_info(f"player{i % PLAYERS}", snapshot=True))
+        for i in range(n)
+    ]
+
+
+def scenario_get_all_player_info(server, n):
+    count = max(1, n // (PLAYERS + 1))
+    return [(PLAYERS + 1, server.get_all_player_info) for _ in range(count)]
+
+
+def scenario_large_response(server, n):
+    count = max(1, n // 100)
+    return [(1, lambda: server.send_command("large", multi_packet=True))] * count
+
+
+def scenario_snbt_parse(server, n):
+    text = _large_inventory()
+    return [(1, lambda: snbt.parse_data_get(text))] * n
+
+
+SCENARIOS: dict[str, Scenario] = {
+    "set_block_serial": scenario_set_block_serial,
+    "set_block_pipelined": scenario_set_block_pipelined,
+    "set_block_batched": scenario_set_block_batched,
+    "fill_serial": scenario_fill_serial,
+    "fill_pipelined": scenario_fill_pipelined,
+    "get_player_info_serial": scenario_get_player_info_serial,
+    "get_player_info_snapshot": scenario_get_player_info_snapshot,
+    "get_all_player_info": scenario_get_all_player_info,
+    "large_response": scenario_large_response,
+    "snbt_parse": scenario_snbt_parse,
+}
+
+
+def _merge(histograms: list[LatencyHistogram]) -> LatencyHistogram:
+    """複数のヒストグラムを1つにまとめます。"""
+    merged = LatencyHistogram()
+    for histogram in histograms:
+        if not histogram.count:
+            continue
+        merged.counts = [a + b for a, b in zip(merged.counts, histogram.counts)]
+        merged.count += histogram.count
+        merged.sum += histogram.sum
+        merged.min = min(histogram.min, merged.min or histogram.min)
+        merged.max = max(histogram.max, merged.max or histogram.max)
+    return merged
+
+
+def run_scenario(server: PyCraftCommander, name: str, n: int) -> dict:
+    """シナリオを実行し、計測結果を返します。"""
+    scenario = SCENARIOS[name]
+
+    # 計測対象外の準備(コマンド文字列の組み立てなど)を済ませ、ウォームアップする
+    for _, op in scenario(server, min(n, 50)):
+        op()
+
+    ops = scenario(server, n)
+    total_commands = sum(count for count, _ in ops)
+    # レイテンシはコマンドごとの送信から応答までの時間(Instrumentationのヒストグラム)
+    server.instrumentation.reset()
+    operations = LatencyHistogram()
+    start = time.perf_counter()
+    for _, op in ops:
+        t = time.perf_counter()
+        op()
+        operations.record(time.perf_counter() - t)
+    elapsed = time.perf_counter() - start
+    histograms = server.instrumentation.histograms
+    # RCONのコマンドを送らないシナリオ(snbt_parse)は操作ごとの時間を使う
+    latency = _merge(list(histograms.values())) if histograms else operations
+    # 以降のメモリの計測でもヒストグラムに記録されるため、ここで集計しておく
+    latency_by_command = {
+        verb: histogram.snapshot() for verb, histogram in sorted(histograms.items())
+    }
+
+    # メモリ割り当ては別に計測する(tracemallocは実行速度に影響するため)
+    ops = scenario(server, n)
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    for _, op in ops:
+        op()
+    _, peak = tracemalloc.get_traced_memory()
+    after = tracemalloc.take_snapshot()
+    tracemalloc.stop()
+    # 計測後も解放されずに残っているメモリブロック(キャッシュなど)
+    ignore = [tracemalloc.Filter(False, tracemalloc.__file__)]
+    retained = after.filter_traces(ignore).compare_to(
+        before.filter_traces(ignore), "filename"
+    )
+
+    return {
+        "scenario": name,
+        "commands": total_commands,
+        "operations": len(ops),
+        "seconds": elapsed,
+        "commands_per_second": total_commands / elapsed,
+        "latency_samples": latency.count,
+        "latency_p50_us": latency.percentile(50) * 1e6,
+        "latency_p99_us": latency.percentile(99) * 1e6,
+        "latency_by_command": latency_by_command,
+        "operation_p50_us": operations.percentile(50) * 1e6,
+        "operation_p99_us": operations.percentile(99) * 1e6,
+        "peak_traced_bytes_per_command": peak / total_commands,
+        "retained_bytes_per_command": sum(stat.size_diff for stat in retained)
+        / total_commands,
+        "retained_allocations_per_command": sum(stat.count_diff for stat in retained)
+        / total_commands,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).resolve().parent,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--commands", type=int, default=2000, help="シナリオごとのコマンド数"
+    )
+    parser.add_argument(
+        "--latency",
+        type=float,
+        default=0.0,
+        help="サーバーのコマンドごとの処理時間(秒)",
+    )
+    parser.add_argument(
+        "--jitter", type=float, default=0.0, help="処理時間のばらつき(秒)"
+    )
+    parser.add_argument(
+        "--scenario",
+        action="append",
+        choices=sorted(SCENARIOS),
+        help="実行するシナリオ(複数指定可)。省略時は全て",
+    )
+    parser.add_argument("--output", type=Path, help="結果を書き出すJSONファイル")
+    args = parser.parse_args()
+
+    parent_conn, child_conn = multiprocessing.Pipe()
+    process = multiprocessing.Process(
+        target=_serve, args=(child_conn, args.latency, args.jitter), daemon=True
+    )
+    process.start()
+    host, port = parent_conn.recv()
+
+    results = []
+    try:
+        with PyCraftCommander(host, port, PASSWORD) as server:
+            server.auth()
+            for name in args.scenario or SCENARIOS:
+                result = run_scenario(server, name, args.commands)
+                results.append(result)
+                print(
+                    f"{name:28} {result['commands_per_second']:>12,.0f} cmd/s"
+                    f"  p50 {result['latency_p50_us']:>9.1f}us"
+                    f"  p99 {result['latency_p99_us']:>9.1f}us"
+                    f"  {result['peak_traced_bytes_per_command']:>8.1f} B/cmd"
+                )
+    finally:
+        parent_conn.send("stop")
+        process.join(timeout=5)
+
+    report = {
+        "timestamp": datetime.now(timezone.utc).isoformat(),
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "parameters": {
+            "commands": args.commands,
+            "latency": args.latency,
+            "jitter": args.jitter,
+        },
+        "results": results,
+    }
+    if args.output:
+        args.output.write_text(json.dumps(report, indent=2))
+    else:
+        print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,45 @@
+"""マインクラフトIDのデータファイル(mcid.dat)を作成するスクリプト
+
+src/PyCraftCommander/mcid_<バージョン>.txtを全て読み込み、古いバージョンから順に
+ビットを割り当ててsrc/PyCraftCommander/mcid.datに書き込みます。
+新しいバージョンに対応する場合は、mcid_<バージョン>.txtを追加して実行し、
+types/mcid.pyのMinecraftVersionにバージョンを追加してください。
+
+使い方:
+    python scripts/build_mcid.py
+"""
+
+import re
+import sys
+from pathlib import Path
+
+PACKAGE = Path(__file__).resolve().parent.parent / "src" / "PyCraftCommander"
+sys.path.insert(0, str(PACKAGE.parent))
+
+from PyCraftCommander.types.mcid import IdRegistry, build_registry, read_id_list
+
+
+def version_key(version: str) -> tuple[int, ...]:
+    return tuple(int(part) for part in version.split("."))
+
+
+def main():
+    sources = {}
+    for path in PACKAGE.glob("mcid_*.txt"):
+        version = re.fullmatch(r"mcid_(.+)\.txt", path.name).group(1)
+        sources[version] = read_id_list(path.read_text("utf-8"))
+    if not sources:
+        raise SystemExit(f"{PACKAGE}にmcid_<バージョン>.txtがありません。")
+
+    versions = {v: sources[v] for v in sorted(sources, key=version_key)}
+    data = build_registry(versions)
+    # 作成したデータが読み込めることを確認してから書き込む
+    registry = IdRegistry(data)
+    for version, ids in versions.items():
+        assert len(registry.table(version)) == len(ids), version
+    (PACKAGE / "mcid.dat").write_bytes(data)
+    print(f"mcid.dat: {', '.join(versions)} ({len(registry)} ids, {len(data)} bytes)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,37 @@
+"""バニラのデータジェネレーターの出力からIDのリスト(mcid_<バージョン>.txt)を作成するスクリプト
+
+サーバーのjarで以下を実行するとgenerated/reports/registries.jsonが作成されます。
+    java -DbundlerMainClass=net.minecraft.data.Main -jar server.jar --reports
+
+registries.jsonのブロックとアイテムのレジストリを合わせて
+src/PyCraftCommander/mcid_<バージョン>.txtに書き込みます。
+作成後はscripts/build_mcid.pyを実行してmcid.datを更新してください。
+
+使い方:
+    python scripts/update_mcid_list.py <バージョン> <registries.jsonのパス>
+"""
+
+import json
+import sys
+from pathlib import Path
+
+PACKAGE = Path(__file__).resolve().parent.parent / "src" / "PyCraftCommander"
+REGISTRIES = ("minecraft:block", "minecraft:item")
+
+
+def main():
+    if len(sys.argv) != 3:
+        raise SystemExit(__doc__)
+    version, path = sys.argv[1:]
+    registries = json.loads(Path(path).read_text("utf-8"))
+
+    ids: set[str] = set()
+    for registry in REGISTRIES:
+        ids.update(registries[registry]["entries"])
+    lines = sorted(id.removeprefix("minecraft:") for id in ids)
+    (PACKAGE / f"mcid_{version}.txt").write_text("\n".join(lines) + "\n", "utf-8")
+    print(f"mcid_{version}.txt: {len(lines)} ids")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,4 +1,41 @@
 from PyCraftCommander.py_craft_commander import *
 from PyCraftCommander.rcon import *
+from PyCraftCommander.batch import *
+from PyCraftCommander.block_cache import *
+from PyCraftCommander.throttle import *
+from PyCraftCommander.reconnect import *
+from PyCraftCommander.validation import *
+from PyCraftCommander.instrumentation import *
+from PyCraftCommander.metrics import *
+from PyCraftCommander.pool import *
 from PyCraftCommander.types.player import *
 from PyCraftCommander.types.mcid import *
+
+from PyCraftCommander.types import mcid as _mcid
+
+# asyncioやconcurrent.futuresの読み込みに時間がかかるため、使用されたときに読み込む
+# 名前 -> モジュール
+_LAZY_MODULES = {
+    "AsyncRCON": "async_rcon",
+    "AsyncPyCraftCommander": "async_py_craft_commander",
+    "Cluster": "cluster",
+    "ClusterResult": "cluster",
+}
+
+
+def __getattr__(name: str):
+    module = _LAZY_MODULES.get(name)
+    if module is not None:
+        from importlib import import_module
+
+        value = getattr(import_module(f"{__name__}.{module}"), name)
+        globals()[name] = value
+        return value
+    # バージョンごとのIDの表(V1_21など)は使用されたときに読み込む
+    if name.startswith("V1_"):
+        return getattr(_mcid, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return [*globals(), *_LAZY_MODULES]
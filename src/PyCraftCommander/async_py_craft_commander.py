@@ -0,0 +1,224 @@
+from PyCraftCommander import commands
+from PyCraftCommander.async_rcon import AsyncRCON
+from PyCraftCommander.types.player import Player, Pos, GameMode
+from typing import Iterable, Literal
+
+
+class AsyncPyCraftCommander(AsyncRCON):
+    """PyCraftCommanderのasyncio版です。
+
+    各メソッドはPyCraftCommanderの同名メソッドと同じ引数・戻り値を持ちます。
+    batch・fill_voxelsと、ブロックのキャッシュ・ブロックIDの検証・計測のフックは
+    PyCraftCommanderのみの機能です。
+
+    Example:
+    --------
+    ```python
+    async with AsyncPyCraftCommander(host, port, password) as server:
+        await server.auth()
+        player_list = await server.get_player_list()
+        await asyncio.gather(*(server.set_block(pos, block) for pos in positions))
+    ```
+    """
+
+    async def get_player_list(self) -> list[str]:
+        """マインクラフトサーバーのプレイヤーリストを取得します。"""
+        response, status = await self.send_command(commands.player_list())
+        if not status:
+            return []
+        return commands.parse_player_list(response)
+
+    async def get_player_info(self, player_name: str, snapshot: bool = False) -> Player:
+        """プレイヤーの情報を取得します。"""
+        if snapshot:
+            response, status = await self.send_command(
+                commands.player_data(player_name), multi_packet=True
+            )
+            if not status:
+                return None
+            return commands.parse_player_data(player_name, response)
+
+        # 3つのコマンドは同じ接続上で同時に送信する
+        (pos, pos_status), (dimension, dim_status), (gamemode, gm_status) = (
+            await self.send_commands(
+                [
+                    commands.player_pos(player_name),
+                    commands.player_dimension(player_name),
+                    commands.player_gamemode(player_name),
+                ]
+            )
+        )
+        if not (pos_status and dim_status and gm_status):
+            return None
+        pos = commands.parse_player_pos(pos)
+
+        return Player(
+            player_name,
+            pos,
+            Pos(int(pos.x), int(pos.y), int(pos.z)),
+            commands.parse_player_dimension(dimension),
+            commands.parse_player_gamemode(gamemode),
+        )
+
+    async def get_all_player_info(self) -> list[Player]:
+        """ログイン中の全てのプレイヤーの情報を取得します。"""
+        player_list = [name for name in await self.get_player_list() if name]
+        results = await self.send_commands(
+            (commands.player_data(name) for name in player_list), multi_packet=True
+        )
+
+        players = []
+        for player_name, (response, status) in zip(player_list, results):
+            if not status:
+                continue
+            try:
+                players.append(commands.parse_player_data(player_name, response))
+            except (ValueError, KeyError):
+                # 取得の間にログアウトした場合などはエラーメッセージが返る
+                continue
+        return players
+
+    async def get_seed(self) -> int:
+        """ワールドのシードを取得します。"""
+        response, status = await self.send_command(commands.seed())
+        return commands.parse_seed(response)
+
+    async def set_world_spawn(self, pos: Player | Pos | str, angle: float = 0.0) -> str:
+        """ワールドのスポーン地点を設定します。"""
+        response, status = await self.send_command(commands.set_world_spawn(pos, angle))
+        return response
+
+    async def set_spawn_point(self, pos: Player | Pos | str, angle: float = 0.0) -> str:
+        """ワールドのスポーン地点を設定します。"""
+        response, status = await self.send_command(commands.set_spawn_point(pos, angle))
+        return response
+
+    async def tp(self, from_: str | Player, to: str | Player) -> str:
+        """プレイヤーをテレポートします。"""
+        if from_ == to and (from_ not in "@" or to not in "@"):
+            return "同じプレイヤーにはテレポートできません。"
+
+        response, status = await self.send_command(commands.tp(from_, to))
+        return response
+
+    async def set_block(
+        self,
+        pos: Player | Pos | str,
+        block_id: str,
+        mode: Literal["replace", "keep", "destroy"] = "replace",
+    ) -> str:
+        """ブロックを設置します。"""
+        response, status = await self.send_command(
+            commands.set_block(pos, block_id, mode)
+        )
+        return response
+
+    async def set_blocks(
+        self,
+        blocks: Iterable[tuple[Player | Pos | str, str]],
+        mode: Literal["replace", "keep", "destroy"] = "replace",
+    ) -> list[str]:
+        """複数のブロックをまとめて設置します。"""
+        results = await self.send_commands(
+            commands.set_block(pos, block_id, mode) for pos, block_id in blocks
+        )
+        return [response for response, status in results]
+
+    async def fill(
+        self,
+        pos1: Player | Pos | str,
+        pos2: Player | Pos | str,
+        block_id: str,
+        mode: Literal["replace", "keep", "destroy", "hollow", "outline"] = "replace",
+    ) -> str:
+        """範囲内にブロックを設置します。"""
+        response, status = await self.send_command(
+            commands.fill(pos1, pos2, block_id, mode)
+        )
+        return response
+
+    async def gamemode(
+        self,
+        mode: (
+            GameMode | Literal["survival", "creative", "adventure", "spectator"] | int
+        ),
+        target: str | Player,
+    ) -> str:
+        """ゲームモードを変更します。"""
+        response, status = await self.send_command(commands.gamemode(mode, target))
+        return response
+
+    async def give(self, target: str | Player, item: str, count: int = 1) -> str:
+        """アイテムを付与します。"""
+        response, status = await self.send_command(commands.give(target, item, count))
+        return response
+
+    async def clear(self, target: str | Player, item: str = "") -> str:
+        """アイテムをクリアします。"""
+        response, status = await self.send_command(commands.clear(target, item))
+        return response
+
+    async def difficulty(
+        self, difficulty: Literal["peaceful", "easy", "normal", "hard"] | int
+    ) -> str:
+        """難易度を変更します。"""
+        response, status = await self.send_command(commands.difficulty(difficulty))
+        return response
+
+    async def effect_clear(self, target: str | Player, effect: str) -> str:
+        """エフェクトをクリアします。"""
+        response, status = await self.send_command(
+            commands.effect_clear(target, effect)
+        )
+        return response
+
+    async def effect_give(
+        self,
+        target: str | Player,
+        effect: str,
+        seconds: int,
+        level: int = 0,
+        hideParticles: bool = False,
+    ) -> str:
+        """エフェクトを付与します。"""
+        response, status = await self.send_command(
+            commands.effect_give(target, effect, seconds, level, hideParticles)
+        )
+        return response
+
+    async def effect_give_infinite(
+        self,
+        target: str | Player,
+        effect: str,
+        level: int = 0,
+        hideParticles: bool = False,
+    ) -> str:
+        """エフェクトを無限に付与します。"""
+        response, status = await self.send_command(
+            commands.effect_give_infinite(target, effect, level, hideParticles)
+        )
+        return response
+
+    async def enchant(
+        self, target: str | Player, enchantment: str, level: int = 1
+    ) -> str:
+        """エンチャントを付与します。"""
+        response, status = await self.send_command(
+            commands.enchant(target, enchantment, level)
+        )
+        return response
+
+    async def kill(self, target: str | Player) -> str:
+        """プレイヤーを殺します。"""
+        response, status = await self.send_command(commands.kill(target))
+        return response
+
+    async def say(self, message: str) -> str:
+        """チャットにメッセージを送信します。"""
+        response, status = await self.send_command(commands.say(message))
+        return response
+
+    async def message(self, target: str | Player, message: str) -> str:
+        """プレイヤーにメッセージを送信します。"""
+        response, status = await self.send_command(commands.message(target, message))
+        return response
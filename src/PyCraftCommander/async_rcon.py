@@ -0,0 +1,209 @@
+import asyncio
+import struct
+from typing import Iterable
+from PyCraftCommander.protocol import PacketEncoder, PacketReader
+from PyCraftCommander.types.packet import Packet, PacketType
+
+
+class AsyncRCON:
+    """asyncioでMinecraftサーバーにコマンドを送信するためのクラス
+
+    RCONと同じパケット形式を使用します。1つの接続上で複数のコマンドを同時にawaitでき、
+    レスポンスはリクエストIDで呼び出し元に振り分けられます。
+
+    Example:
+    --------
+    ```python
+    async with AsyncRCON(host, port, password) as rcon:
+        await rcon.auth()
+        results = await asyncio.gather(*(rcon.send_command(c) for c in commands))
+    ```
+    """
+
+    # 4バイトの符号付き整数フォーマット
+    __i32 = struct.Struct("<i")
+    # responseパケットの構造(サイズを除く)
+    __res_struct = struct.Struct("<ii")
+
+    def __init__(self, host, port, password, window: int = 64, timeout: float = 5.0):
+        self.__host = host
+        self.__port = port
+        self.__password = password
+        # send_commandsで同時に応答待ちにできるコマンド数
+        self.__window = window
+        self.__timeout = timeout
+        self.__reader: asyncio.StreamReader | None = None
+        self.__writer: asyncio.StreamWriter | None = None
+        self.__read_task: asyncio.Task | None = None
+        # リクエストID -> レスポンス待ちのFuture
+        self.__pending: dict[int, asyncio.Future] = {}
+        # multi_packet時、コマンドのリクエストID -> 受信済みの本文
+        self.__fragments: dict[int, list[bytes]] = {}
+        self.__auth_request_id: int | None = None
+        self.__encoder = PacketEncoder()
+
+    async def __aenter__(self):
+        await self.connect()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def connect(self):
+        """サーバーに接続し、レスポンスの受信を開始します。"""
+        try:
+            self.__reader, self.__writer = await asyncio.wait_for(
+                asyncio.open_connection(self.__host, int(self.__port)),
+                self.__timeout,
+            )
+        except ConnectionRefusedError:
+            raise ConnectionRefusedError(
+                "サーバーに接続できませんでした。\nサーバが起動していてホスト名とポート番号が正しいか確認してください。"
+            )
+        self.__read_task = asyncio.get_running_loop().create_task(self.__read_loop())
+
+    async def close(self):
+        """接続を閉じます。"""
+        if self.__read_task is not None:
+            self.__read_task.cancel()
+            try:
+                await self.__read_task
+            except asyncio.CancelledError:
+                pass
+            self.__read_task = None
+        if self.__writer is not None:
+            self.__writer.close()
+            try:
+                await self.__writer.wait_closed()
+            except ConnectionError:
+                pass
+            self.__writer = None
+        self.__fail_pending(ConnectionError("接続が閉じられました。"))
+
+    async def auth(self):
+        """RCON認証を行います。"""
+        request_id = self.send_packet(PacketType.SERVERDATA_AUTH, self.__password)
+        self.__auth_request_id = request_id
+        try:
+            packet = await self.__wait_response(request_id)
+        finally:
+            self.__auth_request_id = None
+        if (
+            packet.request_id == request_id
+            and packet.type == PacketType.SERVERDATA_AUTH_RESPONSE
+        ):
+            return True
+
+        raise Exception("RCON認証に失敗しました。\nパスワードが間違っているようです。")
+
+    async def send_command(
+        self, command, multi_packet: bool = False
+    ) -> tuple[str, bool]:
+        """マインクラフトサーバーにコマンドを送信します。
+
+        Args:
+        -----
+            command (str): コマンド
+            multi_packet (bool): レスポンスが複数のパケットに分割される場合(大きなdata getなど)にTrueを指定します。
+        """
+        if not multi_packet:
+            request_id = self.send_packet(PacketType.SERVERDATA_EXECCOMMAND, command)
+            await self.__writer.drain()
+            packet = await self.__wait_response(request_id)
+            return (packet.body.decode("utf-8"), True)
+
+        request_id = self.send_packet(
+            PacketType.SERVERDATA_EXECCOMMAND, command, wait=False
+        )
+        fragments = self.__fragments[request_id] = []
+        try:
+            # サーバーはパケットを順番に処理するため、コマンドの直後に送った
+            # 空のパケットへの応答が届いた時点でレスポンスが全て揃っている
+            sentinel_id = self.send_packet(PacketType.SERVERDATA_RESPONSE_VALUE, "")
+            await self.__writer.drain()
+            await self.__wait_response(sentinel_id)
+        finally:
+            self.__fragments.pop(request_id, None)
+        return (b"".join(fragments).decode("utf-8"), True)
+
+    async def send_commands(
+        self,
+        commands: Iterable[str],
+        window: int | None = None,
+        multi_packet: bool = False,
+    ) -> list[tuple[str, bool]]:
+        """複数のコマンドを同時に送信し、コマンドと同じ順序でレスポンスを返します。"""
+        semaphore = asyncio.Semaphore(window or self.__window)
+
+        async def send(command):
+            async with semaphore:
+                return await self.send_command(command, multi_packet)
+
+        return list(await asyncio.gather(*(send(command) for command in commands)))
+
+    def send_packet(self, type: int, body: str, wait: bool = True) -> int:
+        """パケットを書き込みバッファに追加し、リクエストIDを返します。
+
+        waitがTrueの場合は、レスポンスを待つためのFutureを登録します。
+        """
+        if self.__writer is None:
+            raise ConnectionError("サーバーに接続されていません。")
+
+        # 循環したカウンターが応答待ちのIDと重複する場合は次のIDにする
+        request_id = self.__encoder.next_request_id()
+        while request_id in self.__pending or request_id in self.__fragments:
+            request_id = self.__encoder.next_request_id()
+        if wait:
+            self.__pending[request_id] = asyncio.get_running_loop().create_future()
+
+        self.__encoder.add(type, body, request_id)
+        self.__writer.write(self.__encoder.take())
+        return request_id
+
+    async def __wait_response(self, request_id: int) -> Packet:
+        """リクエストIDに対応するパケットを待ちます。"""
+        future = self.__pending[request_id]
+        try:
+            return await asyncio.wait_for(future, self.__timeout)
+        finally:
+            self.__pending.pop(request_id, None)
+
+    async def receive_packet(self) -> Packet:
+        """パケットを1つ受信し、Packetを返します"""
+        size = self.__i32.unpack(await self.__reader.readexactly(4))[0]
+        if not PacketReader.MIN_PACKET_SIZE <= size <= PacketReader.MAX_PACKET_SIZE:
+            raise ValueError(f"不正なパケットサイズを受信しました。: {size}")
+        payload = await self.__reader.readexactly(size)
+        request_id, type = self.__res_struct.unpack_from(payload)
+        return Packet(size, request_id, type, payload[8:-2])
+
+    async def __read_loop(self):
+        """受信したパケットを対応するFutureに振り分けます。"""
+        try:
+            while True:
+                packet = await self.receive_packet()
+                request_id = packet.request_id
+                # 認証失敗時はリクエストIDが-1で返ってくる
+                if request_id == -1 and self.__auth_request_id is not None:
+                    request_id = self.__auth_request_id
+                fragments = self.__fragments.get(request_id)
+                if fragments is not None:
+                    fragments.append(packet.body)
+                    continue
+                future = self.__pending.get(request_id)
+                if future is not None and not future.done():
+                    future.set_result(packet)
+        except (asyncio.IncompleteReadError, ConnectionError) as e:
+            self.__fail_pending(
+                ConnectionError(f"サーバーとの接続が切断されました。({e})")
+            )
+        except ValueError as e:
+            # 以降のパケットの区切りも分からないため、接続を閉じる
+            self.__writer.close()
+            self.__writer = None
+            self.__fail_pending(ConnectionError(f"不正なパケットを受信しました。({e})"))
+
+    def __fail_pending(self, exc: Exception):
+        for future in self.__pending.values():
+            if not future.done():
+                future.set_exception(exc)
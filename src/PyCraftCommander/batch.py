@@ -0,0 +1,130 @@
+from PyCraftCommander import commands
+from PyCraftCommander.rcon import RCON
+
+# バッチで使用できるcommandsモジュールの関数と、位置引数でのブロックIDの位置
+# (ブロックIDを受け取らない関数はNone)
+_BUILDERS: dict[str, int | None] = {
+    "set_block": 1,
+    "fill": 2,
+    "player_list": None,
+    "player_pos": None,
+    "player_dimension": None,
+    "player_gamemode": None,
+    "player_data": None,
+    "seed": None,
+    "set_world_spawn": None,
+    "set_spawn_point": None,
+    "tp": None,
+    "gamemode": None,
+    "give": None,
+    "clear": None,
+    "difficulty": None,
+    "effect_clear": None,
+    "effect_give": None,
+    "effect_give_infinite": None,
+    "enchant": None,
+    "kill": None,
+    "say": None,
+    "message": None,
+}
+
+_BLOCK_COMMANDS = ("setblock ", "fill ", "clone ")
+
+
+def _succeeded(command: str, response: str) -> bool:
+    """レスポンスの本文からコマンドの成否を判断します。
+
+    setblock/fill/cloneは、ブロックが変更された場合と、keepモード以外で範囲が既に
+    指定したブロックだった場合を成功とします。
+    """
+    if command.startswith(_BLOCK_COMMANDS):
+        return commands.parse_block_changed(response) or (
+            not command.endswith(" keep") and commands.parse_block_unchanged(response)
+        )
+    return not commands.parse_command_failed(response)
+
+
+class Batch:
+    """コマンドを溜めておき、まとめて送信するためのクラス
+
+    PyCraftCommander.batch()から利用します。set_block, fill, giveなど、
+    commandsモジュールにあるコマンドと同じ名前のメソッドでコマンドを追加でき、
+    withブロックを抜けるときに1回の書き込みでまとめて送信されます。
+    結果の成否はレスポンスの本文から判断します。(ブロックが変更されなかったsetblockや
+    対象が見つからなかったコマンドなどはFalseです)
+
+    Example:
+    --------
+    ```python
+    with server.batch() as b:
+        b.set_block(pos, MCID.DIAMOND_BLOCK)
+        b.fill(pos1, pos2, MCID.STONE)
+
+    for response, status in b.results:
+        print(response, status)
+    ```
+    """
+
+    def __init__(self, server: RCON, window: int = 1024, multi_packet: bool = False):
+        self.__server = server
+        # 1回の書き込みで送信するコマンド数の上限
+        # (レスポンスを読まずに送り続けるとサーバー側の送信が詰まるため)
+        self.__window = window
+        self.__multi_packet = multi_packet
+        self.commands: list[str] = []
+        self.results: list[tuple[str, bool]] = []
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.flush()
+
+    def __len__(self) -> int:
+        return len(self.commands)
+
+    def __getattr__(self, name: str):
+        if name not in _BUILDERS:
+            raise AttributeError(f"'Batch' object has no attribute '{name}'")
+        builder = getattr(commands, name)
+        validator = getattr(self.__server, "block_id_validator", None)
+        position = _BUILDERS[name]
+
+        def add(*args, **kwargs) -> int:
+            if validator is not None and position is not None:
+                if len(args) > position:
+                    block_id = args[position]
+                elif "block_id" in kwargs:
+                    block_id = kwargs["block_id"]
+                else:
+                    raise TypeError(f"{name}() missing required argument: 'block_id'")
+                validator.validate(block_id)
+            return self.add(builder(*args, **kwargs))
+
+        return add
+
+    def add(self, command: str) -> int:
+        """コマンドを追加し、結果のインデックスを返します。"""
+        self.commands.append(command)
+        return len(self.results) + len(self.commands) - 1
+
+    def flush(self) -> list[tuple[str, bool]]:
+        """溜めたコマンドを送信し、これまでの全てのレスポンスを順番に返します。
+
+        Returns:
+        -------
+            list[tuple[str, bool]]: 追加した順のレスポンスと成否
+        """
+        pending, self.commands = self.commands, []
+        if pending:
+            responses = self.__server.send_commands(
+                pending,
+                window=min(len(pending), self.__window),
+                multi_packet=self.__multi_packet,
+            )
+            self.results += [
+                (response, status and _succeeded(command, response))
+                for command, (response, status) in zip(pending, responses)
+            ]
+        return self.results
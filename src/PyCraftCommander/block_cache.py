@@ -0,0 +1,223 @@
+import math
+import time
+from collections import OrderedDict
+from PyCraftCommander import commands
+from PyCraftCommander.types.player import Pos
+
+# RCONから実行したコマンドはオーバーワールドで実行される
+DEFAULT_DIMENSION = "minecraft:overworld"
+# invalidateで範囲内のブロックを探すための索引の単位(チャンクと同じ16x16の柱)
+_CHUNK_BITS = 4
+# ブロックを変更する可能性があるコマンド
+# (setblock/fill以外は変更される範囲が分からないため、キャッシュを全て無効にする)
+BLOCK_COMMANDS = ("setblock ", "fill ", "clone ", "place ", "execute ", "function ")
+# 設置したブロックで範囲が置き換わるモード
+_REPLACING_MODES = ("replace", "destroy")
+_MODES = ("replace", "keep", "destroy", "hollow", "outline")
+
+
+def _block_target(command: str) -> tuple[Pos, Pos, str | None, str] | None:
+    """絶対座標のsetblock/fillコマンドから(座標1, 座標2, ブロックID, モード)を返します。
+
+    相対座標(~, ^)などで範囲が分からない場合はNoneを返します。
+    ブロックIDが分からない場合(fill ... replace <フィルター>など)はブロックIDをNoneにします。
+    """
+    verb, _, arguments = command.partition(" ")
+    count = 3 if verb == "setblock" else 6 if verb == "fill" else 0
+    parts = arguments.split(" ", count)
+    if not count or len(parts) <= count:
+        return None
+    try:
+        coordinates = [math.floor(float(value)) for value in parts[:count]]
+    except (ValueError, OverflowError):
+        return None
+    pos1 = Pos(*coordinates[:3])
+    pos2 = Pos(*coordinates[3:]) if count == 6 else pos1
+    block_id, _, mode = parts[count].rpartition(" ")
+    if mode not in _MODES:
+        block_id, mode = parts[count], "replace"
+        if " " in block_id:
+            # フィルター付きのreplaceや、空白を含むNBTは解釈しない
+            block_id = None
+    return pos1, pos2, block_id, mode
+
+
+class BlockCache:
+    """設置したブロックを記憶し、同じブロックの再設置を省略するためのキャッシュ
+
+    (ディメンション, x, y, z)をキーにブロックIDを記憶します。maxsizeを超えると
+    最も長く使われていないブロックから削除され(LRU)、ttlを指定した場合は
+    ttl秒より前に記憶したブロックは無効になります。
+
+    PyCraftCommanderにblock_cacheとして渡すと、その接続で送信した全てのコマンド
+    (set_block, fill, batch, send_command, send_commandsなど)をforget/recordで反映します。
+    絶対座標のsetblock/fillは成功した場合だけ設置したブロックを記憶し、
+    clone, place, executeなど範囲が分からないコマンドはキャッシュを全て無効にします。
+    プレイヤーや他の接続、scheduleなどで後から変更されたブロックは追跡できないため、
+    必要に応じてinvalidateを呼び出してください。
+    記憶したブロックはチャンクごとに索引を持つため、invalidateにかかる時間は
+    キャッシュ全体ではなく範囲内のチャンクに記憶しているブロック数に比例します。
+
+    Example:
+    --------
+    ```python
+    server = PyCraftCommander(host, port, password, block_cache=BlockCache(ttl=60))
+    ```
+    """
+
+    def __init__(self, maxsize: int = 1_000_000, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # キー -> (ブロックID, 記憶した時刻)
+        self.__blocks: OrderedDict[tuple[str, int, int, int], tuple[str, float]] = (
+            OrderedDict()
+        )
+        # (ディメンション, チャンクx, チャンクz) -> そのチャンクに記憶しているキー
+        self.__chunks: dict[tuple[str, int, int], set[tuple[str, int, int, int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.__blocks)
+
+    @staticmethod
+    def key(pos: Pos, dimension: str = DEFAULT_DIMENSION) -> tuple[str, int, int, int]:
+        """座標からキャッシュのキーを作成します。"""
+        return (dimension, math.floor(pos.x), math.floor(pos.y), math.floor(pos.z))
+
+    def get(self, pos: Pos, dimension: str = DEFAULT_DIMENSION) -> str | None:
+        """記憶しているブロックIDを返します。記憶していない場合はNoneを返します。"""
+        key = self.key(pos, dimension)
+        entry = self.__blocks.get(key)
+        if entry is None:
+            return None
+        block_id, stored_at = entry
+        if self.ttl is not None and time.monotonic() - stored_at > self.ttl:
+            self.__delete(key)
+            return None
+        self.__blocks.move_to_end(key)
+        return block_id
+
+    def set(self, pos: Pos, block_id: str, dimension: str = DEFAULT_DIMENSION):
+        """ブロックIDを記憶します。"""
+        key = self.key(pos, dimension)
+        if key not in self.__blocks:
+            self.__chunks.setdefault(self.__chunk(key), set()).add(key)
+        self.__blocks[key] = (block_id, time.monotonic())
+        self.__blocks.move_to_end(key)
+        while len(self.__blocks) > self.maxsize:
+            self.__delete(next(iter(self.__blocks)))
+
+    @staticmethod
+    def __chunk(key: tuple[str, int, int, int]) -> tuple[str, int, int]:
+        dimension, x, y, z = key
+        return (dimension, x >> _CHUNK_BITS, z >> _CHUNK_BITS)
+
+    def __delete(self, key: tuple[str, int, int, int]):
+        del self.__blocks[key]
+        chunk = self.__chunk(key)
+        keys = self.__chunks[chunk]
+        keys.discard(key)
+        if not keys:
+            del self.__chunks[chunk]
+
+    def fill(
+        self, pos1: Pos, pos2: Pos, block_id: str, dimension: str = DEFAULT_DIMENSION
+    ):
+        """範囲内のブロックIDを記憶します。
+
+        範囲がmaxsizeより大きい場合は記憶せず、範囲内のキャッシュを無効にします。
+        """
+        (_, x1, y1, z1), (_, x2, y2, z2) = self.key(pos1), self.key(pos2)
+        x1, x2 = sorted((x1, x2))
+        y1, y2 = sorted((y1, y2))
+        z1, z2 = sorted((z1, z2))
+        if (x2 - x1 + 1) * (y2 - y1 + 1) * (z2 - z1 + 1) > self.maxsize:
+            self.invalidate(pos1, pos2, dimension)
+            return
+        for x in range(x1, x2 + 1):
+            for y in range(y1, y2 + 1):
+                for z in range(z1, z2 + 1):
+                    self.set(Pos(x, y, z), block_id, dimension)
+
+    def invalidate(
+        self,
+        pos1: Pos | None = None,
+        pos2: Pos | None = None,
+        dimension: str | None = None,
+    ):
+        """キャッシュを無効にします。
+
+        Args:
+        -----
+            pos1 (Pos | None): 範囲の座標1。Noneの場合は全ての座標
+            pos2 (Pos | None): 範囲の座標2。Noneの場合はpos1のみ
+            dimension (str | None): 対象のディメンション。Noneの場合は全てのディメンション
+        """
+        if pos1 is None:
+            if dimension is None:
+                self.__blocks.clear()
+                self.__chunks.clear()
+                return
+            for chunk in [c for c in self.__chunks if c[0] == dimension]:
+                for key in list(self.__chunks[chunk]):
+                    self.__delete(key)
+            return
+
+        (_, x1, y1, z1), (_, x2, y2, z2) = self.key(pos1), self.key(pos2 or pos1)
+        x1, x2 = sorted((x1, x2))
+        y1, y2 = sorted((y1, y2))
+        z1, z2 = sorted((z1, z2))
+        cx1, cx2 = x1 >> _CHUNK_BITS, x2 >> _CHUNK_BITS
+        cz1, cz2 = z1 >> _CHUNK_BITS, z2 >> _CHUNK_BITS
+        if (cx2 - cx1 + 1) * (cz2 - cz1 + 1) <= len(self.__chunks):
+            # 範囲内のチャンクだけを調べる
+            dimensions = (
+                {c[0] for c in self.__chunks} if dimension is None else (dimension,)
+            )
+            chunks = [
+                (d, cx, cz)
+                for d in dimensions
+                for cx in range(cx1, cx2 + 1)
+                for cz in range(cz1, cz2 + 1)
+                if (d, cx, cz) in self.__chunks
+            ]
+        else:
+            # 範囲が記憶しているチャンク数より広い場合は、記憶しているチャンクを調べる
+            chunks = [
+                c
+                for c in self.__chunks
+                if (dimension is None or c[0] == dimension)
+                and cx1 <= c[1] <= cx2
+                and cz1 <= c[2] <= cz2
+            ]
+        for chunk in chunks:
+            for key in list(self.__chunks[chunk]):
+                _, x, y, z = key
+                if x1 <= x <= x2 and y1 <= y <= y2 and z1 <= z <= z2:
+                    self.__delete(key)
+
+    def forget(self, command: str):
+        """コマンドで変更される可能性があるブロックを無効にします。送信前に呼び出します。"""
+        if not command.startswith(BLOCK_COMMANDS):
+            return
+        target = _block_target(command)
+        if target is None:
+            self.invalidate()
+        else:
+            self.invalidate(target[0], target[1])
+
+    def record(self, command: str, response: str):
+        """setblock/fillで変更されたブロックを記憶します。レスポンスの受信後に呼び出します。
+
+        keepモードや失敗した場合(既に同じブロック、不明なIDなど)は実際のブロックが
+        分からないため記憶しません。
+        """
+        if not command.startswith(("setblock ", "fill ")):
+            return
+        if not commands.parse_block_changed(response):
+            return
+        target = _block_target(command)
+        if target is None:
+            return
+        pos1, pos2, block_id, mode = target
+        if block_id is not None and mode in _REPLACING_MODES:
+            self.fill(pos1, pos2, block_id)
@@ -0,0 +1,203 @@
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from typing import Any, Callable
+from PyCraftCommander.py_craft_commander import PyCraftCommander
+
+
+@dataclass
+class ClusterResult:
+    """1つのサーバーでの実行結果"""
+
+    # 関数の戻り値(失敗した場合はNone)
+    value: Any = None
+    # 失敗した場合の例外。時間内に終わらなかった場合はTimeoutError
+    error: BaseException | None = None
+    # 実行にかかった時間(秒)
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+class Cluster:
+    """複数のサーバーに同じコマンドを並列に送信するクラス
+
+    サーバーごとに認証済みのPyCraftCommanderを持ち、サーバーごとのスレッドで
+    同時に実行して結果をまとめて返します。全体の所要時間は全サーバーの合計ではなく、
+    最も遅いサーバーの時間になります。
+
+    失敗したサーバーの接続は、レスポンスの対応がずれている可能性があるため閉じ、
+    次回の実行時に接続と認証をやり直します。時間内に終わらなかったサーバーは結果を
+    TimeoutErrorにし、処理が終わるまで(ソケットのタイムアウトまで)次の実行を行いません。
+
+    PyCraftCommanderと同じ名前のメソッド(say, give, effect_giveなど)を呼び出すと、
+    全てのサーバーで実行されます。
+
+    Example:
+    --------
+    ```python
+    servers = {
+        "lobby": ("10.0.0.1", 25575, "password"),
+        "survival": ("10.0.0.2", 25575, "password"),
+    }
+    with Cluster(servers, timeout=2.0) as cluster:
+        results = cluster.say("イベントを開始します")
+        for name, result in results.items():
+            if not result.ok:
+                print(f"{name}: {result.error}")
+    ```
+    """
+
+    def __init__(
+        self,
+        servers: dict[str, tuple[str, int, str]],
+        timeout: float = 5.0,
+        connect: bool = True,
+        **options,
+    ):
+        """
+        Args:
+        -----
+            servers (dict[str, tuple[str, int, str]]): サーバー名 -> (ホスト, ポート番号, パスワード)
+            timeout (float): サーバーごとの接続・実行を待つ時間の上限(秒)
+            connect (bool): Trueの場合、初期化時に全てのサーバーに接続して認証します。
+                接続に失敗したサーバーは次回の実行時に再接続します。
+            **options: PyCraftCommanderに渡す引数(window, block_id_validatorなど)
+        """
+        self.servers = dict(servers)
+        self.timeout = timeout
+        self.__options = options
+        self.__connections: dict[str, PyCraftCommander | None] = dict.fromkeys(
+            self.servers
+        )
+        # サーバー名 -> 実行中の処理。1つの接続を複数のスレッドで使わないようにする
+        self.__running: dict[str, Future] = {}
+        self.__executor = ThreadPoolExecutor(
+            max_workers=max(1, len(self.servers)), thread_name_prefix="cluster"
+        )
+        if connect:
+            self.connect_errors = {
+                name: result.error
+                for name, result in self.call(lambda server: None).items()
+                if not result.ok
+            }
+        else:
+            self.connect_errors = {}
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getattr__(self, name: str):
+        if name.startswith("_") or not callable(getattr(PyCraftCommander, name, None)):
+            raise AttributeError(f"'Cluster' object has no attribute '{name}'")
+
+        def broadcast(*args, **kwargs) -> dict[str, ClusterResult]:
+            return self.call(lambda server: getattr(server, name)(*args, **kwargs))
+
+        return broadcast
+
+    def close(self):
+        """全ての接続を閉じます。
+
+        時間内に終わらなかった処理が接続を使っている場合は、処理が終わったときに閉じます。
+        """
+        self.__executor.shutdown(wait=False, cancel_futures=True)
+        for name in self.servers:
+            running = self.__running.get(name)
+            if running is None:
+                self.__disconnect(name)
+            else:
+                # 終わっている場合はすぐに呼ばれる
+                running.add_done_callback(lambda _, name=name: self.__disconnect(name))
+
+    def connected(self) -> list[str]:
+        """接続済みのサーバー名を返します。"""
+        return [name for name, server in self.__connections.items() if server]
+
+    def call(
+        self,
+        function: Callable[[PyCraftCommander], Any],
+        servers: list[str] | None = None,
+        timeout: float | None = None,
+    ) -> dict[str, ClusterResult]:
+        """全てのサーバーで関数を並列に実行します。
+
+        Args:
+        -----
+            function (Callable[[PyCraftCommander], Any]): 接続済みのサーバーを受け取る関数
+            servers (list[str] | None): 実行するサーバー名。Noneの場合は全てのサーバー
+            timeout (float | None): 待つ時間の上限(秒)。Noneの場合は初期化時の値
+
+        Returns:
+        -------
+            dict[str, ClusterResult]: サーバー名 -> 実行結果
+        """
+        timeout = self.timeout if timeout is None else timeout
+        names = list(self.servers) if servers is None else servers
+        results: dict[str, ClusterResult] = {}
+        futures: dict[Future, str] = {}
+        started = time.perf_counter()
+        for name in names:
+            if name not in self.servers:
+                results[name] = ClusterResult(error=KeyError(name))
+                continue
+            running = self.__running.get(name)
+            if running is not None and not running.done():
+                results[name] = ClusterResult(
+                    error=TimeoutError(f"{name}では前回の処理が終わっていません。")
+                )
+                continue
+            future = self.__executor.submit(self.__run, name, function)
+            self.__running[name] = future
+            futures[future] = name
+
+        done, not_done = wait(futures, timeout=timeout)
+        for future in done:
+            value, error, elapsed = future.result()
+            results[futures[future]] = ClusterResult(value, error, elapsed)
+        for future in not_done:
+            results[futures[future]] = ClusterResult(
+                error=TimeoutError(f"{futures[future]}が時間内に応答しませんでした。"),
+                elapsed=time.perf_counter() - started,
+            )
+        return {name: results[name] for name in names}
+
+    def send_command(self, command: str, **kwargs) -> dict[str, ClusterResult]:
+        """全てのサーバーにコマンドを送信します。値は(レスポンス, 成否)です。"""
+        return self.call(lambda server: server.send_command(command), **kwargs)
+
+    def send_commands(self, commands: list[str], **kwargs) -> dict[str, ClusterResult]:
+        """全てのサーバーに複数のコマンドをパイプラインで送信します。"""
+        return self.call(lambda server: server.send_commands(commands), **kwargs)
+
+    def __run(self, name: str, function: Callable[[PyCraftCommander], Any]):
+        started = time.perf_counter()
+        try:
+            server = self.__connections[name]
+            if server is None:
+                host, port, password = self.servers[name]
+                server = PyCraftCommander(
+                    host, port, password, timeout=self.timeout, **self.__options
+                )
+                try:
+                    server.auth()
+                except BaseException:
+                    server.__exit__(None, None, None)
+                    raise
+                self.__connections[name] = server
+            value = function(server)
+        except Exception as e:
+            self.__disconnect(name)
+            return None, e, time.perf_counter() - started
+        return value, None, time.perf_counter() - started
+
+    def __disconnect(self, name: str):
+        server = self.__connections.get(name)
+        self.__connections[name] = None
+        if server is not None:
+            server.__exit__(None, None, None)
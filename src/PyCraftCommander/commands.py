@@ -0,0 +1,243 @@
+"""マインクラフトコマンドの文字列を組み立てる関数群
+
+PyCraftCommanderとAsyncPyCraftCommanderの両方から利用されます。
+"""
+
+from PyCraftCommander.types import snbt
+from PyCraftCommander.types.player import Player, Pos, GameMode
+from typing import Literal
+
+
+def _target(target: str | Player) -> str:
+    if isinstance(target, Player):
+        return target.name
+    return target
+
+
+def player_list() -> str:
+    """プレイヤーリストを取得するコマンドを返します。"""
+    return "list"
+
+
+def parse_player_list(response: str) -> list[str]:
+    """listコマンドのレスポンスからプレイヤーリストを取り出します。"""
+    return sorted(response.split(": ")[1].split(", "))
+
+
+def player_pos(player_name: str) -> str:
+    """プレイヤーの座標を取得するコマンドを返します。"""
+    return f"data get entity {player_name} Pos"
+
+
+def parse_player_pos(response: str) -> Pos:
+    """data get entity ... Posのレスポンスから座標を取り出します。"""
+    pos = response.split(": ")[-1]
+    pos = pos.translate(str.maketrans("", "", "[]")).split(", ")
+    return Pos(float(pos[0][:-1]), float(pos[1][:-1]), float(pos[2][:-1]))
+
+
+def player_dimension(player_name: str) -> str:
+    """プレイヤーのディメンションを取得するコマンドを返します。"""
+    return f"data get entity {player_name} Dimension"
+
+
+def parse_player_dimension(response: str) -> str:
+    """player_dimensionのレスポンスからディメンション(minecraft:overworldなど)を取り出します。"""
+    return snbt.parse_data_get(response)
+
+
+def player_gamemode(player_name: str) -> str:
+    """プレイヤーのゲームモードを取得するコマンドを返します。"""
+    return f"data get entity {player_name} playerGameType"
+
+
+def parse_player_gamemode(response: str) -> GameMode:
+    """player_gamemodeのレスポンスからゲームモードを取り出します。"""
+    return GameMode(snbt.parse_data_get(response))
+
+
+def parse_last_word(response: str) -> str:
+    """レスポンスの最後の単語を取り出します。"""
+    return response.split(" ")[-1]
+
+
+def player_data(player_name: str) -> str:
+    """プレイヤーのエンティティデータ全体を取得するコマンドを返します。"""
+    return f"data get entity {player_name}"
+
+
+def parse_player_data(player_name: str, response: str) -> Player:
+    """data get entityのレスポンスからプレイヤー情報を取り出します。"""
+    data = snbt.parse_data_get(response)
+    x, y, z = data["Pos"]
+    return Player(
+        player_name,
+        Pos(x, y, z),
+        Pos(int(x), int(y), int(z)),
+        data["Dimension"],
+        GameMode(data["playerGameType"]),
+    )
+
+
+def seed() -> str:
+    """シードを取得するコマンドを返します。"""
+    return "seed"
+
+
+def parse_seed(response: str) -> int:
+    """seedコマンドのレスポンスからシードを取り出します。"""
+    return int(response.split(": ")[1][1:-1])
+
+
+def set_world_spawn(pos: Player | Pos | str, angle: float = 0.0) -> str:
+    """ワールドのスポーン地点を設定するコマンドを返します。"""
+    if isinstance(pos, Player):
+        pos = pos.int_pos
+    return f"setworldspawn {pos} {angle}"
+
+
+def set_spawn_point(pos: Player | Pos | str, angle: float = 0.0) -> str:
+    """スポーン地点を設定するコマンドを返します。"""
+    if isinstance(pos, Player):
+        pos = pos.int_pos
+    return f"spawnpoint {pos} {angle}"
+
+
+def tp(from_: str | Player, to: str | Player) -> str:
+    """プレイヤーをテレポートするコマンドを返します。"""
+    return f"tp {_target(from_)} {_target(to)}"
+
+
+def set_block(
+    pos: Player | Pos | str,
+    block_id: str,
+    mode: Literal["replace", "keep", "destroy"] = "replace",
+) -> str:
+    """ブロックを設置するコマンドを返します。"""
+    if isinstance(pos, Player):
+        pos = pos.int_pos
+    return f"setblock {pos} {block_id} {mode}"
+
+
+def parse_block_changed(response: str) -> bool:
+    """setblock/fill/cloneのレスポンスからブロックが変更されたかを返します。
+
+    RCONではサーバーがエラーを返した場合もレスポンスが届くため、成否はレスポンスの
+    本文で判断します。"Could not set the block"・"No blocks were filled"・
+    "Too many blocks in the specified area ..."や不明なブロックIDなどの場合はFalseです。
+    """
+    return response.startswith(
+        ("Changed the block", "Successfully filled", "Successfully cloned")
+    )
+
+
+def parse_block_unchanged(response: str) -> bool:
+    """setblock/fill/cloneが変更するブロックがなく何もしなかったかを返します。
+
+    replace/destroyモードの場合は、範囲が既に指定したブロックだったことを表します。
+    """
+    return response.startswith(
+        ("Could not set the block", "No blocks were filled", "No blocks were cloned")
+    )
+
+
+def parse_command_failed(response: str) -> bool:
+    """レスポンスがコマンドのエラー(構文の誤りや対象が見つからないなど)かを返します。
+
+    RCONではエラーもレスポンスとして届くため、よく使われるエラーの本文で判断します。
+    setblock/fill/cloneの成否はparse_block_changedで判断してください。
+    """
+    return response.startswith(
+        (
+            "Unknown or incomplete command",
+            "Incorrect argument for command",
+            "Unknown block type",
+            "Unknown item",
+            "No player was found",
+            "No entity was found",
+            "Found no elements matching",
+        )
+    )
+
+
+def fill(
+    pos1: Player | Pos | str,
+    pos2: Player | Pos | str,
+    block_id: str,
+    mode: Literal["replace", "keep", "destroy", "hollow", "outline"] = "replace",
+) -> str:
+    """範囲内にブロックを設置するコマンドを返します。"""
+    if isinstance(pos1, Player):
+        pos1 = pos1.pos
+    if isinstance(pos2, Player):
+        pos2 = pos2.pos
+    return f"fill {pos1} {pos2} {block_id} {mode}"
+
+
+def gamemode(
+    mode: GameMode | Literal["survival", "creative", "adventure", "spectator"] | int,
+    target: str | Player,
+) -> str:
+    """ゲームモードを変更するコマンドを返します。"""
+    return f"gamemode {mode} {_target(target)}"
+
+
+def give(target: str | Player, item: str, count: int = 1) -> str:
+    """アイテムを付与するコマンドを返します。"""
+    return f"give {_target(target)} {item} {count}"
+
+
+def clear(target: str | Player, item: str = "") -> str:
+    """アイテムをクリアするコマンドを返します。"""
+    return f"clear {_target(target)} {item}"
+
+
+def difficulty(difficulty: Literal["peaceful", "easy", "normal", "hard"] | int) -> str:
+    """難易度を変更するコマンドを返します。"""
+    return f"difficulty {difficulty}"
+
+
+def effect_clear(target: str | Player, effect: str) -> str:
+    """エフェクトをクリアするコマンドを返します。"""
+    return f"effect clear {_target(target)} {effect}"
+
+
+def effect_give(
+    target: str | Player,
+    effect: str,
+    seconds: int,
+    level: int = 0,
+    hideParticles: bool = False,
+) -> str:
+    """エフェクトを付与するコマンドを返します。"""
+    return f"effect give {_target(target)} {effect} {seconds} {level} {hideParticles}"
+
+
+def effect_give_infinite(
+    target: str | Player,
+    effect: str,
+    level: int = 0,
+    hideParticles: bool = False,
+) -> str:
+    """エフェクトを無限に付与するコマンドを返します。"""
+    return f"effect give {_target(target)} {effect} infinite {level} {hideParticles}"
+
+
+def enchant(target: str | Player, enchantment: str, level: int = 1) -> str:
+    """エンチャントを付与するコマンドを返します。"""
+    return f"enchant {_target(target)} {enchantment} {level}"
+
+
+def kill(target: str | Player) -> str:
+    """対象を殺すコマンドを返します。"""
+    return f"kill {_target(target)}"
+
+
+def say(message: str) -> str:
+    """チャットにメッセージを送信するコマンドを返します。"""
+    return f"say {message}"
+
+
+def message(target: str | Player, message: str) -> str:
+    """プレイヤーにメッセージを送信するコマンドを返します。"""
+    return f"msg {_target(target)} {message}"
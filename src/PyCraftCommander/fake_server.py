@@ -0,0 +1,369 @@
+"""テストやベンチマーク用の、RCONプロトコルを話すローカルのサーバー
+
+本物のMinecraftサーバーの代わりに、同じプロセス内で起動できます。
+認証、複数パケットに分割されたレスポンス、コマンドごとの遅延を再現し、
+setblock/fill/cloneをメモリ上のワールドに反映します。
+"""
+
+import random
+import re
+import socket
+import socketserver
+import threading
+import time
+from typing import Callable
+from PyCraftCommander.protocol import PacketEncoder, PacketReader
+from PyCraftCommander.types.packet import PacketType
+from PyCraftCommander.types.player import GameMode, Player, Pos
+
+# バニラのサーバーと同じく、レスポンスは4096文字ごとに分割して送信する
+MAX_RESPONSE_LENGTH = 4096
+# fillやcloneで一度に変更できるブロック数の上限
+MAX_FILL_VOLUME = 32768
+
+_INT = re.compile(r"-?\d+")
+# ワールドに影響しないコマンド。空のレスポンスを返す
+_ACKNOWLEDGED_COMMANDS = {
+    "say",
+    "msg",
+    "tell",
+    "give",
+    "clear",
+    "kill",
+    "effect",
+    "enchant",
+    "difficulty",
+    "gamemode",
+    "tp",
+    "setworldspawn",
+    "spawnpoint",
+}
+
+
+class _CommandError(Exception):
+    """コマンドのエラーメッセージをレスポンスとして返すための例外"""
+
+
+class FakeRCONServer:
+    """RCONプロトコルを話すローカルのサーバー
+
+    Attributes:
+    ----------
+    world: 座標(x, y, z) -> ブロックIDの辞書(空気のブロックは含みません)
+    players: プレイヤー名 -> Playerの辞書
+    commands: 受信したコマンドのリスト(record_commands=Trueの場合)
+    command_count: 受信したコマンドの数
+
+    Example:
+    --------
+    ```python
+    with FakeRCONServer(password="admin", latency=0.001) as fake:
+        fake.add_player("Steve", Pos(0.5, 64.0, 0.5))
+        with PyCraftCommander(*fake.address, "admin") as server:
+            server.auth()
+            server.fill(Pos(0, 0, 0), Pos(9, 9, 9), "minecraft:stone")
+        assert fake.world[(5, 5, 5)] == "minecraft:stone"
+    ```
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        password: str = "admin",
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        seed: int = 0,
+        record_commands: bool = False,
+    ):
+        """
+        Args:
+        -----
+            host (str): 待ち受けるホスト
+            port (int): 待ち受けるポート番号。0の場合は空いているポートを使用します。
+            password (str): RCONのパスワード
+            latency (float): コマンド1つあたりの処理時間(秒)
+            jitter (float): 処理時間に加えるランダムなばらつきの最大値(秒)
+            seed (int): seedコマンドで返すワールドのシード
+            record_commands (bool): 受信したコマンドをcommandsに記録するか
+        """
+        self.password = password
+        self.latency = latency
+        self.jitter = jitter
+        self.seed = seed
+        self.record_commands = record_commands
+        self.max_players = 20
+        # 1tickあたりの処理時間(ミリ秒)。tick queryで返す
+        self.mspt = 5.0
+
+        self.world: dict[tuple[int, int, int], str] = {}
+        self.players: dict[str, Player] = {}
+        self.commands: list[str] = []
+        self.command_count = 0
+        # コマンドごとの追加の処理 (コマンドの最初の単語 -> 関数(引数のリスト) -> レスポンス)
+        self.handlers: dict[str, Callable[[list[str]], str]] = {}
+
+        # バニラのサーバーと同様にコマンドは1つずつ順番に処理する
+        self.__lock = threading.Lock()
+        self.__server = socketserver.ThreadingTCPServer(
+            (host, port), self.__handler_class(), bind_and_activate=False
+        )
+        self.__server.daemon_threads = True
+        self.__server.allow_reuse_address = True
+        self.__thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """待ち受けている(ホスト, ポート番号)"""
+        return self.__server.server_address[:2]
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """バックグラウンドのスレッドで待ち受けを開始します。"""
+        self.__server.server_bind()
+        self.__server.server_activate()
+        self.__thread = threading.Thread(
+            target=self.__server.serve_forever, daemon=True
+        )
+        self.__thread.start()
+
+    def stop(self):
+        """待ち受けを停止します。"""
+        self.__server.shutdown()
+        self.__server.server_close()
+        if self.__thread is not None:
+            self.__thread.join()
+            self.__thread = None
+
+    def add_player(
+        self,
+        name: str,
+        pos: Pos | None = None,
+        dimension: str = "minecraft:overworld",
+        gamemode: GameMode = GameMode.SURVIVAL,
+    ) -> Player:
+        """プレイヤーをログインさせます。"""
+        if pos is None:
+            pos = Pos(0.5, 64.0, 0.5)
+        player = Player(
+            name, pos, Pos(int(pos.x), int(pos.y), int(pos.z)), dimension, gamemode
+        )
+        self.players[name] = player
+        return player
+
+    def remove_player(self, name: str):
+        """プレイヤーをログアウトさせます。"""
+        self.players.pop(name, None)
+
+    def __handler_class(self):
+        fake = self
+
+        class Handler(socketserver.BaseRequestHandler):
+            def handle(self):
+                fake._serve_connection(self.request)
+
+        return Handler
+
+    def _serve_connection(self, sock: socket.socket):
+        """1つの接続でパケットを受信し、レスポンスを返します。"""
+        # レスポンスを小さなパケットで返すため、Nagleアルゴリズムによる遅延を避ける
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        reader = PacketReader(sock)
+        encoder = PacketEncoder()
+        authenticated = False
+        try:
+            while True:
+                packet = reader.read_packet()
+                body = packet.body.decode("utf-8")
+                if packet.type == PacketType.SERVERDATA_AUTH:
+                    authenticated = body == self.password
+                    encoder.add(
+                        PacketType.SERVERDATA_AUTH_RESPONSE,
+                        "",
+                        packet.request_id if authenticated else -1,
+                    )
+                elif not authenticated:
+                    encoder.add(PacketType.SERVERDATA_AUTH_RESPONSE, "", -1)
+                elif packet.type == PacketType.SERVERDATA_EXECCOMMAND:
+                    response = self.execute(body)
+                    for start in range(0, max(len(response), 1), MAX_RESPONSE_LENGTH):
+                        encoder.add(
+                            PacketType.SERVERDATA_RESPONSE_VALUE,
+                            response[start : start + MAX_RESPONSE_LENGTH],
+                            packet.request_id,
+                        )
+                else:
+                    # バニラのサーバーは不明なタイプのパケットにこのメッセージを返す
+                    encoder.add(
+                        PacketType.SERVERDATA_RESPONSE_VALUE,
+                        f"Unknown request {packet.type:x}",
+                        packet.request_id,
+                    )
+                encoder.flush(sock)
+        except (ConnectionError, OSError, ValueError):
+            pass
+
+    def execute(self, command: str) -> str:
+        """コマンドを実行し、レスポンスを返します。"""
+        with self.__lock:
+            if self.latency or self.jitter:
+                time.sleep(self.latency + random.uniform(0.0, self.jitter))
+            self.command_count += 1
+            if self.record_commands:
+                self.commands.append(command)
+
+            name, *args = command.split(" ")
+            handler = self.handlers.get(name) or getattr(self, f"_command_{name}", None)
+            if handler is None:
+                if name in _ACKNOWLEDGED_COMMANDS:
+                    return ""
+                return "Unknown or incomplete command, see below for error"
+            try:
+                return handler(args)
+            except _CommandError as e:
+                return str(e)
+            except IndexError:
+                # 引数が足りない
+                return "Unknown or incomplete command, see below for error"
+
+    # ---------------------------------------------------------------------
+    # コマンド
+    # ---------------------------------------------------------------------
+
+    @staticmethod
+    def _block_id(block_id: str) -> str:
+        if ":" not in block_id.split("[")[0]:
+            return f"minecraft:{block_id}"
+        return block_id
+
+    @staticmethod
+    def _coords(args: list[str]) -> tuple[int, ...]:
+        if not all(_INT.fullmatch(arg) for arg in args):
+            # 相対座標(~)やローカル座標(^)は扱わない
+            raise _CommandError(f"Unsupported coordinates: {' '.join(args)}")
+        return tuple(int(arg) for arg in args)
+
+    @staticmethod
+    def _region(pos1, pos2) -> tuple[range, range, range]:
+        return tuple(range(min(a, b), max(a, b) + 1) for a, b in zip(pos1, pos2))
+
+    def _set(self, pos: tuple[int, int, int], block_id: str) -> bool:
+        """ブロックを設置し、変化があった場合はTrueを返します。"""
+        if block_id == "minecraft:air":
+            return self.world.pop(pos, None) is not None
+        if self.world.get(pos) == block_id:
+            return False
+        self.world[pos] = block_id
+        return True
+
+    def _command_setblock(self, args: list[str]) -> str:
+        pos = self._coords(args[:3])
+        block_id = self._block_id(args[3])
+        mode = args[4] if len(args) > 4 else "replace"
+        if mode == "keep" and pos in self.world:
+            return "Could not set the block"
+        if not self._set(pos, block_id):
+            return "Could not set the block"
+        return f"Changed the block at {pos[0]}, {pos[1]}, {pos[2]}"
+
+    def _command_fill(self, args: list[str]) -> str:
+        pos1, pos2 = self._coords(args[:3]), self._coords(args[3:6])
+        block_id = self._block_id(args[6])
+        mode = args[7] if len(args) > 7 else "replace"
+        xs, ys, zs = self._region(pos1, pos2)
+        volume = len(xs) * len(ys) * len(zs)
+        if volume > MAX_FILL_VOLUME:
+            raise _CommandError(
+                f"Too many blocks in the specified area (maximum {MAX_FILL_VOLUME}, specified {volume})"
+            )
+
+        changed = 0
+        for x in xs:
+            for y in ys:
+                for z in zs:
+                    edge = (
+                        x in (xs[0], xs[-1])
+                        or y in (ys[0], ys[-1])
+                        or z in (zs[0], zs[-1])
+                    )
+                    if mode == "keep" and (x, y, z) in self.world:
+                        continue
+                    if mode == "outline" and not edge:
+                        continue
+                    target = block_id
+                    if mode == "hollow" and not edge:
+                        target = "minecraft:air"
+                    changed += self._set((x, y, z), target)
+        if changed == 0:
+            return "No blocks were filled"
+        return f"Successfully filled {changed} block(s)"
+
+    def _command_clone(self, args: list[str]) -> str:
+        pos1, pos2 = self._coords(args[:3]), self._coords(args[3:6])
+        dest = self._coords(args[6:9])
+        xs, ys, zs = self._region(pos1, pos2)
+        volume = len(xs) * len(ys) * len(zs)
+        if volume > MAX_FILL_VOLUME:
+            raise _CommandError(
+                f"Too many blocks in the specified area (maximum {MAX_FILL_VOLUME}, specified {volume})"
+            )
+
+        # 範囲が重なっても正しく複製できるよう、先に全て読み込む
+        source = {
+            (x - xs[0], y - ys[0], z - zs[0]): self.world.get(
+                (x, y, z), "minecraft:air"
+            )
+            for x in xs
+            for y in ys
+            for z in zs
+        }
+        changed = 0
+        for (dx, dy, dz), block_id in source.items():
+            changed += self._set((dest[0] + dx, dest[1] + dy, dest[2] + dz), block_id)
+        if changed == 0:
+            return "No blocks were cloned"
+        return f"Successfully cloned {changed} block(s)"
+
+    def _command_list(self, args: list[str]) -> str:
+        names = ", ".join(self.players)
+        return f"There are {len(self.players)} of a max of {self.max_players} players online: {names}"
+
+    def _command_seed(self, args: list[str]) -> str:
+        return f"Seed: [{self.seed}]"
+
+    def _command_tick(self, args: list[str]) -> str:
+        if args[:1] != ["query"]:
+            raise _CommandError("Unknown or incomplete command, see below for error")
+        return (
+            "The game is running normally\n"
+            "Target tick rate: 20.0 per second.\n"
+            f"Average time per tick: {self.mspt:.1f}ms (Target: 50.0ms)"
+        )
+
+    def _command_data(self, args: list[str]) -> str:
+        if args[:2] != ["get", "entity"] or len(args) < 3:
+            raise _CommandError("Unknown or incomplete command, see below for error")
+        player = self.players.get(args[2])
+        if player is None:
+            return "No entity was found"
+
+        data = {
+            "Pos": f"[{player.pos.x}d, {player.pos.y}d, {player.pos.z}d]",
+            "Dimension": f'"{player.dimension}"',
+            "playerGameType": str(int(player.gamemode)),
+            "Health": "20.0f",
+            "Inventory": "[]",
+        }
+        if len(args) > 3:
+            if args[3] not in data:
+                return f"Found no elements matching {args[3]}"
+            value = data[args[3]]
+        else:
+            value = "{" + ", ".join(f"{k}: {v}" for k, v in data.items()) + "}"
+        return f"{player.name} has the following entity data: {value}"
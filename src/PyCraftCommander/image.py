@@ -0,0 +1,317 @@
+"""画像や高さマップをブロックに変換して設置するモジュール
+
+画素ごとにset_blockを送る代わりに、パレットの最も近い色のブロックをNumPyでまとめて求め、
+同じブロックが並ぶ範囲をfillコマンドにまとめて送信します。
+画像は数行ずつ処理してコマンドを順番に送信するため、大きな画像でも
+メモリ使用量は画像の幅に比例する程度に収まります。
+
+NumPyが必要です。(pip install PyCraftCommander[numpy])
+"""
+
+import numpy as np
+from typing import Iterator, Literal, Sequence
+from PyCraftCommander.py_craft_commander import PyCraftCommander
+from PyCraftCommander.types.player import Player, Pos
+from PyCraftCommander.voxel import (
+    MAX_FILL_VOLUME,
+    Box,
+    _layer_rectangles,
+    box_command,
+    send_streamed,
+)
+
+# コンクリート16色の平均的な色
+DEFAULT_PALETTE: dict[str, tuple[int, int, int]] = {
+    "minecraft:white_concrete": (207, 213, 214),
+    "minecraft:orange_concrete": (224, 97, 0),
+    "minecraft:magenta_concrete": (169, 48, 159),
+    "minecraft:light_blue_concrete": (35, 137, 198),
+    "minecraft:yellow_concrete": (240, 175, 21),
+    "minecraft:lime_concrete": (94, 168, 24),
+    "minecraft:pink_concrete": (213, 101, 142),
+    "minecraft:gray_concrete": (54, 57, 61),
+    "minecraft:light_gray_concrete": (125, 125, 115),
+    "minecraft:cyan_concrete": (21, 119, 136),
+    "minecraft:purple_concrete": (100, 31, 156),
+    "minecraft:blue_concrete": (44, 46, 143),
+    "minecraft:brown_concrete": (96, 59, 31),
+    "minecraft:green_concrete": (73, 91, 36),
+    "minecraft:red_concrete": (142, 32, 32),
+    "minecraft:black_concrete": (8, 10, 15),
+}
+
+# 設置しない画素(透明な画素)を表すインデックス
+TRANSPARENT = -1
+
+# 誤差拡散法で左下・下・右下に配る誤差の割合(右には7/16)
+_DIFFUSION = np.array([[3.0], [5.0], [1.0]]) / 16
+
+# 組織的ディザリングの閾値(4x4のベイヤー行列を-0.5から0.5に正規化したもの)
+_BAYER = (
+    np.array([[0, 8, 2, 10], [12, 4, 14, 6], [3, 11, 1, 9], [15, 7, 13, 5]]) + 0.5
+) / 16 - 0.5
+
+Dither = Literal["none", "ordered", "floyd_steinberg"]
+Plane = Literal["horizontal", "vertical"]
+
+
+def _as_rgba(image) -> np.ndarray:
+    """画像を(高さ, 幅, 4)のuint8配列に変換します。"""
+    if hasattr(image, "convert"):
+        # PIL.Image
+        image = image.convert("RGBA")
+    array = np.asarray(image)
+    if array.ndim == 2:
+        array = np.repeat(array[:, :, np.newaxis], 3, axis=2)
+    if array.ndim != 3 or array.shape[2] not in (3, 4):
+        raise ValueError("画像は(高さ, 幅, 3)または(高さ, 幅, 4)の配列にしてください。")
+    if array.shape[2] == 3:
+        alpha = np.full(array.shape[:2] + (1,), 255, dtype=array.dtype)
+        array = np.concatenate([array, alpha], axis=2)
+    return array
+
+
+def _nearest(pixels: np.ndarray, colors: np.ndarray) -> np.ndarray:
+    """(N, 3)の画素ごとに最も近い色のインデックスを返します。"""
+    # |p - c|^2 = |p|^2 - 2p・c + |c|^2 のうち、比較に必要な項だけを計算する
+    distances = (colors * colors).sum(axis=1) - 2.0 * (pixels @ colors.T)
+    return distances.argmin(axis=1)
+
+
+def match_palette(
+    image,
+    palette: dict[str, tuple[int, int, int]] = DEFAULT_PALETTE,
+    dither: Dither = "none",
+    chunk_rows: int = 64,
+    dither_strength: float = 48.0,
+) -> Iterator[np.ndarray]:
+    """画像の画素をパレットの最も近い色のインデックスに変換し、1行ずつ返します。
+
+    Args:
+    -----
+        image: (高さ, 幅, 3または4)の配列、またはPIL.Image
+        palette (dict[str, tuple[int, int, int]]): ブロックID -> RGB
+        dither: ディザリングの方法。
+            "ordered"はベイヤー行列による組織的ディザリングで、ベクトル化されていて高速です。
+            "floyd_steinberg"は誤差拡散法で、画質は良いですが斜めの列ごとに順番に処理するため、
+            "ordered"より3~10倍程度低速です(chunk_rowsを大きくすると速くなります)。
+        chunk_rows (int): まとめて処理する行数
+        dither_strength (float): 組織的ディザリングで加える揺らぎの大きさ(RGBの値)
+
+    Returns:
+    -------
+        Iterator[np.ndarray]: 行ごとのパレットのインデックス(幅の長さのint配列)。
+            透明な画素(アルファ値が128未満)はTRANSPARENT
+    """
+    rgba = _as_rgba(image)
+    colors = np.array(list(palette.values()), dtype=np.float64)
+    height, width = rgba.shape[:2]
+
+    if dither == "floyd_steinberg":
+        yield from _floyd_steinberg(rgba, colors, chunk_rows)
+        return
+
+    for top in range(0, height, chunk_rows):
+        chunk = rgba[top : top + chunk_rows]
+        pixels = chunk[:, :, :3].astype(np.float64)
+        if dither == "ordered":
+            rows = np.arange(top, top + len(chunk)) % 4
+            threshold = _BAYER[rows[:, np.newaxis], np.arange(width) % 4]
+            pixels += threshold[:, :, np.newaxis] * dither_strength
+        indices = _nearest(pixels.reshape(-1, 3), colors).reshape(len(chunk), width)
+        indices[chunk[:, :, 3] < 128] = TRANSPARENT
+        yield from indices
+
+
+def _floyd_steinberg(
+    rgba: np.ndarray, colors: np.ndarray, chunk_rows: int
+) -> Iterator[np.ndarray]:
+    """誤差拡散法でディザリングしたインデックスを1行ずつ返します。
+
+    画素(x, y)の誤差は(x+1, y)と次の行の(x-1, x, x+1)にだけ拡散するため、x + 2yが
+    等しい斜めの列の画素は互いに依存しません。chunk_rows行ずつ、斜めの列ごとに
+    まとめてNumPyで処理します。
+    """
+    height, width = rgba.shape[:2]
+    # 次のチャンクの最初の行に持ち越す誤差(左右に1画素ずつ余白を持つ)
+    carry = np.zeros((width + 2, 3))
+    for top in range(0, height, chunk_rows):
+        chunk = rgba[top : top + chunk_rows]
+        rows = len(chunk)
+        pixels = chunk[:, :, :3].astype(np.float64)
+        opaque = chunk[:, :, 3] >= 128
+        indices = np.full((rows, width), TRANSPARENT)
+        # 画素(x, y)に拡散された誤差はerror[y, x + 1]。最後の行は次のチャンクに持ち越す
+        error = np.zeros((rows + 1, width + 2, 3))
+        error[0] = carry
+        row_numbers = np.arange(rows)
+        for diagonal in range(width + 2 * rows - 2):
+            # x = diagonal - 2yが0以上width未満になる行
+            ys = row_numbers[max(0, (diagonal - width) // 2 + 1) : diagonal // 2 + 1]
+            xs = diagonal - 2 * ys
+            visible = opaque[ys, xs]
+            ys = ys[visible]
+            xs = xs[visible]
+            if len(ys) == 0:
+                continue
+            values = pixels[ys, xs] + error[ys, xs + 1]
+            best = _nearest(values, colors)
+            indices[ys, xs] = best
+            diff = values - colors[best]
+            error[ys, xs + 2] += diff * (7 / 16)
+            error[ys + 1, xs] += diff * _DIFFUSION[0]
+            error[ys + 1, xs + 1] += diff * _DIFFUSION[1]
+            error[ys + 1, xs + 2] += diff * _DIFFUSION[2]
+        carry = error[rows]
+        yield from indices
+
+
+def image_fill_commands(
+    image,
+    origin: Player | Pos,
+    palette: dict[str, tuple[int, int, int]] = DEFAULT_PALETTE,
+    dither: Dither = "none",
+    plane: Plane = "horizontal",
+    mode: Literal["replace", "keep", "destroy"] = "replace",
+) -> Iterator[str]:
+    """画像を設置するfill/setblockコマンドを順番に返します。
+
+    Args:
+    -----
+        image: (高さ, 幅, 3または4)の配列、またはPIL.Image
+        origin (Player | Pos): 画像の左上の画素を設置する座標
+        palette (dict[str, tuple[int, int, int]]): ブロックID -> RGB
+        dither: ディザリングの方法("none", "ordered", "floyd_steinberg")
+        plane: "horizontal"の場合は地面(x-z平面、画像の下方向が+z)に、
+            "vertical"の場合は壁(x-y平面、画像の下方向が-y)に設置します。
+        mode: fill/setblockのモード
+
+    Returns:
+    -------
+        Iterator[str]: コマンド
+    """
+    if isinstance(origin, Player):
+        origin = origin.int_pos
+    block_ids = list(palette)
+    rgba = _as_rgba(image)
+    height = rgba.shape[0]
+
+    rectangles = _layer_rectangles(
+        (row.tolist() for row in match_palette(rgba, palette, dither)),
+        TRANSPARENT,
+        MAX_FILL_VOLUME,
+    )
+    for x1, x2, row1, row2, value in rectangles:
+        if plane == "horizontal":
+            box = Box(x1, 0, row1, x2, 0, row2, value)
+        else:
+            box = Box(x1, height - 1 - row2, 0, x2, height - 1 - row1, 0, value)
+        yield box_command(box, origin, block_ids, mode)
+
+
+def heightmap_fill_commands(
+    heights,
+    origin: Player | Pos,
+    blocks: str | tuple[Sequence[Sequence[int]], Sequence[str]],
+    mode: Literal["replace", "keep", "destroy"] = "replace",
+) -> Iterator[str]:
+    """高さマップを柱として設置するfill/setblockコマンドを順番に返します。
+
+    Args:
+    -----
+        heights: (奥行き, 幅)の整数の配列。heights[z][x]の高さの柱をoriginのyから積み上げます。
+            0以下の位置には設置しません。
+        origin (Player | Pos): heights[0][0]の柱の一番下の座標
+        blocks: 柱のブロックID、または(heightsと同じ大きさのパレットのインデックスの配列, パレット)
+            (match_paletteの結果を使うと、画像の色で塗った高さマップになります)
+        mode: fill/setblockのモード
+
+    Returns:
+    -------
+        Iterator[str]: コマンド
+    """
+    if isinstance(origin, Player):
+        origin = origin.int_pos
+    heights = np.asarray(heights, dtype=np.int64)
+    if isinstance(blocks, str):
+        indices = np.zeros(heights.shape, dtype=np.int64)
+        block_ids = [blocks]
+    else:
+        indices = np.asarray(blocks[0], dtype=np.int64)
+        block_ids = list(blocks[1])
+    if indices.shape != heights.shape:
+        raise ValueError(
+            "blocksのインデックスの配列はheightsと同じ大きさにしてください。"
+        )
+
+    # 高さとブロックの組を1つの値にまとめ、同じ値の範囲を直方体にする
+    count = len(block_ids)
+    keys = np.where(heights > 0, heights * count + indices, TRANSPARENT)
+    for x1, x2, row1, row2, key in _layer_rectangles(
+        keys.tolist(), TRANSPARENT, MAX_FILL_VOLUME, lambda key: key // count
+    ):
+        box = Box(x1, 0, row1, x2, key // count - 1, row2, key % count)
+        yield box_command(box, origin, block_ids, mode)
+
+
+def place_image(
+    server: PyCraftCommander,
+    image,
+    origin: Player | Pos,
+    palette: dict[str, tuple[int, int, int]] = DEFAULT_PALETTE,
+    dither: Dither = "none",
+    plane: Plane = "horizontal",
+    mode: Literal["replace", "keep", "destroy"] = "replace",
+    chunk_size: int = 4096,
+) -> tuple[int, int]:
+    """画像をブロックで設置します。引数はimage_fill_commandsと同じです。
+
+    Returns:
+    -------
+        tuple[int, int]: (送信したコマンド数, 失敗したコマンド数)
+
+    Example:
+    --------
+    ```python
+    from PIL import Image
+    from PyCraftCommander.image import place_image
+
+    place_image(server, Image.open("logo.png"), Pos(0, 64, 0), dither="ordered")
+    ```
+    """
+    if isinstance(origin, Player):
+        origin = origin.int_pos
+    if server.block_id_validator is not None:
+        server.block_id_validator.validate_all(palette)
+    result = send_streamed(
+        server,
+        image_fill_commands(image, origin, palette, dither, plane, mode),
+        chunk_size,
+    )
+    return result
+
+
+def place_heightmap(
+    server: PyCraftCommander,
+    heights,
+    origin: Player | Pos,
+    blocks: str | tuple[Sequence[Sequence[int]], Sequence[str]],
+    mode: Literal["replace", "keep", "destroy"] = "replace",
+    chunk_size: int = 4096,
+) -> tuple[int, int]:
+    """高さマップを柱として設置します。引数はheightmap_fill_commandsと同じです。
+
+    Returns:
+    -------
+        tuple[int, int]: (送信したコマンド数, 失敗したコマンド数)
+    """
+    if isinstance(origin, Player):
+        origin = origin.int_pos
+    if server.block_id_validator is not None:
+        server.block_id_validator.validate_all(
+            [blocks] if isinstance(blocks, str) else blocks[1]
+        )
+    result = send_streamed(
+        server, heightmap_fill_commands(heights, origin, blocks, mode), chunk_size
+    )
+    return result
@@ -0,0 +1,210 @@
+import time
+from typing import Callable
+
+# コマンドの送信前に呼ばれるフック: (コマンド) -> None
+PreHook = Callable[[str], None]
+# レスポンスの受信後に呼ばれるフック: (コマンド, レスポンス, 成否, 経過秒数) -> None
+PostHook = Callable[[str, str, bool, float], None]
+
+
+class LatencyHistogram:
+    """対数バケットでレイテンシを記録するヒストグラム(HDR Histogram方式)
+
+    値をマイクロ秒の整数として、2のべき乗ごとの区間をさらに2^SUB_BUCKET_BITS個に
+    等分したバケットに数えます。相対誤差は約3%に収まり、記録はリストの要素を1つ
+    増やすだけなので、常に有効にしておけます。
+    """
+
+    # 2のべき乗ごとの区間の分割数(2^5 = 32)
+    SUB_BUCKET_BITS = 5
+    # 記録できる最大値(マイクロ秒)。これを超える値は最大値として数える
+    MAX_VALUE = 2**36 - 1
+
+    __sub_buckets = 1 << SUB_BUCKET_BITS
+
+    def __init__(self):
+        self.counts = [0] * (self.index(self.MAX_VALUE) + 1)
+        self.count = 0
+        # 合計・最小・最大(秒)
+        self.sum = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    @classmethod
+    def index(cls, value: int) -> int:
+        """マイクロ秒の値が属するバケットの番号を返します。"""
+        if value < 2 * cls.__sub_buckets:
+            return value
+        shift = value.bit_length() - (cls.SUB_BUCKET_BITS + 1)
+        return shift * cls.__sub_buckets + (value >> shift)
+
+    @classmethod
+    def bucket_range(cls, index: int) -> tuple[int, int]:
+        """バケットに含まれる値の範囲(マイクロ秒、両端を含む)を返します。"""
+        if index < 2 * cls.__sub_buckets:
+            return index, index
+        shift = index // cls.__sub_buckets - 1
+        mantissa = index - shift * cls.__sub_buckets
+        return mantissa << shift, ((mantissa + 1) << shift) - 1
+
+    def record(self, seconds: float):
+        """経過時間(秒)を記録します。"""
+        value = min(max(int(seconds * 1e6), 0), self.MAX_VALUE)
+        self.counts[self.index(value)] += 1
+        self.count += 1
+        self.sum += seconds
+        if self.min is None or seconds < self.min:
+            self.min = seconds
+        if self.max is None or seconds > self.max:
+            self.max = seconds
+
+    def percentile(self, q: float) -> float:
+        """q(0から100)パーセンタイルの値(秒)を返します。記録がない場合は0.0"""
+        if self.count == 0:
+            return 0.0
+        rank = max(1, round(self.count * q / 100))
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                low, high = self.bucket_range(index)
+                # バケットの中央の値を返す(最大値を超えないようにする)
+                return min((low + high) / 2 / 1e6, self.max)
+        return self.max
+
+    def buckets(self) -> list[tuple[float, int]]:
+        """記録があるバケットの(上限の秒数, その上限以下の累積件数)のリストを返します。"""
+        result = []
+        seen = 0
+        for index, count in enumerate(self.counts):
+            if count:
+                seen += count
+                result.append(((self.bucket_range(index)[1] + 1) / 1e6, seen))
+        return result
+
+    def cumulative_counts(self, bounds: list[float]) -> list[int]:
+        """昇順の上限(秒)ごとに、その値以下の記録の件数を返します。
+
+        バケットの精度で数えるため、上限付近の値は前後にずれることがあります。
+        """
+        counts = list(self.counts)
+        result = []
+        seen = 0
+        index = 0
+        for bound in bounds:
+            limit = min(int(bound * 1e6), self.MAX_VALUE)
+            while index < len(counts) and self.bucket_range(index)[1] <= limit:
+                seen += counts[index]
+                index += 1
+            result.append(seen)
+        return result
+
+    def snapshot(self) -> dict:
+        """集計結果を辞書で返します。時間の単位は秒です。"""
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": self.sum / self.count if self.count else 0.0,
+            "min": self.min or 0.0,
+            "max": self.max or 0.0,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p999": self.percentile(99.9),
+        }
+
+
+class Instrumentation:
+    """RCONの通信を計測するクラス
+
+    コマンドの動詞(setblock, fill, dataなど)ごとのレイテンシのヒストグラムと、
+    送受信バイト数・タイムアウト・リクエストIDの不一致・再接続のカウンター、
+    応答待ちのコマンド数・未送信のコマンド数、
+    処理の段階ごと(エンコード・送信・受信待ち・デコード)の累計時間を保持します。
+    受信待ちの時間にはサーバーでの処理時間とネットワークの往復時間が含まれます。
+
+    RCONごとに1つ作成され、server.instrumentationからフックの登録が、
+    server.stats()から集計結果の取得ができます。
+    記録は1つの接続のスレッドからのみ行われることを前提としています。
+
+    Example:
+    --------
+    ```python
+    with PyCraftCommander(host, port, password) as server:
+        server.auth()
+        server.instrumentation.add_post_hook(
+            lambda command, response, ok, elapsed: print(command, elapsed)
+        )
+        server.set_block(Pos(0, 64, 0), MCID.STONE)
+        print(server.stats()["latency"]["setblock"]["p99"])
+    ```
+    """
+
+    PHASES = ("encode", "send", "receive", "decode")
+
+    def __init__(self):
+        self.pre_hooks: list[PreHook] = []
+        self.post_hooks: list[PostHook] = []
+        self.reset()
+
+    def reset(self):
+        """集計結果をリセットします。フックはそのまま残ります。"""
+        # 動詞 -> ヒストグラム
+        self.histograms: dict[str, LatencyHistogram] = {}
+        self.commands = 0
+        self.bytes_sent = 0
+        self.bytes_received = 0
+        self.timeouts = 0
+        self.mismatched_ids = 0
+        self.reconnects = 0
+        # 応答待ちのコマンド数と、send_commandsでまだ送信していないコマンド数
+        self.in_flight = 0
+        self.backlog = 0
+        # 段階 -> 累計時間(秒)
+        self.phases: dict[str, float] = dict.fromkeys(self.PHASES, 0.0)
+        self.started_at = time.time()
+
+    def add_pre_hook(self, hook: PreHook) -> PreHook:
+        """コマンドの送信前に呼ばれるフックを登録します。デコレーターとしても使用できます。"""
+        self.pre_hooks.append(hook)
+        return hook
+
+    def add_post_hook(self, hook: PostHook) -> PostHook:
+        """レスポンスの受信後に呼ばれるフックを登録します。デコレーターとしても使用できます。"""
+        self.post_hooks.append(hook)
+        return hook
+
+    def before_command(self, command: str):
+        """コマンドの送信前に呼び出します。"""
+        for hook in self.pre_hooks:
+            hook(command)
+
+    def after_command(self, command: str, response: str, ok: bool, elapsed: float):
+        """コマンドのレスポンスを受信した後に呼び出します。"""
+        self.commands += 1
+        verb = command.partition(" ")[0]
+        histogram = self.histograms.get(verb)
+        if histogram is None:
+            histogram = self.histograms[verb] = LatencyHistogram()
+        histogram.record(elapsed)
+        for hook in self.post_hooks:
+            hook(command, response, ok, elapsed)
+
+    def snapshot(self) -> dict:
+        """集計結果を辞書で返します。"""
+        return {
+            "uptime": time.time() - self.started_at,
+            "commands": self.commands,
+            "bytes_sent": self.bytes_sent,
+            "bytes_received": self.bytes_received,
+            "timeouts": self.timeouts,
+            "mismatched_ids": self.mismatched_ids,
+            "reconnects": self.reconnects,
+            "in_flight": self.in_flight,
+            "backlog": self.backlog,
+            "phases": dict(self.phases),
+            "latency": {
+                verb: histogram.snapshot()
+                for verb, histogram in sorted(self.histograms.items())
+            },
+        }
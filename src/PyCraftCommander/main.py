@@ -1,4 +1,4 @@
-from PyCraftCommander import PyCraftCommander, Player, GET_MCID
+from PyCraftCommander import PyCraftCommander, Player, GET_MCID, AdaptiveRateLimiter
 import random
 import time
 from copy import deepcopy
@@ -7,7 +7,10 @@ host = "localhost"
 port = 25575
 password = "admin"
 
-with PyCraftCommander(host, port, password) as server:
+# 固定のsleepの代わりに、サーバーの負荷に合わせて送信レートを調整する
+limiter = AdaptiveRateLimiter()
+
+with PyCraftCommander(host, port, password, rate_limiter=limiter) as server:
     MCID = GET_MCID("1.21")
     server.auth()
 
@@ -38,21 +41,17 @@ with PyCraftCommander(host, port, password) as server:
         for i in range(10):
             myPos.x += 1
             server.set_block(myPos, block)
-            time.sleep(0.01)
 
         for i in range(10):
             myPos.z += 1
             server.set_block(myPos, block)
-            time.sleep(0.01)
 
         for i in range(10):
 
             server.set_block(myPos, block)
-            time.sleep(0.01)
 
         for i in range(10):
             server.set_block(myPos, block)
-            time.sleep(0.01)
 
         myPos.y += 1
         myPos.z -= 1
@@ -0,0 +1,250 @@
+import threading
+from PyCraftCommander.rcon import RCON
+
+# レイテンシのヒストグラムを出力する上限(秒)
+DEFAULT_BUCKETS = (
+    0.0001,
+    0.00025,
+    0.0005,
+    0.001,
+    0.0025,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+)
+
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _labels(**labels: str) -> str:
+    return ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items())
+
+
+def render_metrics(
+    servers: dict[str, RCON], buckets: tuple[float, ...] = DEFAULT_BUCKETS
+) -> str:
+    """RCONの計測結果をPrometheusのテキスト形式で返します。
+
+    Args:
+    -----
+        servers (dict[str, RCON]): serverラベルの値 -> RCON
+        buckets (tuple[float, ...]): レイテンシのヒストグラムの上限(秒)
+
+    Returns:
+    -------
+        str: Prometheusのテキスト形式のメトリクス
+    """
+    lines = []
+
+    def metric(name: str, type: str, help: str, samples):
+        lines.append(f"# HELP {name} {help}")
+        lines.append(f"# TYPE {name} {type}")
+        for suffix, labels, value in samples:
+            lines.append(f"{name}{suffix}{{{labels}}} {value}")
+
+    stats = {name: server.instrumentation for name, server in sorted(servers.items())}
+    # 計測中のスレッドが動詞を追加しても影響を受けないようにコピーする
+    histograms = {
+        name: sorted(list(instrumentation.histograms.items()))
+        for name, instrumentation in stats.items()
+    }
+
+    def counter(name: str, help: str, attribute: str):
+        metric(
+            name,
+            "counter",
+            help,
+            [
+                ("", _labels(server=server), getattr(instrumentation, attribute))
+                for server, instrumentation in stats.items()
+            ],
+        )
+
+    def gauge(name: str, help: str, attribute: str):
+        metric(
+            name,
+            "gauge",
+            help,
+            [
+                ("", _labels(server=server), getattr(instrumentation, attribute))
+                for server, instrumentation in stats.items()
+            ],
+        )
+
+    metric(
+        "rcon_commands_total",
+        "counter",
+        "Commands that received a response.",
+        [
+            ("", _labels(server=server, verb=verb), histogram.count)
+            for server, items in histograms.items()
+            for verb, histogram in items
+        ],
+    )
+
+    samples = []
+    for server, items in histograms.items():
+        for verb, histogram in items:
+            counts = histogram.cumulative_counts(list(buckets))
+            total = histogram.count
+            for bound, count in zip(buckets, counts):
+                samples.append(
+                    ("_bucket", _labels(server=server, verb=verb, le=str(bound)), count)
+                )
+            samples.append(
+                ("_bucket", _labels(server=server, verb=verb, le="+Inf"), total)
+            )
+            samples.append(("_sum", _labels(server=server, verb=verb), histogram.sum))
+            samples.append(("_count", _labels(server=server, verb=verb), total))
+    metric(
+        "rcon_command_duration_seconds",
+        "histogram",
+        "Time from encoding a command to decoding its response.",
+        samples,
+    )
+
+    metric(
+        "rcon_phase_seconds_total",
+        "counter",
+        "Time spent in each phase of the command path.",
+        [
+            ("", _labels(server=server, phase=phase), seconds)
+            for server, instrumentation in stats.items()
+            for phase, seconds in dict(instrumentation.phases).items()
+        ],
+    )
+    counter("rcon_bytes_sent_total", "Bytes written to the socket.", "bytes_sent")
+    counter(
+        "rcon_bytes_received_total", "Bytes read from the socket.", "bytes_received"
+    )
+    counter("rcon_timeouts_total", "Socket reads that timed out.", "timeouts")
+    counter(
+        "rcon_mismatched_ids_total",
+        "Packets whose request id matched no pending command.",
+        "mismatched_ids",
+    )
+    counter("rcon_reconnects_total", "Reconnections to the server.", "reconnects")
+    gauge("rcon_in_flight", "Commands waiting for a response.", "in_flight")
+    gauge("rcon_queue_backlog", "Commands queued but not yet sent.", "backlog")
+
+    limited = {
+        name: server.rate_limiter
+        for name, server in sorted(servers.items())
+        if server.rate_limiter is not None
+    }
+    if limited:
+        metric(
+            "rcon_rate_limit",
+            "gauge",
+            "Current send rate of the adaptive rate limiter (commands/second).",
+            [
+                ("", _labels(server=name), limiter.rate)
+                for name, limiter in limited.items()
+            ],
+        )
+
+    return "\n".join(lines) + "\n"
+
+
+class MetricsServer:
+    """RCONの計測結果をPrometheus形式で公開するHTTPサーバー
+
+    バックグラウンドのスレッドで起動し、/metricsへのGETにrender_metricsの結果を返します。
+    標準ライブラリのみを使用します。
+
+    Example:
+    --------
+    ```python
+    with PyCraftCommander(host, port, password) as server:
+        server.auth()
+        with MetricsServer({"survival": server}, port=9150):
+            while True:
+                server.set_block(Pos(0, 64, 0), MCID.STONE)
+    ```
+    """
+
+    def __init__(
+        self,
+        servers: RCON | dict[str, RCON],
+        host: str = "127.0.0.1",
+        port: int = 9150,
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        """
+        Args:
+        -----
+            servers (RCON | dict[str, RCON]): 公開するRCON。辞書の場合はキーがserverラベルの値になります。
+            host (str): 待ち受けるアドレス
+            port (int): 待ち受けるポート番号。0の場合は空いているポートを使用します。
+            buckets (tuple[float, ...]): レイテンシのヒストグラムの上限(秒)
+        """
+        if isinstance(servers, RCON):
+            servers = {"default": servers}
+        self.servers = servers
+        self.buckets = buckets
+        # http.serverは読み込みに時間がかかるため、使用するときにimportする
+        from http.server import ThreadingHTTPServer
+
+        self.__httpd = ThreadingHTTPServer((host, port), self.__handler_class())
+        self.__httpd.daemon_threads = True
+        self.__thread: threading.Thread | None = None
+
+    @property
+    def address(self) -> tuple[str, int]:
+        """待ち受けているアドレスとポート番号"""
+        return self.__httpd.server_address[:2]
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """サーバーを起動します。"""
+        if self.__thread is not None:
+            return
+        self.__thread = threading.Thread(target=self.__httpd.serve_forever, daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """サーバーを停止します。"""
+        if self.__thread is None:
+            return
+        self.__httpd.shutdown()
+        self.__httpd.server_close()
+        self.__thread.join()
+        self.__thread = None
+
+    def __handler_class(self):
+        from http.server import BaseHTTPRequestHandler
+
+        metrics = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split("?")[0] not in ("/", "/metrics"):
+                    self.send_error(404)
+                    return
+                body = render_metrics(metrics.servers, metrics.buckets).encode("utf-8")
+                self.send_response(200)
+                self.send_header("Content-Type", "text/plain; version=0.0.4")
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                # アクセスごとにstderrへ出力しない
+                pass
+
+        return Handler
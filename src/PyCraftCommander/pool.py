@@ -0,0 +1,227 @@
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Iterator
+from PyCraftCommander.py_craft_commander import PyCraftCommander
+
+
+def _check_list(server: PyCraftCommander) -> bool:
+    """listコマンドに応答するかで接続を確認します。"""
+    return server.send_command("list")[1]
+
+
+class RCONPool:
+    """複数のスレッドから安全に使える、認証済みの接続のプール
+
+    RCONは1つのソケットを使い、ロックを持たないため、複数のスレッドから同じ接続に
+    コマンドを送るとレスポンスが入れ替わります。RCONPoolは最大max_size個の接続を持ち、
+    スレッドごとに接続を貸し出します。空いている接続がない場合は、上限に達するまで
+    新しく接続し、上限に達している場合は返却されるまで待ちます。
+
+    しばらく使われていなかった接続は、貸し出す前にhealth_checkで確認し、応答しない
+    場合は接続し直します。使用中に例外が発生した接続は、レスポンスの対応がずれて
+    いる可能性があるため、返却時に閉じます。
+
+    PyCraftCommanderと同じ名前のメソッドを呼び出すと、接続を借りて実行し、すぐに返却します。
+
+    Example:
+    --------
+    ```python
+    pool = RCONPool(host, port, password, max_size=4)
+
+    # リクエストを処理するスレッドごとに
+    with pool.connection() as server:
+        player = server.get_player_info(name)
+        server.give(player, MCID.DIAMOND)
+
+    pool.say("こんにちは")
+    ```
+    """
+
+    def __init__(
+        self,
+        host,
+        port,
+        password,
+        max_size: int = 8,
+        timeout: float = 5.0,
+        checkout_timeout: float | None = None,
+        health_check_interval: float | None = 30.0,
+        health_check: Callable[[PyCraftCommander], bool] = _check_list,
+        **options,
+    ):
+        """
+        Args:
+        -----
+            max_size (int): 同時に開く接続数の上限
+            timeout (float): 各接続の接続とレスポンスの受信を待つ時間の上限(秒)。PyCraftCommanderに渡します。
+            checkout_timeout (float | None): 空いている接続を待つ時間の上限(秒)。Noneの場合は無制限
+            health_check_interval (float | None): この秒数以上使われていなかった接続は貸し出す前に確認します。
+                Noneの場合は確認しません。
+            health_check (Callable[[PyCraftCommander], bool]): 接続を確認する関数。Falseを返すか例外が発生すると接続し直します。
+            **options: PyCraftCommanderに渡す引数(window, reconnect_policyなど)
+        """
+        if max_size < 1:
+            raise ValueError("max_sizeは1以上を指定してください。")
+        self.__host = host
+        self.__port = port
+        self.__password = password
+        self.max_size = max_size
+        self.timeout = timeout
+        self.checkout_timeout = checkout_timeout
+        self.health_check_interval = health_check_interval
+        self.health_check = health_check
+        self.__options = options
+
+        # (接続, 最後に返却された時刻)。最近使われた接続から貸し出す
+        self.__idle: deque[tuple[PyCraftCommander, float]] = deque()
+        # 開いている接続数(接続中のものを含む)
+        self.__size = 0
+        self.__closed = False
+        self.__condition = threading.Condition()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def __getattr__(self, name: str):
+        if name.startswith("_") or not callable(getattr(PyCraftCommander, name, None)):
+            raise AttributeError(f"'RCONPool' object has no attribute '{name}'")
+
+        def call(*args, **kwargs):
+            with self.connection() as server:
+                return getattr(server, name)(*args, **kwargs)
+
+        return call
+
+    @property
+    def size(self) -> int:
+        """開いている接続数"""
+        return self.__size
+
+    @property
+    def idle(self) -> int:
+        """貸し出されていない接続数"""
+        return len(self.__idle)
+
+    def checkout(self, timeout: float | None = None) -> PyCraftCommander:
+        """接続を借ります。使い終わったらcheckinで返却してください。
+
+        Args:
+        -----
+            timeout (float | None): 空いている接続を待つ時間の上限(秒)。Noneの場合は初期化時のcheckout_timeout
+
+        Returns:
+        -------
+            PyCraftCommander: 認証済みの接続
+
+        Raises:
+        -------
+            TimeoutError: 時間内に接続が返却されなかった場合
+        """
+        timeout = self.checkout_timeout if timeout is None else timeout
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self.__condition:
+                while True:
+                    if self.__closed:
+                        raise RuntimeError("プールは閉じられています。")
+                    if self.__idle:
+                        server, last_used = self.__idle.pop()
+                        break
+                    if self.__size < self.max_size:
+                        # 接続には時間がかかるため、枠だけ確保してロックの外で接続する
+                        self.__size += 1
+                        server = None
+                        break
+                    remaining = (
+                        None if deadline is None else deadline - time.monotonic()
+                    )
+                    if remaining is not None and remaining <= 0:
+                        raise TimeoutError("空いている接続がありませんでした。")
+                    self.__condition.wait(remaining)
+
+            if server is None:
+                try:
+                    return self.__open()
+                except BaseException:
+                    self.__release()
+                    raise
+            if self.__healthy(server, last_used):
+                return server
+            self.__close(server)
+
+    def checkin(self, server: PyCraftCommander, discard: bool = False):
+        """借りた接続を返却します。
+
+        Args:
+        -----
+            server (PyCraftCommander): checkoutで借りた接続
+            discard (bool): Trueの場合は接続を閉じます。エラーが発生した接続に指定してください。
+        """
+        with self.__condition:
+            if not discard and not self.__closed:
+                self.__idle.append((server, time.monotonic()))
+                self.__condition.notify()
+                return
+        self.__close(server)
+
+    @contextmanager
+    def connection(self, timeout: float | None = None) -> Iterator[PyCraftCommander]:
+        """withブロックの間だけ接続を借ります。例外が発生した場合、接続は閉じます。"""
+        server = self.checkout(timeout)
+        try:
+            yield server
+        except BaseException:
+            self.checkin(server, discard=True)
+            raise
+        self.checkin(server)
+
+    def close(self):
+        """貸し出されていない接続を全て閉じ、以降の貸し出しを停止します。
+
+        貸し出し中の接続は返却されたときに閉じます。
+        """
+        with self.__condition:
+            self.__closed = True
+            idle = [server for server, _ in self.__idle]
+            self.__idle.clear()
+            self.__condition.notify_all()
+        for server in idle:
+            self.__close(server)
+
+    def __open(self) -> PyCraftCommander:
+        server = PyCraftCommander(
+            self.__host,
+            self.__port,
+            self.__password,
+            timeout=self.timeout,
+            **self.__options,
+        )
+        try:
+            server.auth()
+        except BaseException:
+            server.__exit__(None, None, None)
+            raise
+        return server
+
+    def __healthy(self, server: PyCraftCommander, last_used: float) -> bool:
+        interval = self.health_check_interval
+        if interval is None or time.monotonic() - last_used < interval:
+            return True
+        try:
+            return bool(self.health_check(server))
+        except Exception:
+            return False
+
+    def __close(self, server: PyCraftCommander):
+        server.__exit__(None, None, None)
+        self.__release()
+
+    def __release(self):
+        with self.__condition:
+            self.__size -= 1
+            self.__condition.notify()
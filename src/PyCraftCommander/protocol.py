@@ -0,0 +1,163 @@
+import socket
+import struct
+from PyCraftCommander.types.packet import Packet
+
+
+class PacketReader:
+    """ソケットからRCONパケットを読み込むバッファ付きリーダー
+
+    先頭4バイトのサイズを元にパケットを切り出すため、1回のrecvに複数のパケットが
+    含まれていても、1つのパケットが複数回のrecvに分割されていても正しく読み込めます。
+    受信には再利用可能なバッファへのrecv_intoを使用します。
+    """
+
+    # size | ID | Type
+    __header = struct.Struct("<iii")
+    # パケットのサイズ(ID + Type + Body + Null + Null)の最小値
+    MIN_PACKET_SIZE = 10
+    # 不正なサイズを受け取った場合に無制限にバッファを確保しないための上限
+    MAX_PACKET_SIZE = 16 * 1024 * 1024
+
+    def __init__(self, sock: socket.socket, buffer_size: int = 16384):
+        self.__socket = sock
+        self.__buffer = bytearray(buffer_size)
+        self.__view = memoryview(self.__buffer)
+        # バッファ内の未処理データの範囲
+        self.__start = 0
+        self.__end = 0
+
+    def read_packet(self) -> Packet:
+        """パケットを1つ読み込みます。"""
+        while True:
+            packet = self.__parse()
+            if packet is not None:
+                return packet
+            self.__fill()
+
+    def __parse(self) -> Packet | None:
+        """バッファからパケットを1つ切り出します。足りない場合はNoneを返します。"""
+        available = self.__end - self.__start
+        if available < 4:
+            return None
+
+        size = int.from_bytes(
+            self.__view[self.__start : self.__start + 4], "little", signed=True
+        )
+        if not self.MIN_PACKET_SIZE <= size <= self.MAX_PACKET_SIZE:
+            raise ValueError(f"不正なパケットサイズを受信しました。: {size}")
+
+        total = size + 4
+        if available < total:
+            self.__reserve(total)
+            return None
+
+        start = self.__start
+        size, request_id, type = self.__header.unpack_from(self.__buffer, start)
+        body = bytes(self.__view[start + 12 : start + total - 2])
+
+        self.__start += total
+        if self.__start == self.__end:
+            self.__start = self.__end = 0
+        return Packet(size, request_id, type, body)
+
+    def __reserve(self, total: int):
+        """未処理データの先頭からtotalバイトを格納できるようにバッファを整理します。"""
+        if self.__start + total <= len(self.__buffer):
+            return
+
+        remaining = self.__end - self.__start
+        if total <= len(self.__buffer):
+            # 未処理データを先頭に詰める
+            self.__buffer[:remaining] = self.__buffer[self.__start : self.__end]
+        else:
+            # パケットがバッファに収まらないため拡張する
+            buffer = bytearray(max(total, len(self.__buffer) * 2))
+            buffer[:remaining] = self.__view[self.__start : self.__end]
+            self.__view.release()
+            self.__buffer = buffer
+            self.__view = memoryview(buffer)
+        self.__start = 0
+        self.__end = remaining
+
+    def __fill(self):
+        """ソケットから受信してバッファに追加します。"""
+        if self.__end == len(self.__buffer):
+            self.__reserve(len(self.__buffer) - self.__start + 1)
+
+        received = self.__socket.recv_into(self.__view[self.__end :])
+        if received == 0:
+            raise ConnectionError("サーバーとの接続が切断されました。")
+        self.__end += received
+
+
+class PacketEncoder:
+    """RCONパケットを再利用可能なバッファに書き込むエンコーダー
+
+    addで追加したパケットはバッファに溜められ、flushで1回のsendallにまとめて送信されます。
+    リクエストIDは単調増加するカウンターから払い出します。
+    """
+
+    # size | ID | Type
+    __header = struct.Struct("<iii")
+    # リクエストIDの最大値(4バイトの符号付き整数)
+    MAX_REQUEST_ID = 2147483647
+
+    def __init__(self, buffer_size: int = 16384):
+        self.__buffer = bytearray(buffer_size)
+        # バッファに書き込み済みのバイト数
+        self.__length = 0
+        self.__request_id = 0
+
+    def __len__(self) -> int:
+        return self.__length
+
+    def next_request_id(self) -> int:
+        """次のリクエストIDを返します。"""
+        # -1は認証失敗を表すため、1からMAX_REQUEST_IDの範囲で循環させる
+        if self.__request_id >= self.MAX_REQUEST_ID:
+            self.__request_id = 0
+        self.__request_id += 1
+        return self.__request_id
+
+    def add(self, type: int, body: str, request_id: int | None = None) -> int:
+        """パケットをバッファに追加し、リクエストIDを返します。
+
+        request_idを省略した場合はカウンターから払い出します。
+        (サーバー側で応答するときは、リクエストのIDを指定します)
+        """
+        # size | ID | Type | Body + Null | Null
+        # 4    | 4  | 4    | size + 1    | 1
+        body: bytes = body.encode("utf-8")
+        if request_id is None:
+            request_id = self.next_request_id()
+
+        start = self.__length
+        end = start + len(body) + 14
+        if end > len(self.__buffer):
+            grow = max(end, len(self.__buffer) * 2) - len(self.__buffer)
+            self.__buffer.extend(bytes(grow))
+
+        self.__header.pack_into(
+            self.__buffer, start, len(body) + 10, request_id, int(type)
+        )
+        self.__buffer[start + 12 : end - 2] = body
+        self.__buffer[end - 2 : end] = b"\x00\x00"
+        self.__length = end
+        return request_id
+
+    def take(self) -> bytes:
+        """バッファに溜まったパケットを取り出します。(asyncioのStreamWriterに書き込む場合など)"""
+        with memoryview(self.__buffer)[: self.__length] as view:
+            data = bytes(view)
+        self.__length = 0
+        return data
+
+    def flush(self, sock: socket.socket) -> int:
+        """バッファに溜まったパケットを1回のsendallで送信し、送信したバイト数を返します。"""
+        sent = self.__length
+        if sent == 0:
+            return 0
+        with memoryview(self.__buffer)[:sent] as view:
+            sock.sendall(view)
+        self.__length = 0
+        return sent
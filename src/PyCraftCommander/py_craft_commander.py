@@ -1,11 +1,67 @@
+from PyCraftCommander import commands
+from PyCraftCommander.batch import Batch
+from PyCraftCommander.block_cache import BlockCache
 from PyCraftCommander.rcon import RCON
+from PyCraftCommander.reconnect import ReconnectPolicy
+from PyCraftCommander.throttle import AdaptiveRateLimiter
 from PyCraftCommander.types.player import Player, Pos, GameMode
-from typing import Literal
+from PyCraftCommander.validation import BlockIdValidator
+from PyCraftCommander.voxel import box_command, greedy_boxes
+from typing import Any, Iterable, Literal, Sequence
 
 
 class PyCraftCommander(RCON):
-    def __init__(self, host, port, password):
-        super().__init__(host, port, password)
+    def __init__(
+        self,
+        host,
+        port,
+        password,
+        window: int = 64,
+        block_cache: BlockCache | None = None,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        block_id_validator: BlockIdValidator | None = None,
+        timeout: float = 5.0,
+        reconnect_policy: ReconnectPolicy | None = None,
+    ):
+        """
+        Args:
+        -----
+            window (int): パイプライン送信時に同時に応答待ちにできるコマンド数
+            rate_limiter (AdaptiveRateLimiter | None): 指定した場合、サーバーの負荷に合わせて送信レートを調整します。
+            block_cache (BlockCache | None): 指定した場合、setblock/fillで設置したブロックを記憶し、
+                set_block/set_blocksで同じブロックの再設置を送信せずに省略します。
+                batchやsend_command/send_commandsで送信したコマンドもキャッシュに反映します。
+            block_id_validator (BlockIdValidator | None): 指定した場合、set_block/fillなどで
+                ブロックIDを送信前に検証し、存在しないIDはValueErrorにします。
+            timeout (float): 接続とレスポンスの受信を待つ時間の上限(秒)
+            reconnect_policy (ReconnectPolicy | None): 指定した場合、接続が切れると再接続・再認証し、
+                応答が届かなかった冪等なコマンドを再送します。
+        """
+        super().__init__(
+            host, port, password, window, rate_limiter, timeout, reconnect_policy
+        )
+        self.block_cache = block_cache
+        self.block_id_validator = block_id_validator
+        # 送信した全てのコマンドをブロックキャッシュに反映する
+        self.instrumentation.add_pre_hook(self.__forget_blocks)
+        self.instrumentation.add_post_hook(self.__record_blocks)
+
+    def __forget_blocks(self, command: str):
+        if self.block_cache is not None:
+            self.block_cache.forget(command)
+
+    def __record_blocks(self, command: str, response: str, ok: bool, elapsed: float):
+        if self.block_cache is not None:
+            self.block_cache.record(command, response)
+
+    def __cached_pos(self, pos: Player | Pos | str) -> Pos | None:
+        """ブロックキャッシュの対象となる座標を返します。"""
+        if self.block_cache is None or isinstance(pos, str):
+            # 文字列の座標は相対座標(~)の場合があるため記憶しない
+            return None
+        if isinstance(pos, Player):
+            return pos.int_pos
+        return pos
 
     def get_player_list(self) -> list[str]:
         """マインクラフトサーバーのプレイヤーリストを取得します。
@@ -14,17 +70,21 @@ class PyCraftCommander(RCON):
         -------
             list[str]: プレイヤーリスト
         """
-        response, status = self.send_command("list")
+        response, status = self.send_command(commands.player_list())
         if not status:
             return []
-        return sorted(response.split(": ")[1].split(", "))
+        return commands.parse_player_list(response)
 
-    def get_player_info(self, player_name: str) -> Player:
+    def get_player_info(self, player_name: str, snapshot: bool = False) -> Player:
         """プレイヤーの情報を取得します。
 
         Args:
         -----
             player (str): プレイヤー名
+            snapshot (bool): Trueの場合、エンティティデータ全体を1回のコマンドで取得して解析します。
+                Falseの場合は座標・ディメンション・ゲームモードを別々のコマンドで取得します。
+                どちらの場合もディメンションは"minecraft:overworld"のような文字列、
+                ゲームモードはGameModeで返します。
 
         Returns:
         -------
@@ -44,30 +104,63 @@ class PyCraftCommander(RCON):
         print(f"ゲームモード:{p.gamemode}")
         ```
         """
-        response, status = self.send_command(f"data get entity {player_name} Pos")
+        if snapshot:
+            response, status = self.send_command(
+                commands.player_data(player_name), multi_packet=True
+            )
+            if not status:
+                return None
+            return commands.parse_player_data(player_name, response)
+
+        response, status = self.send_command(commands.player_pos(player_name))
         if not status:
             return None
-        pos = response.split(": ")[-1]
-        pos = pos.translate(str.maketrans("", "", "[]")).split(", ")
-
-        x, y, z = float(pos[0][:-1]), float(pos[1][:-1]), float(pos[2][:-1])
+        pos = commands.parse_player_pos(response)
 
-        response, status = self.send_command(f"data get entity {player_name} Dimension")
+        response, status = self.send_command(commands.player_dimension(player_name))
         if not status:
             return None
-        dimension = response.split(" ")[-1]
+        dimension = commands.parse_player_dimension(response)
 
-        response, status = self.send_command(
-            f"data get entity {player_name} playerGameType"
-        )
+        response, status = self.send_command(commands.player_gamemode(player_name))
         if not status:
             return None
-        gamemode = response.split(" ")[-1]
+        gamemode = commands.parse_player_gamemode(response)
 
         return Player(
-            player_name, Pos(x, y, z), Pos(int(x), int(y), int(z)), dimension, gamemode
+            player_name,
+            pos,
+            Pos(int(pos.x), int(pos.y), int(pos.z)),
+            dimension,
+            gamemode,
         )
 
+    def get_all_player_info(self) -> list[Player]:
+        """ログイン中の全てのプレイヤーの情報を取得します。
+
+        プレイヤーごとのエンティティデータの取得をパイプラインでまとめて送信するため、
+        プレイヤー数によらずおおよそ2回の往復で完了します。
+
+        Returns:
+        -------
+            list[Player]: プレイヤーオブジェクトのリスト(取得できなかったプレイヤーは含みません)
+        """
+        player_list = [name for name in self.get_player_list() if name]
+        results = self.send_commands(
+            (commands.player_data(name) for name in player_list), multi_packet=True
+        )
+
+        players = []
+        for player_name, (response, status) in zip(player_list, results):
+            if not status:
+                continue
+            try:
+                players.append(commands.parse_player_data(player_name, response))
+            except (ValueError, KeyError):
+                # 取得の間にログアウトした場合などはエラーメッセージが返る
+                continue
+        return players
+
     def get_seed(self) -> int:
         """ワールドのシードを取得します。
 
@@ -75,8 +168,8 @@ class PyCraftCommander(RCON):
         -------
             int: シード
         """
-        response, status = self.send_command("seed")
-        return int(response.split(": ")[1][1:-1])
+        response, status = self.send_command(commands.seed())
+        return commands.parse_seed(response)
 
     def set_world_spawn(self, pos: Player | Pos | str, angle: float = 0.0) -> str:
         """ワールドのスポーン地点を設定します。
@@ -89,9 +182,7 @@ class PyCraftCommander(RCON):
         -------
             str: レスポンスメッセージ
         """
-        if isinstance(pos, Player):
-            pos = pos.int_pos
-        response, status = self.send_command(f"setworldspawn {pos} {angle}")
+        response, status = self.send_command(commands.set_world_spawn(pos, angle))
         return response
 
     def set_spawn_point(self, pos: Player | Pos | str, angle: float = 0.0) -> str:
@@ -105,9 +196,7 @@ class PyCraftCommander(RCON):
         -------
             str: レスポンスメッセージ
         """
-        if isinstance(pos, Player):
-            pos = pos.int_pos
-        response, status = self.send_command(f"spawnpoint {pos} {angle}")
+        response, status = self.send_command(commands.set_spawn_point(pos, angle))
         return response
 
     def tp(self, from_: str | Player, to: str | Player) -> str:
@@ -124,12 +213,8 @@ class PyCraftCommander(RCON):
         """
         if from_ == to and (from_ not in "@" or to not in "@"):
             return "同じプレイヤーにはテレポートできません。"
-        if isinstance(from_, Player):
-            from_ = from_.name
-        if isinstance(to, Player):
-            to = to.name
 
-        response, status = self.send_command(f"tp {from_} {to}")
+        response, status = self.send_command(commands.tp(from_, to))
         return response
 
     def set_block(
@@ -147,14 +232,92 @@ class PyCraftCommander(RCON):
 
         Returns:
         -------
-            str: レスポンスメッセージ
+            str: レスポンスメッセージ。ブロックキャッシュにより省略した場合は空文字列
         """
-        if isinstance(pos, Player):
-            pos = pos.int_pos
-
-        response, status = self.send_command(f"setblock {pos} {block_id} {mode}")
+        if self.block_id_validator is not None:
+            self.block_id_validator.validate(block_id)
+        cached_pos = self.__cached_pos(pos)
+        if (
+            cached_pos is not None
+            and mode == "replace"
+            and self.block_cache.get(cached_pos) == block_id
+        ):
+            return ""
+
+        response, status = self.send_command(commands.set_block(pos, block_id, mode))
         return response
 
+    def set_blocks(
+        self,
+        blocks: Iterable[tuple[Player | Pos | str, str]],
+        mode: Literal["replace", "keep", "destroy"] = "replace",
+    ) -> list[str]:
+        """複数のブロックをパイプラインでまとめて設置します。
+
+        set_blockをループで呼ぶ場合と異なり、1ブロックごとにレスポンスを待ちません。
+
+        Args:
+        -----
+            blocks (Iterable[tuple[Player | Pos | str, str]]): (座標, ブロックID)のリスト
+            mode: モード
+
+        Returns:
+        -------
+            list[str]: ブロックごとのレスポンスメッセージ。ブロックキャッシュにより省略した場合は空文字列
+        """
+        blocks = list(blocks)
+        if self.block_id_validator is not None:
+            # 1つでも誤ったIDがあれば何も送信しない
+            self.block_id_validator.validate_all(block_id for pos, block_id in blocks)
+        cached = [self.__cached_pos(pos) for pos, block_id in blocks]
+        # ブロックキャッシュと同じブロックは送信しない
+        targets = [
+            i
+            for i, (pos, block_id) in enumerate(blocks)
+            if not (
+                cached[i] is not None
+                and mode == "replace"
+                and self.block_cache.get(cached[i]) == block_id
+            )
+        ]
+
+        responses = [""] * len(blocks)
+        results = self.send_commands(
+            commands.set_block(*blocks[i], mode) for i in targets
+        )
+        for i, (response, status) in zip(targets, results):
+            responses[i] = response
+        return responses
+
+    def batch(self, window: int = 1024, multi_packet: bool = False) -> Batch:
+        """コマンドをまとめて送信するバッチを作成します。
+
+        withブロック内で追加したコマンドは、ブロックを抜けるときに1回の書き込みで送信され、
+        レスポンスは追加した順にBatch.resultsに格納されます。
+
+        Args:
+        -----
+            window (int): 1回の書き込みで送信するコマンド数の上限
+            multi_packet (bool): 複数のパケットに分割されたレスポンスを結合するか
+
+        Returns:
+        -------
+            Batch: バッチ
+
+        Example:
+        --------
+        ```python
+        with server.batch() as b:
+            b.set_block(pos, MCID.DIAMOND_BLOCK)
+            b.fill(pos1, pos2, MCID.STONE)
+            b.say("done")
+
+        for response, status in b.results:
+            print(response, status)
+        ```
+        """
+        return Batch(self, window, multi_packet)
+
     def fill(
         self,
         pos1: Player | Pos | str,
@@ -175,14 +338,65 @@ class PyCraftCommander(RCON):
         -------
             str: レスポンスメッセージ
         """
-        if isinstance(pos1, Player):
-            pos1 = pos1.pos
-        if isinstance(pos2, Player):
-            pos2 = pos2.pos
-
-        response, status = self.send_command(f"fill {pos1} {pos2} {block_id} {mode}")
+        if self.block_id_validator is not None:
+            self.block_id_validator.validate(block_id)
+        response, status = self.send_command(commands.fill(pos1, pos2, block_id, mode))
         return response
 
+    def fill_voxels(
+        self,
+        voxels: Sequence,
+        origin: Player | Pos,
+        palette: Sequence[str] | dict | None = None,
+        skip: Any = None,
+        mode: Literal["replace", "keep", "destroy"] = "replace",
+        shape: tuple[int, int, int] | None = None,
+    ) -> list[str]:
+        """3次元のブロック配列を設置します。
+
+        同じブロックが並ぶ範囲を直方体にまとめ、ブロックごとのsetblockの代わりに
+        fillコマンドをパイプラインで送信します。
+
+        Args:
+        -----
+            voxels (Sequence): [x][y][z]でアクセスできるブロックIDまたはパレットのインデックスの配列
+                (NumPy配列も可)、またはshapeを指定した場合は[x][y][z]順の1次元のバッファ
+            origin (Player | Pos): voxels[0][0][0]を設置する座標
+            palette (Sequence[str] | dict | None): インデックスからブロックIDへの対応
+            skip (Any): 設置しない値(Noneや空気のインデックスなど)
+            mode: モード
+            shape (tuple[int, int, int] | None): 1次元のバッファを渡す場合の(x, y, z)の大きさ
+
+        Returns:
+        -------
+            list[str]: コマンドごとのレスポンスメッセージ
+
+        Example:
+        --------
+        ```python
+        palette = [None, MCID.STONE, MCID.GLASS]
+        voxels = numpy.zeros((16, 16, 16), dtype=numpy.uint8)
+        voxels[:, 0, :] = 1
+        server.fill_voxels(voxels, Pos(0, 64, 0), palette, skip=0)
+        ```
+        """
+        if isinstance(origin, Player):
+            origin = origin.int_pos
+
+        boxes = greedy_boxes(voxels, skip=skip, shape=shape)
+        if not boxes:
+            # 空の配列や全てskipの値の場合は何も送信しない
+            return []
+        if self.block_id_validator is not None:
+            values = {box.value for box in boxes}
+            self.block_id_validator.validate_all(
+                values if palette is None else (palette[value] for value in values)
+            )
+        results = self.send_commands(
+            box_command(box, origin, palette, mode) for box in boxes
+        )
+        return [response for response, status in results]
+
     def gamemode(
         self,
         mode: (
@@ -201,10 +415,7 @@ class PyCraftCommander(RCON):
         -------
             str: レスポンスメッセージ
         """
-        if isinstance(target, Player):
-            target = target.name
-
-        response, status = self.send_command(f"gamemode {mode} {target}")
+        response, status = self.send_command(commands.gamemode(mode, target))
         return response
 
     def give(self, target: str | Player, item: str, count: int = 1) -> str:
@@ -220,10 +431,7 @@ class PyCraftCommander(RCON):
         -------
             str: レスポンスメッセージ
         """
-        if isinstance(target, Player):
-            target = target.name
-
-        response, status = self.send_command(f"give {target} {item} {count}")
+        response, status = self.send_command(commands.give(target, item, count))
         return response
 
     def clear(self, target: str | Player, item: str = "") -> str:
@@ -238,10 +446,7 @@ class PyCraftCommander(RCON):
         -------
             str: レスポンスメッセージ
         """
-        if isinstance(target, Player):
-            target = target.name
-
-        response, status = self.send_command(f"clear {target} {item}")
+        response, status = self.send_command(commands.clear(target, item))
         return response
 
     def difficulty(
@@ -257,7 +462,7 @@ class PyCraftCommander(RCON):
         -------
             str: レスポンスメッセージ
         """
-        response, status = self.send_command(f"difficulty {difficulty}")
+        response, status = self.send_command(commands.difficulty(difficulty))
         return response
 
     def effect_clear(self, target: str | Player, effect: str) -> str:
@@ -271,10 +476,7 @@ class PyCraftCommander(RCON):
         -------
             str: レスポンスメッセージ
         """
-        if isinstance(target, Player):
-            target = target.name
-
-        response, status = self.send_command(f"effect clear {target} {effect}")
+        response, status = self.send_command(commands.effect_clear(target, effect))
         return response
 
     def effect_give(
@@ -299,11 +501,8 @@ class PyCraftCommander(RCON):
         -------
             str: レスポンスメッセージ
         """
-        if isinstance(target, Player):
-            target = target.name
-
         response, status = self.send_command(
-            f"effect give {target} {effect} {seconds} {level} {hideParticles}"
+            commands.effect_give(target, effect, seconds, level, hideParticles)
         )
         return response
 
@@ -327,11 +526,8 @@ class PyCraftCommander(RCON):
         -------
             str: レスポンスメッセージ
         """
-        if isinstance(target, Player):
-            target = target.name
-
         response, status = self.send_command(
-            f"effect give {target} {effect} infinite {level} {hideParticles}"
+            commands.effect_give_infinite(target, effect, level, hideParticles)
         )
         return response
 
@@ -348,10 +544,9 @@ class PyCraftCommander(RCON):
         -------
             str: レスポンスメッセージ
         """
-        if isinstance(target, Player):
-            target = target.name
-
-        response, status = self.send_command(f"enchant {target} {enchantment} {level}")
+        response, status = self.send_command(
+            commands.enchant(target, enchantment, level)
+        )
         return response
 
     def kill(self, target: str | Player) -> str:
@@ -365,10 +560,7 @@ class PyCraftCommander(RCON):
         -------
             str: レスポンスメッセージ
         """
-        if isinstance(target, Player):
-            target = target.name
-
-        response, status = self.send_command(f"kill {target}")
+        response, status = self.send_command(commands.kill(target))
         return response
 
     # def forceload_add(
@@ -511,7 +703,7 @@ class PyCraftCommander(RCON):
         -------
             str: レスポンスメッセージ
         """
-        response, status = self.send_command(f"say {message}")
+        response, status = self.send_command(commands.say(message))
         return response
 
     def message(self, target: str | Player, message: str) -> str:
@@ -526,8 +718,5 @@ class PyCraftCommander(RCON):
         -------
             str: レスポンスメッセージ
         """
-        if isinstance(target, Player):
-            target = target.name
-
-        response, status = self.send_command(f"msg {target} {message}")
+        response, status = self.send_command(commands.message(target, message))
         return response
@@ -1,29 +1,70 @@
 import socket
-import struct
-import random
+import time
+from collections import deque
+from typing import Callable, Iterable, Iterator
+from PyCraftCommander.instrumentation import Instrumentation
+from PyCraftCommander.protocol import PacketEncoder, PacketReader
+from PyCraftCommander.reconnect import ReconnectPolicy
+from PyCraftCommander.throttle import AdaptiveRateLimiter, parse_tick_query
 from PyCraftCommander.types.packet import Packet, PacketType
 
+# 応答を待っているコマンドがないパケットを保留しておく時間(秒)と件数の上限
+PARKED_TTL = 30.0
+PARKED_LIMIT = 1024
+
 
 class RCON:
     """RCONプロトコルを用いてMinecraftサーバーにコマンドを送信するためのクラス"""
 
-    # 4バイトの符号付き整数フォーマット
-    __i32 = struct.Struct("<i")
-    # responseパケットの構造
-    __res_struct = struct.Struct("<iii")
-
-    def __init__(self, host, port, password):
+    def __init__(
+        self,
+        host,
+        port,
+        password,
+        window: int = 64,
+        rate_limiter: AdaptiveRateLimiter | None = None,
+        timeout: float = 5.0,
+        reconnect_policy: ReconnectPolicy | None = None,
+    ):
         self.__host = host
         self.__port = port
         self.__password = password
+        # パイプライン送信時に同時に応答待ちにできるコマンド数
+        self.__window = window
+        # 指定した場合、コマンドの送信レートをサーバーの負荷に合わせて調整する
+        self.rate_limiter = rate_limiter
+        # コマンドのレイテンシや送受信バイト数を記録する
+        self.instrumentation = Instrumentation()
+        # 指定した場合、接続が切れたときに再接続して送信を続ける
+        self.reconnect_policy = reconnect_policy
+        # 接続と受信の待ち時間の上限(秒)
+        self.__timeout = timeout
+        # 再接続時に認証し直すか
+        self.__authenticated = False
+        # 再接続してから応答を受け取るまでの間、次の再接続で使う待ち時間
+        # (接続してもすぐに切れる場合に、待ち時間を伸ばし続けるため)
+        self.__reconnect_delays: Iterator[float] | None = None
+        # 他のコマンドへの応答を待っている間に届いたパケット
+        # リクエストID -> (保留した時刻, パケット)。古いものから順に並ぶ
+        self.__parked: dict[int, tuple[float, list[Packet]]] = {}
+        self.parked_ttl = PARKED_TTL
+        self.parked_limit = PARKED_LIMIT
+        self.__connect()
+
+    def __connect(self):
+        """サーバーに接続します。"""
         self.__socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        self.__socket.settimeout(self.__timeout)
         try:
             self.__socket.connect((self.__host, int(self.__port)))
-            self.__socket.settimeout(5.0)
         except ConnectionRefusedError:
             raise ConnectionRefusedError(
                 "サーバーに接続できませんでした。\nサーバが起動していてホスト名とポート番号が正しいか確認してください。"
             )
+        self.__reader = PacketReader(self.__socket)
+        self.__encoder = PacketEncoder()
+        # 新しい接続ではリクエストIDを1から払い出すため、前の接続のパケットは捨てる
+        self.__parked.clear()
 
     def __enter__(self):
         return self
@@ -37,7 +78,45 @@ class RCON:
     def auth(self):
         """RCON認証を行います。"""
         response_id = self.send_packet(PacketType.SERVERDATA_AUTH, self.__password)
-        return self.__auth_response(response_id)
+        self.__authenticated = self.__auth_response(response_id)
+        return self.__authenticated
+
+    def reconnect(self):
+        """サーバーに接続し直し、認証済みだった場合は再度認証します。
+
+        reconnect_policyを指定した場合は、失敗しても待ち時間を伸ばしながら再試行します。
+        前回の再接続の後にsend_commandsが応答を受け取っていない場合は、前回の待ち時間と
+        試行回数を引き継ぎます。
+        """
+        self.__socket.close()
+        policy = self.reconnect_policy
+        delays = self.__reconnect_delays
+        if policy is None:
+            delays = iter(())
+        elif delays is None:
+            delays = self.__reconnect_delays = policy.delays()
+        else:
+            # 再接続した接続がすぐに切れた場合は、待ってから接続する
+            delay = next(delays, None)
+            if delay is None:
+                # 諦めた場合は、次に呼ばれたときに最初から数え直す
+                self.__reconnect_delays = None
+                raise ConnectionError("再接続の試行回数が上限に達しました。")
+            time.sleep(delay)
+        while True:
+            try:
+                self.__connect()
+                if self.__authenticated:
+                    self.auth()
+                break
+            except OSError:
+                self.__socket.close()
+                delay = next(delays, None)
+                if delay is None:
+                    self.__reconnect_delays = None
+                    raise
+                time.sleep(delay)
+        self.instrumentation.reconnects += 1
 
     def __auth_response(self, request_id: int):
         """RCON認証のレスポンスを受信します。"""
@@ -51,47 +130,263 @@ class RCON:
         raise Exception("RCON認証に失敗しました。\nパスワードが間違っているようです。")
 
     def server_response_value(self, request_id: int):
-        """サーバーからのレスポンスを受信します。"""
-        packet: Packet = self.receive_packet()
-        # -----------------------------------
-        # debug only
-        # print(f"Packet Size: {packet.size}")
-        # print(f"Request ID: {packet.request_id}")
-        # print(f"Type: {packet.type}")
-        # print(f"Body: {packet.body}")
-        # -----------------------------------
-        if packet.request_id == request_id:
-            return (packet.body.decode("utf-8"), True)
-        return ("", False)
-
-    def send_command(self, command) -> tuple[str, bool]:
-        """マインクラフトサーバーにコマンドを送信します。"""
-        request_id = self.send_packet(PacketType.SERVERDATA_EXECCOMMAND, command)
-        return self.server_response_value(request_id)
-
-    def send_packet(self, type: int, body: str) -> bytes:
-        """パケットを送信し、リクエストIDを返します。"""
-        # パケットのサイズは、12バイトのヘッダーと2バイトの終端文字を含む
-        # リトルエンディアンでパックする
-        # size | ID | Type | Body + Null | Null
-        # 4    | 4  | 4    | size + 1    | 1
+        """サーバーからのレスポンスを受信します。
 
-        body: bytes = body.encode("utf-8")
-        type: bytes = self.__i32.pack(int(type))
+        他のリクエストIDのパケット(タイムアウトしたコマンドへの遅れた応答など)を
+        受信した場合は、捨てずに保留してrequest_idのパケットが届くまで受信を続けます。
+        保留したパケットは、後でそのリクエストIDを指定して呼び出すと返されます。
+        """
+        parked = self.__parked.pop(request_id, None)
+        if parked is not None:
+            # 複数のパケットに分割された応答は結合する
+            data = b"".join(packet.body for packet in parked[1])
+        else:
+            while True:
+                packet: Packet = self.receive_packet()
+                if packet.request_id == request_id:
+                    break
+                self.__park(packet)
+            data = packet.body
+        started = time.perf_counter()
+        body = data.decode("utf-8")
+        self.instrumentation.phases["decode"] += time.perf_counter() - started
+        return (body, True)
+
+    def __park(self, packet: Packet):
+        """応答を待っているコマンドがないパケットを保留し、古いものを捨てます。"""
+        self.instrumentation.mismatched_ids += 1
+        now = time.monotonic()
+        entry = self.__parked.get(packet.request_id)
+        if entry is None:
+            self.__parked[packet.request_id] = (now, [packet])
+        else:
+            entry[1].append(packet)
+        while self.__parked:
+            request_id, (parked_at, _) = next(iter(self.__parked.items()))
+            if (
+                now - parked_at < self.parked_ttl
+                and len(self.__parked) <= self.parked_limit
+            ):
+                break
+            del self.__parked[request_id]
+
+    def stats(self) -> dict:
+        """コマンドの動詞ごとのレイテンシや送受信バイト数などの集計結果を返します。
+
+        Returns:
+        -------
+            dict: 集計結果。時間の単位は秒です。
+        """
+        return self.instrumentation.snapshot()
+
+    def send_command(
+        self, command, multi_packet: bool = False, idempotent: bool | None = None
+    ) -> tuple[str, bool]:
+        """マインクラフトサーバーにコマンドを送信します。
+
+        Args:
+        -----
+            command (str): コマンド
+            multi_packet (bool): レスポンスが複数のパケットに分割される場合(大きなdata getなど)にTrueを指定します。
+            idempotent (bool | None): reconnect_policyを指定した場合に、応答が届く前に接続が切れたら
+                再送してよいか。Noneの場合はreconnect_policyの判定に従います。
+        """
+        if (
+            multi_packet
+            or self.rate_limiter is not None
+            or self.reconnect_policy is not None
+        ):
+            return self.send_commands(
+                [command], multi_packet=multi_packet, idempotent=idempotent
+            )[0]
+        instrumentation = self.instrumentation
+        instrumentation.before_command(command)
+        started = time.perf_counter()
+        instrumentation.in_flight = 1
+        try:
+            request_id = self.send_packet(PacketType.SERVERDATA_EXECCOMMAND, command)
+            body, ok = self.server_response_value(request_id)
+        finally:
+            instrumentation.in_flight = 0
+        instrumentation.after_command(command, body, ok, time.perf_counter() - started)
+        return (body, ok)
 
-        packet_size: bytes = self.__i32.pack(len(body) + 10)
+    def send_commands(
+        self,
+        commands: Iterable[str],
+        window: int | None = None,
+        multi_packet: bool = False,
+        idempotent: bool | Callable[[str], bool] | None = None,
+    ) -> list[tuple[str, bool]]:
+        """複数のコマンドをパイプラインで送信します。
 
-        # ランダムなパケットIDを生成(4バイトの符号付き整数) 2147483647
-        ramdom_id = random.randint(0, 2147483647)
-        request_id: bytes = self.__i32.pack(ramdom_id)
+        レスポンスを待たずに最大window個のコマンドを連続して送信し、
+        受信したレスポンスはリクエストIDでコマンドに対応付けます。
 
-        packet: bytes = packet_size + request_id + type + body + b"\x00\x00"
-        self.__socket.sendall(packet)
-        return ramdom_id
+        reconnect_policyを指定した場合、接続が切れると再接続して残りのコマンドを送信します。
+        応答を受け取ったコマンドは再送せず、応答が届かなかったコマンドは冪等なものだけを
+        再送します。再送しなかったコマンドの結果は("", False)です。
+
+        Args:
+        -----
+            commands (Iterable[str]): コマンドのリスト
+            window (int | None): 同時に応答待ちにできるコマンド数。Noneの場合は初期化時の値
+            multi_packet (bool): 複数のパケットに分割されたレスポンスを結合するか
+            idempotent (bool | Callable[[str], bool] | None): 応答が届く前に接続が切れた場合に
+                再送してよいか。コマンドを受け取る関数も指定できます。Noneの場合はreconnect_policyの判定に従います。
+
+        Returns:
+        -------
+            list[tuple[str, bool]]: コマンドと同じ順序のレスポンスと成否
+        """
+        commands = list(commands)
+        window = window or self.__window
+        results: list[tuple[str, bool]] = [("", False)] * len(commands)
+        # リクエストID -> コマンドのインデックス
+        pending: dict[int, int] = {}
+        # multi_packet時、終端確認用パケットのID -> コマンドのリクエストID
+        sentinels: dict[int, int] = {}
+        # multi_packet時、コマンドのインデックス -> 受信済みの本文
+        bodies: dict[int, list[bytes]] = {}
+        # リクエストID -> 送信時刻
+        sent_at: dict[int, float] = {}
+        tick_query_id: int | None = None
+        limiter = self.rate_limiter
+        instrumentation = self.instrumentation
+        phases = instrumentation.phases
+        policy = self.reconnect_policy
+        if idempotent is None:
+            idempotent = policy.idempotent if policy is not None else False
+        if not callable(idempotent):
+            replay_all = idempotent
+
+            def idempotent(command: str) -> bool:
+                return replay_all
+
+        # 送信するコマンドのインデックス
+        queue = deque(range(len(commands)))
+
+        while queue or pending or tick_query_id is not None:
+            try:
+                if (
+                    limiter is not None
+                    and tick_query_id is None
+                    and queue
+                    and limiter.tick_query_due()
+                ):
+                    tick_query_id = self.__add(
+                        PacketType.SERVERDATA_EXECCOMMAND, "tick query"
+                    )
+
+                # 送信できるだけのパケットをバッファに溜めてから1回で書き込む
+                while queue and len(pending) < window:
+                    if limiter is not None and not limiter.try_acquire():
+                        if pending or tick_query_id is not None:
+                            # トークンが溜まるまでの間にレスポンスを受信する
+                            break
+                        self.__flush()
+                        limiter.acquire()
+                    index = queue.popleft()
+                    instrumentation.before_command(commands[index])
+                    started = time.perf_counter()
+                    request_id = self.__add(
+                        PacketType.SERVERDATA_EXECCOMMAND, commands[index]
+                    )
+                    pending[request_id] = index
+                    if multi_packet:
+                        # サーバーはパケットを順番に処理するため、コマンドの直後に送った
+                        # 空のパケットへの応答が届いた時点でレスポンスが全て揃っている
+                        sentinel_id = self.__add(
+                            PacketType.SERVERDATA_RESPONSE_VALUE, ""
+                        )
+                        sentinels[sentinel_id] = request_id
+                        bodies[index] = []
+                    sent_at[request_id] = started
+                self.__flush()
+                instrumentation.in_flight = len(pending)
+                instrumentation.backlog = len(queue)
+
+                packet: Packet = self.receive_packet()
+                request_id = packet.request_id
+
+                if request_id == tick_query_id:
+                    tick_query_id = None
+                    mspt = parse_tick_query(packet.body.decode("utf-8"))
+                    if mspt is None:
+                        limiter.disable_tick_query()
+                    else:
+                        limiter.observe_tick(mspt)
+                elif request_id in pending and multi_packet:
+                    bodies[pending[request_id]].append(packet.body)
+                elif request_id in pending or request_id in sentinels:
+                    if multi_packet:
+                        request_id = sentinels.pop(request_id)
+                        body = b"".join(bodies.pop(pending[request_id]))
+                    else:
+                        body = packet.body
+                    index = pending.pop(request_id)
+                    started = time.perf_counter()
+                    response = body.decode("utf-8")
+                    finished = time.perf_counter()
+                    phases["decode"] += finished - started
+                    results[index] = (response, True)
+                    self.__reconnect_delays = None
+
+                    elapsed = finished - sent_at.pop(request_id)
+                    if limiter is not None:
+                        limiter.observe(elapsed)
+                    instrumentation.after_command(
+                        commands[index], response, True, elapsed
+                    )
+                else:
+                    self.__park(packet)
+            except OSError:
+                if policy is None:
+                    raise
+                # 応答が届かなかったコマンドのうち、冪等なものだけを先頭に戻して再送する
+                replay = sorted(
+                    index for index in pending.values() if idempotent(commands[index])
+                )
+                queue.extendleft(reversed(replay))
+                pending.clear()
+                sentinels.clear()
+                bodies.clear()
+                sent_at.clear()
+                tick_query_id = None
+                instrumentation.in_flight = 0
+                self.reconnect()
+
+        instrumentation.in_flight = 0
+        instrumentation.backlog = 0
+        return results
+
+    def __add(self, type: int, body: str) -> int:
+        """パケットを送信バッファに追加し、リクエストIDを返します。"""
+        started = time.perf_counter()
+        request_id = self.__encoder.add(type, body)
+        self.instrumentation.phases["encode"] += time.perf_counter() - started
+        return request_id
+
+    def __flush(self):
+        """送信バッファに溜まったパケットを送信します。"""
+        started = time.perf_counter()
+        self.instrumentation.bytes_sent += self.__encoder.flush(self.__socket)
+        self.instrumentation.phases["send"] += time.perf_counter() - started
+
+    def send_packet(self, type: int, body: str) -> int:
+        """パケットを送信し、リクエストIDを返します。"""
+        request_id = self.__add(type, body)
+        self.__flush()
+        return request_id
 
     def receive_packet(self) -> Packet:
         """パケットを受信し、Packetを返します"""
-        respone = self.__socket.recv(4096)
-        size, request_id, type = self.__res_struct.unpack(respone[:12])
-        body = respone[12:-2]
-        return Packet(size, request_id, type, body)
+        started = time.perf_counter()
+        try:
+            packet = self.__reader.read_packet()
+        except TimeoutError:
+            self.instrumentation.timeouts += 1
+            raise
+        self.instrumentation.phases["receive"] += time.perf_counter() - started
+        self.instrumentation.bytes_received += packet.size + 4
+        return packet
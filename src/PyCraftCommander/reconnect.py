@@ -0,0 +1,106 @@
+import random
+from typing import Callable, Iterator
+
+# 2回実行しても結果が変わらないコマンド(接続が切れて応答が届かなかった場合に再送する)
+IDEMPOTENT_COMMANDS = (
+    "setblock ",
+    "fill ",
+    "gamemode ",
+    "defaultgamemode ",
+    "difficulty ",
+    "setworldspawn",
+    "spawnpoint ",
+    "weather ",
+    "time set ",
+    "time query ",
+    "gamerule ",
+    "data get ",
+    "data merge ",
+    "list",
+    "seed",
+    "tick query",
+)
+
+
+# 座標を絶対座標で指定した場合だけ冪等なコマンド
+# (~や^の相対座標は実行した位置からの移動になり、@rは実行ごとに対象が変わる)
+ABSOLUTE_ONLY_COMMANDS = (
+    "tp ",
+    "teleport ",
+)
+
+
+def is_idempotent(command: str) -> bool:
+    """2回実行しても結果が変わらないコマンドかどうかを返します。
+
+    IDEMPOTENT_COMMANDSのいずれかで始まるコマンドと、~、^、@rを含まない
+    ABSOLUTE_ONLY_COMMANDSのコマンドが該当します。
+    destroyモードのsetblock/fillは、壊したブロックのアイテムを落とすため該当しません。
+    """
+    if command.startswith(("setblock ", "fill ")) and command.rstrip().endswith(
+        " destroy"
+    ):
+        return False
+    if command.startswith(ABSOLUTE_ONLY_COMMANDS):
+        return "~" not in command and "^" not in command and "@r" not in command
+    return command.startswith(IDEMPOTENT_COMMANDS)
+
+
+class ReconnectPolicy:
+    """接続が切れた場合に再接続する方法
+
+    RCONにreconnect_policyとして渡すと、ソケットの切断やタイムアウトを検出したときに
+    指数バックオフで再接続し、認証済みだった場合は再度認証してから送信を続けます。
+    再接続した後、応答を1つも受け取らないうちに再び切れた場合は、待ち時間と試行回数を
+    引き継ぎます。(max_attemptsは連続した再接続全体の上限です)
+
+    send_commandsでは、応答を受け取ったコマンドは再送しません。まだ送信していない
+    コマンドは再接続後に送信し、送信したが応答が届かなかったコマンドは、冪等な
+    コマンド(idempotentがTrueを返すもの)だけを再送します。それ以外のコマンドは
+    実行されたかどうか分からないため、結果を("", False)にします。
+
+    Example:
+    --------
+    ```python
+    policy = ReconnectPolicy(max_attempts=None, max_delay=60.0)
+    with PyCraftCommander(host, port, password, reconnect_policy=policy) as server:
+        server.auth()
+        # サーバーが再起動しても続きから設置される
+        server.send_commands(build_commands)
+    ```
+    """
+
+    def __init__(
+        self,
+        max_attempts: int | None = 10,
+        initial_delay: float = 0.5,
+        max_delay: float = 30.0,
+        multiplier: float = 2.0,
+        jitter: float = 0.1,
+        idempotent: Callable[[str], bool] = is_idempotent,
+    ):
+        """
+        Args:
+        -----
+            max_attempts (int | None): 再接続に失敗したときに待ってから再試行する回数の上限。Noneの場合は無制限
+            initial_delay (float): 最初の再接続までの待ち時間(秒)
+            max_delay (float): 再接続までの待ち時間の上限(秒)
+            multiplier (float): 失敗するごとに待ち時間に掛ける係数
+            jitter (float): 待ち時間に加えるランダムなばらつきの割合
+            idempotent (Callable[[str], bool]): 応答が届かなかった場合に再送してよいコマンドかを返す関数
+        """
+        self.max_attempts = max_attempts
+        self.initial_delay = initial_delay
+        self.max_delay = max_delay
+        self.multiplier = multiplier
+        self.jitter = jitter
+        self.idempotent = idempotent
+
+    def delays(self) -> Iterator[float]:
+        """再接続を試みる前に待つ時間(秒)を順番に返します。"""
+        delay = self.initial_delay
+        attempt = 0
+        while self.max_attempts is None or attempt < self.max_attempts:
+            yield delay * (1.0 + random.uniform(-self.jitter, self.jitter))
+            delay = min(self.max_delay, delay * self.multiplier)
+            attempt += 1
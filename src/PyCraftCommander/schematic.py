@@ -0,0 +1,448 @@
+"""schematicファイルを読み込み、fill/setblockコマンドで設置するモジュール
+
+対応形式:
+    - .nbt: バニラの構造物ファイル(ストラクチャーブロックで保存したもの)
+    - .schem: Sponge Schematic(バージョン2, 3)
+    - .litematic: Litematica
+
+gzipで圧縮されたNBTを先頭から順に読み込み、ブロックはブロックごとのPythonの
+オブジェクトにせず、パレットのインデックスの配列(bytes/array)のまま保持します。
+設置するときはy方向の層ごとに同じブロックの範囲を直方体にまとめ、
+コマンドを順番に生成して少しずつ送信するため、1000万ブロックの構造物でも
+メモリ使用量はファイルのブロック配列と1層分の作業領域程度に収まります。
+
+ブロックエンティティ(チェストの中身など)とエンティティは設置しません。
+
+Example:
+--------
+```python
+from PyCraftCommander.schematic import load_schematic, place_schematic
+
+schematic = load_schematic("castle.schem")
+print(schematic.size, len(schematic.palette()))
+sent, failed = place_schematic(server, schematic, Pos(0, 64, 0))
+```
+"""
+
+import sys
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Iterator, Literal, Sequence
+from PyCraftCommander.py_craft_commander import PyCraftCommander
+from PyCraftCommander.types import nbt
+from PyCraftCommander.types.mcid import GET_MCID, IdTable, MinecraftVersion
+from PyCraftCommander.types.player import Player, Pos
+from PyCraftCommander.voxel import box_command, send_streamed, stream_boxes
+
+# 設置しないブロック
+AIR_BLOCKS = frozenset(
+    {
+        "minecraft:air",
+        "minecraft:cave_air",
+        "minecraft:void_air",
+        "minecraft:structure_void",
+    }
+)
+
+
+def block_state(name: str, properties: dict | None = None) -> str:
+    """ブロックIDと状態からminecraft:oak_stairs[facing=east]の形式の文字列を返します。"""
+    if not properties:
+        return name
+    states = ",".join(f"{key}={value}" for key, value in properties.items())
+    return f"{name}[{states}]"
+
+
+@dataclass
+class Region:
+    """schematic内の1つの直方体の領域
+
+    blocksは[y][z][x]の順(xが最も速く変わる)に並んだパレットのインデックスで、
+    bitsが0の場合はbytesまたはarray、bitsが正の場合はLitematicaの形式で
+    1要素あたりbitsビットに詰めたlongの配列です。
+    """
+
+    # schematicの原点からの領域の最小の角の位置
+    offset: tuple[int, int, int]
+    # (x, y, z)の大きさ
+    size: tuple[int, int, int]
+    # インデックス -> ブロックの状態。Noneは何も置かない位置(構造物の空白)
+    palette: list[str | None]
+    blocks: Sequence[int]
+    bits: int = 0
+
+    @property
+    def volume(self) -> int:
+        sx, sy, sz = self.size
+        return sx * sy * sz
+
+    def layers(self) -> Iterator[Iterator[Sequence[int]]]:
+        """yの小さい順に、層ごとのz方向の行(x方向のインデックスの並び)を返します。"""
+        sx, sy, sz = self.size
+        for y in range(sy):
+            yield self.__rows(y)
+
+    def __rows(self, y: int) -> Iterator[Sequence[int]]:
+        sx, sy, sz = self.size
+        if self.bits == 0:
+            view = memoryview(self.blocks) if isinstance(self.blocks, bytes) else None
+            for z in range(sz):
+                start = (y * sz + z) * sx
+                if view is not None:
+                    yield view[start : start + sx]
+                else:
+                    yield self.blocks[start : start + sx]
+            return
+
+        bits = self.bits
+        mask = (1 << bits) - 1
+        for z in range(sz):
+            start = (y * sz + z) * sx * bits
+            first = start >> 6
+            last = (start + sx * bits - 1) >> 6
+            # 行にかかるlongをまとめて1つの整数にしてから取り出す
+            words = array("q", self.blocks[first : last + 1])
+            if sys.byteorder != "little":
+                words.byteswap()
+            packed = int.from_bytes(words.tobytes(), "little") >> (start & 63)
+            yield [(packed >> (x * bits)) & mask for x in range(sx)]
+
+
+@dataclass
+class Schematic:
+    """読み込んだschematic"""
+
+    format: Literal["nbt", "schem", "litematic"]
+    regions: list[Region] = field(default_factory=list)
+
+    @property
+    def size(self) -> tuple[int, int, int]:
+        """全ての領域を囲む直方体の(x, y, z)の大きさ"""
+        if not self.regions:
+            return (0, 0, 0)
+        low = [min(r.offset[i] for r in self.regions) for i in range(3)]
+        high = [max(r.offset[i] + r.size[i] for r in self.regions) for i in range(3)]
+        return tuple(h - l for l, h in zip(low, high))
+
+    @property
+    def volume(self) -> int:
+        """全ての領域のブロック数(空気を含む)"""
+        return sum(region.volume for region in self.regions)
+
+    def palette(self) -> list[str]:
+        """全ての領域で使われているブロックの状態"""
+        states = {}
+        for region in self.regions:
+            states.update(dict.fromkeys(s for s in region.palette if s is not None))
+        return list(states)
+
+
+def _decode_varints(data: bytes, count: int) -> Sequence[int]:
+    """Sponge SchematicのBlockData(可変長整数の並び)を展開します。"""
+    if len(data) == count:
+        # 要素数とバイト数が等しければ全て1バイトなので、そのまま使用する
+        return data
+    values = array("I")
+    value = 0
+    shift = 0
+    for byte in data:
+        value |= (byte & 0x7F) << shift
+        if byte & 0x80:
+            shift += 7
+        else:
+            values.append(value)
+            value = 0
+            shift = 0
+    if len(values) != count:
+        raise ValueError("BlockDataの長さがschematicの大きさと一致しません。")
+    return values
+
+
+def _read_palette_list(reader: nbt.NBTReader) -> list[str]:
+    """{Name, Properties}のリストからブロックの状態のリストを読み込みます。"""
+    element_type, length = reader.read_list_header()
+    palette = []
+    for _ in range(length):
+        entry = reader.read(element_type)
+        palette.append(block_state(entry["Name"], entry.get("Properties")))
+    return palette
+
+
+def _load_sponge(reader: nbt.NBTReader) -> Schematic:
+    width = height = length = 0
+    palette: dict[str, int] = {}
+    data = b""
+
+    def read_compound():
+        nonlocal width, height, length, palette, data
+        for type, name in reader.iter_compound():
+            if name == "Schematic" and type == nbt.TAG_COMPOUND:
+                # バージョン3はルートの中のSchematicに格納されている
+                read_compound()
+            elif name == "Blocks" and type == nbt.TAG_COMPOUND:
+                read_compound()
+            elif name == "Width":
+                width = reader.read(type) & 0xFFFF
+            elif name == "Height":
+                height = reader.read(type) & 0xFFFF
+            elif name == "Length":
+                length = reader.read(type) & 0xFFFF
+            elif name == "Palette" and type == nbt.TAG_COMPOUND:
+                palette = reader.read(type)
+            elif name in ("BlockData", "Data") and type == nbt.TAG_BYTE_ARRAY:
+                data = reader.read(type)
+            else:
+                reader.skip(type)
+
+    read_compound()
+    states: list[str | None] = [None] * (max(palette.values(), default=-1) + 1)
+    for state, index in palette.items():
+        states[index] = state
+    blocks = _decode_varints(data, width * height * length)
+    if len(blocks) != width * height * length:
+        raise ValueError("BlockDataの長さがschematicの大きさと一致しません。")
+    return Schematic(
+        "schem", [Region((0, 0, 0), (width, height, length), states, blocks)]
+    )
+
+
+def _load_structure(reader: nbt.NBTReader) -> Schematic:
+    size = (0, 0, 0)
+    palette: list[str] = []
+    # ブロックの(x, y, z)とパレットのインデックス
+    positions = array("i")
+    states = array("i")
+
+    for type, name in reader.iter_compound():
+        if name == "size":
+            size = tuple(reader.read(type))
+        elif name == "palette":
+            palette = _read_palette_list(reader)
+        elif name == "palettes":
+            # 複数のパレットがある場合(難破船など)は最初のものを使う
+            element_type, count = reader.read_list_header()
+            for i in range(count):
+                if i == 0:
+                    palette = _read_palette_list(reader)
+                else:
+                    reader.skip(element_type)
+        elif name == "blocks":
+            # ブロックのリストは要素ごとに読み込み、配列に詰める
+            element_type, count = reader.read_list_header()
+            for _ in range(count):
+                state = 0
+                pos = (0, 0, 0)
+                for value_type, key in reader.iter_compound():
+                    if key == "state":
+                        state = reader.read(value_type)
+                    elif key == "pos":
+                        pos = reader.read(value_type)
+                    else:
+                        reader.skip(value_type)
+                positions.extend(pos)
+                states.append(state)
+        else:
+            reader.skip(type)
+
+    sx, sy, sz = size
+    # 構造物の空白(ブロックが記録されていない位置)はパレットの末尾のNoneにする
+    void = len(palette)
+    blocks = array("I", [void]) * (sx * sy * sz)
+    for i, state in enumerate(states):
+        x, y, z = positions[i * 3 : i * 3 + 3]
+        blocks[(y * sz + z) * sx + x] = state
+    return Schematic("nbt", [Region((0, 0, 0), (sx, sy, sz), [*palette, None], blocks)])
+
+
+def _load_litematic(reader: nbt.NBTReader) -> Schematic:
+    schematic = Schematic("litematic")
+    for type, name in reader.iter_compound():
+        if name != "Regions" or type != nbt.TAG_COMPOUND:
+            reader.skip(type)
+            continue
+        for region_type, region_name in reader.iter_compound():
+            position = size = None
+            palette: list[str] = []
+            states = array("q")
+            for value_type, key in reader.iter_compound():
+                if key == "Position":
+                    position = reader.read(value_type)
+                elif key == "Size":
+                    size = reader.read(value_type)
+                elif key == "BlockStatePalette":
+                    palette = _read_palette_list(reader)
+                elif key == "BlockStates":
+                    states = reader.read(value_type)
+                else:
+                    reader.skip(value_type)
+            if position is None or size is None:
+                raise ValueError(f"領域{region_name}の位置または大きさがありません。")
+
+            # 大きさが負の場合は、位置から負の方向に広がっている
+            offset = []
+            dimensions = []
+            for axis in "xyz":
+                p, s = position[axis], size[axis]
+                offset.append(p if s >= 0 else p + s + 1)
+                dimensions.append(abs(s))
+            bits = max(2, (len(palette) - 1).bit_length())
+            schematic.regions.append(
+                Region(tuple(offset), tuple(dimensions), palette, states, bits)
+            )
+    return schematic
+
+
+def load_schematic(path) -> Schematic:
+    """schematicファイルを読み込みます。形式は拡張子で判断します。
+
+    Args:
+    -----
+        path: .nbt, .schem, .schematic(Sponge形式), .litematicのファイル
+
+    Returns:
+    -------
+        Schematic: 読み込んだschematic
+    """
+    suffix = Path(path).suffix.lower()
+    loaders = {
+        ".nbt": _load_structure,
+        ".schem": _load_sponge,
+        ".schematic": _load_sponge,
+        ".litematic": _load_litematic,
+    }
+    loader = loaders.get(suffix)
+    if loader is None:
+        raise ValueError(f"対応していない形式です。: {suffix}")
+    with nbt.open_nbt(path) as reader:
+        type, _ = reader.read_tag()
+        if type != nbt.TAG_COMPOUND:
+            raise ValueError("NBTのルートがコンパウンドではありません。")
+        return loader(reader)
+
+
+def map_palette(
+    palette: Sequence[str | None],
+    table: IdTable | None = None,
+    replace: dict[str, str] | None = None,
+    on_unknown: Literal["keep", "skip", "error"] = "keep",
+    skip_air: bool = True,
+) -> list[str | None]:
+    """schematicのパレットを設置するブロックの状態に対応付けます。
+
+    Args:
+    -----
+        palette (Sequence[str | None]): ブロックの状態のリスト
+        table (IdTable | None): ブロックIDを確認するGET_MCIDの表
+        replace (dict[str, str] | None): ブロックID(状態を除く)の置き換え。バージョン間で名前が変わった場合など
+        on_unknown: 表にないIDの扱い。"keep"はそのまま、"skip"は設置せず、"error"はValueError
+        skip_air (bool): 空気を設置しないか
+
+    Returns:
+    -------
+        list[str | None]: インデックス -> ブロックの状態。Noneは設置しない
+    """
+    result: list[str | None] = []
+    for state in palette:
+        if state is None:
+            result.append(None)
+            continue
+        name, bracket, properties = state.partition("[")
+        if ":" not in name:
+            name = f"minecraft:{name}"
+        if replace is not None:
+            name = replace.get(name, name)
+        if skip_air and name in AIR_BLOCKS:
+            result.append(None)
+        elif table is not None and name not in table:
+            if on_unknown == "error":
+                raise ValueError(
+                    f"バージョン{table.version}にないブロックIDです。: {name}"
+                )
+            result.append(state if on_unknown == "keep" else None)
+        else:
+            result.append(f"{name}{bracket}{properties}")
+    return result
+
+
+def schematic_fill_commands(
+    schematic: Schematic,
+    origin: Player | Pos,
+    version: MinecraftVersion | None = "1.21",
+    replace: dict[str, str] | None = None,
+    on_unknown: Literal["keep", "skip", "error"] = "keep",
+    skip_air: bool = True,
+    mode: Literal["replace", "keep", "destroy"] = "replace",
+) -> Iterator[str]:
+    """schematicを設置するfill/setblockコマンドを順番に返します。
+
+    Args:
+    -----
+        schematic (Schematic): load_schematicで読み込んだschematic
+        origin (Player | Pos): schematicの原点を設置する座標
+        version: パレットのブロックIDを確認するGET_MCIDのバージョン。Noneの場合は確認しません。
+        replace, on_unknown, skip_air: map_paletteを参照
+        mode: fill/setblockのモード
+
+    Returns:
+    -------
+        Iterator[str]: コマンド
+    """
+    if isinstance(origin, Player):
+        origin = origin.int_pos
+    table = GET_MCID(version) if version is not None else None
+    for region in schematic.regions:
+        block_ids = map_palette(region.palette, table, replace, on_unknown, skip_air)
+        region_origin = Pos(
+            int(origin.x) + region.offset[0],
+            int(origin.y) + region.offset[1],
+            int(origin.z) + region.offset[2],
+        )
+        # 設置しないインデックスが1つだけなら、直方体を作る段階で除く
+        skipped = [i for i, state in enumerate(block_ids) if state is None]
+        skip = skipped[0] if len(skipped) == 1 else None
+        for box in stream_boxes(region.layers(), skip):
+            if box.value < len(block_ids) and block_ids[box.value] is not None:
+                yield box_command(box, region_origin, block_ids, mode)
+
+
+def place_schematic(
+    server: PyCraftCommander,
+    schematic: Schematic | str | Path,
+    origin: Player | Pos,
+    version: MinecraftVersion | None = "1.21",
+    replace: dict[str, str] | None = None,
+    on_unknown: Literal["keep", "skip", "error"] = "keep",
+    skip_air: bool = True,
+    mode: Literal["replace", "keep", "destroy"] = "replace",
+    chunk_size: int = 4096,
+) -> tuple[int, int]:
+    """schematicを設置します。引数はschematic_fill_commandsと同じです。
+
+    Args:
+    -----
+        schematic (Schematic | str | Path): 読み込んだschematicまたはファイルのパス
+        chunk_size (int): 1回のパイプライン送信で送るコマンド数
+
+    Returns:
+    -------
+        tuple[int, int]: (送信したコマンド数, 失敗したコマンド数)
+    """
+    if not isinstance(schematic, Schematic):
+        schematic = load_schematic(schematic)
+    if isinstance(origin, Player):
+        origin = origin.int_pos
+    if server.block_id_validator is not None:
+        table = GET_MCID(version) if version is not None else None
+        for region in schematic.regions:
+            states = map_palette(region.palette, table, replace, on_unknown, skip_air)
+            server.block_id_validator.validate_all(s for s in states if s is not None)
+
+    result = send_streamed(
+        server,
+        schematic_fill_commands(
+            schematic, origin, version, replace, on_unknown, skip_air, mode
+        ),
+        chunk_size,
+    )
+    return result
@@ -0,0 +1,148 @@
+"""ローカルのボクセルモデルとサーバー上の構造物を差分で同期するモジュール
+
+NumPyが必要です。(pip install PyCraftCommander[numpy])
+"""
+
+import numpy as np
+from typing import Literal, Sequence
+from PyCraftCommander import commands
+from PyCraftCommander.py_craft_commander import PyCraftCommander
+from PyCraftCommander.types.player import Pos
+from PyCraftCommander.voxel import MAX_FILL_VOLUME, box_command, greedy_boxes
+
+# 送信済みの状態が不明なセルを表す値
+_UNKNOWN = -1
+
+
+class StructureSync:
+    """ボクセルモデルの変更部分だけをサーバーに送信するクラス
+
+    最後に送信した状態を記憶しておき、新しいモデルとの差分をNumPyで比較して、
+    変更されたセルだけをfillコマンドにまとめて送信します。
+    領域はchunk_size単位のチャンクに分けて処理し、変更のないチャンクは読み飛ばすため、
+    送信にかかる時間は領域の大きさではなく変更の大きさに比例します。
+
+    Example:
+    --------
+    ```python
+    palette = [MCID.AIR, MCID.STONE, MCID.GLASS]
+    arena = StructureSync(server, Pos(0, 64, 0), palette)
+
+    model = numpy.zeros((64, 32, 64), dtype=numpy.uint8)
+    arena.push(model)  # 初回は全体を送信
+    model[10, 0, 10] = 2
+    arena.push(model)  # 変更された1ブロックだけを送信
+    ```
+    """
+
+    def __init__(
+        self,
+        server: PyCraftCommander,
+        origin: Pos,
+        palette: Sequence[str],
+        mode: Literal["replace", "keep", "destroy"] = "replace",
+        chunk_size: int = 32,
+    ):
+        """
+        Args:
+        -----
+            server (PyCraftCommander): 送信先のサーバー
+            origin (Pos): モデルの[0, 0, 0]を設置する座標
+            palette (Sequence[str]): モデルの値(インデックス)からブロックIDへの対応
+            mode: fill/setblockのモード
+            chunk_size (int): 差分を探す単位となるチャンクの一辺の長さ
+        """
+        if chunk_size**3 > MAX_FILL_VOLUME:
+            raise ValueError(f"chunk_sizeの3乗は{MAX_FILL_VOLUME}以下にしてください。")
+        self.server = server
+        self.origin = Pos(int(origin.x), int(origin.y), int(origin.z))
+        self.palette = palette
+        self.mode = mode
+        self.chunk_size = chunk_size
+        self.__state: np.ndarray | None = None
+
+    @property
+    def state(self) -> np.ndarray | None:
+        """最後に送信した状態(未送信のセルは-1)"""
+        return self.__state
+
+    def reset(self):
+        """送信済みの状態を破棄し、次のpushで全体を送信するようにします。"""
+        self.__state = None
+
+    def diff(self, model: np.ndarray) -> np.ndarray:
+        """最後に送信した状態から変更されたセルのマスクを返します。"""
+        model = np.asarray(model)
+        if self.__state is None or self.__state.shape != model.shape:
+            return np.ones(model.shape, dtype=bool)
+        return model != self.__state
+
+    def push(self, model: np.ndarray) -> list[str]:
+        """モデルの変更部分をサーバーに送信します。
+
+        Args:
+        -----
+            model (np.ndarray): パレットのインデックスを格納した(x, y, z)の3次元配列
+
+        Returns:
+        -------
+            list[str]: 送信したコマンドごとのレスポンスメッセージ
+        """
+        model = np.asarray(model)
+        if model.ndim != 3:
+            raise ValueError("modelは3次元配列にしてください。")
+        changed = self.diff(model)
+        if self.__state is None or self.__state.shape != model.shape:
+            self.__state = np.full(model.shape, _UNKNOWN, dtype=np.int64)
+
+        boxes = []
+        c = self.chunk_size
+        for cx, cy, cz in self.__changed_chunks(changed):
+            region = (
+                slice(cx * c, (cx + 1) * c),
+                slice(cy * c, (cy + 1) * c),
+                slice(cz * c, (cz + 1) * c),
+            )
+            # 変更のないセルは_UNKNOWNにして直方体に含めない
+            values = model[region].astype(np.int64)
+            masked = np.where(changed[region], values, _UNKNOWN)
+            ox, oy, oz = int(cx) * c, int(cy) * c, int(cz) * c
+            for box in greedy_boxes(masked, skip=_UNKNOWN):
+                box.x1 += ox
+                box.x2 += ox
+                box.y1 += oy
+                box.y2 += oy
+                box.z1 += oz
+                box.z2 += oz
+                boxes.append(box)
+
+        if not boxes:
+            return []
+
+        results = self.server.send_commands(
+            box_command(box, self.origin, self.palette, self.mode) for box in boxes
+        )
+        for box, (response, status) in zip(boxes, results):
+            region = (
+                slice(box.x1, box.x2 + 1),
+                slice(box.y1, box.y2 + 1),
+                slice(box.z1, box.z2 + 1),
+            )
+            # 失敗したセル(範囲が大きすぎる、不明なIDなど)は次回も送信されるようにする
+            # replaceで変更がなかった場合は既に同じブロックなので反映済みとする
+            applied = commands.parse_block_changed(response) or (
+                self.mode != "keep" and commands.parse_block_unchanged(response)
+            )
+            self.__state[region] = box.value if applied else _UNKNOWN
+
+        return [response for response, status in results]
+
+    def __changed_chunks(self, changed: np.ndarray) -> np.ndarray:
+        """変更されたセルを含むチャンクの座標を返します。"""
+        c = self.chunk_size
+        padded_shape = [-(-n // c) * c for n in changed.shape]
+        padded = np.zeros(padded_shape, dtype=bool)
+        padded[: changed.shape[0], : changed.shape[1], : changed.shape[2]] = changed
+        nx, ny, nz = (n // c for n in padded_shape)
+        chunks = padded.reshape(nx, c, ny, c, nz, c).any(axis=(1, 3, 5))
+        return np.argwhere(chunks)
@@ -0,0 +1,255 @@
+"""プレイヤーの位置を定期的に記録するモジュール
+
+NumPyが必要です。(pip install PyCraftCommander[numpy])
+"""
+
+import logging
+import threading
+import time
+import numpy as np
+from PyCraftCommander.py_craft_commander import PyCraftCommander
+
+logger = logging.getLogger(__name__)
+
+
+class PlayerSampler:
+    """プレイヤーの座標・ディメンション・ゲームモードを一定間隔で記録するクラス
+
+    バックグラウンドのスレッドでget_all_player_infoを呼び出し、結果をプレイヤーごとの
+    固定長のリングバッファ(NumPy配列)に書き込みます。PlayerやPosを大量に保持する代わりに
+    配列で保持するため、速度や移動距離などをまとめて計算できます。
+
+    RCONの接続はスレッドセーフではないため、PlayerSamplerには他で使用しない
+    専用のPyCraftCommanderを渡してください。
+
+    1回の取得に失敗しただけでは記録を消さないように、プレイヤーが見つからなくなってから
+    grace秒経つまで枠と記録を保持します。記録中のエラーはlast_errorに格納して
+    loggingで出力し、スレッドは記録を続けます。
+
+    Example:
+    --------
+    ```python
+    with PyCraftCommander(host, port, password) as server:
+        server.auth()
+        with PlayerSampler(server, hz=10) as sampler:
+            time.sleep(5)
+            print(sampler.velocity("Steve"))
+            print(sampler.distance_travelled("Steve"))
+    ```
+    """
+
+    def __init__(
+        self,
+        server: PyCraftCommander,
+        hz: float = 5.0,
+        capacity: int = 1024,
+        max_players: int = 256,
+        grace: float = 5.0,
+    ):
+        """
+        Args:
+        -----
+            server (PyCraftCommander): 認証済みのサーバー
+            hz (float): 1秒あたりの記録回数
+            capacity (int): プレイヤーごとに保持する記録の数
+            max_players (int): 同時に記録できるプレイヤー数
+            grace (float): 見つからなくなったプレイヤーの枠を空けるまでの時間(秒)
+        """
+        self.server = server
+        self.interval = 1.0 / hz
+        self.capacity = capacity
+        self.max_players = max_players
+        self.grace = grace
+
+        # [プレイヤーの枠, 記録の位置]
+        self.positions = np.full((max_players, capacity, 3), np.nan)
+        self.times = np.full((max_players, capacity), np.nan)
+        self.dimensions = np.full((max_players, capacity), -1, dtype=np.int16)
+        self.gamemodes = np.full((max_players, capacity), -1, dtype=np.int8)
+        # 枠ごとのこれまでの記録数(次に書き込む位置はcounts % capacity)
+        self.counts = np.zeros(max_players, dtype=np.int64)
+
+        # プレイヤー名 -> 枠
+        self.__slots: dict[str, int] = {}
+        self.__free_slots = list(range(max_players - 1, -1, -1))
+        # プレイヤー名 -> 最後に記録した時刻
+        self.__last_seen: dict[str, float] = {}
+        # ディメンション名 <-> dimensionsに格納する番号
+        self.dimension_names: list[str] = []
+        self.__dimension_codes: dict[str, int] = {}
+
+        self.last_error: Exception | None = None
+        self.__lock = threading.Lock()
+        self.__stop = threading.Event()
+        self.__thread: threading.Thread | None = None
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.stop()
+
+    def start(self):
+        """記録を開始します。"""
+        if self.__thread is not None:
+            return
+        self.__stop.clear()
+        self.__thread = threading.Thread(target=self.__run, daemon=True)
+        self.__thread.start()
+
+    def stop(self):
+        """記録を停止します。"""
+        if self.__thread is None:
+            return
+        self.__stop.set()
+        self.__thread.join()
+        self.__thread = None
+
+    def __run(self):
+        next_time = time.monotonic()
+        while not self.__stop.is_set():
+            try:
+                self.sample()
+                self.last_error = None
+            except (OSError, ValueError) as e:
+                # 一時的な通信エラーでは記録を止めない
+                self.last_error = e
+                logger.warning("プレイヤーの情報を取得できませんでした。: %s", e)
+            except Exception as e:
+                # 予期しないエラーでもスレッドを終了させない
+                self.last_error = e
+                logger.exception("プレイヤーの記録中にエラーが発生しました。")
+            next_time += self.interval
+            delay = next_time - time.monotonic()
+            if delay < 0:
+                # 間に合わなかった分は飛ばす
+                next_time = time.monotonic()
+                delay = 0
+            self.__stop.wait(delay)
+
+    def sample(self):
+        """全てのプレイヤーの情報を1回記録します。"""
+        players = self.server.get_all_player_info()
+        now = time.monotonic()
+
+        with self.__lock:
+            online = {player.name for player in players}
+            for name in list(self.__slots):
+                if name not in online and now - self.__last_seen[name] > self.grace:
+                    self.__release(name)
+
+            for player in players:
+                slot = self.__slots.get(player.name)
+                if slot is None:
+                    slot = self.__assign(player.name)
+                    if slot is None:
+                        continue
+                index = self.counts[slot] % self.capacity
+                self.positions[slot, index] = (
+                    player.pos.x,
+                    player.pos.y,
+                    player.pos.z,
+                )
+                self.times[slot, index] = now
+                self.dimensions[slot, index] = self.__dimension_code(player.dimension)
+                self.gamemodes[slot, index] = int(player.gamemode)
+                self.counts[slot] += 1
+                self.__last_seen[player.name] = now
+
+    def __assign(self, name: str) -> int | None:
+        """ログインしたプレイヤーに枠を割り当てます。"""
+        if not self.__free_slots:
+            return None
+        slot = self.__free_slots.pop()
+        self.__slots[name] = slot
+        return slot
+
+    def __release(self, name: str):
+        """ログアウトしたプレイヤーの枠を空けます。"""
+        slot = self.__slots.pop(name)
+        del self.__last_seen[name]
+        self.positions[slot] = np.nan
+        self.times[slot] = np.nan
+        self.dimensions[slot] = -1
+        self.gamemodes[slot] = -1
+        self.counts[slot] = 0
+        self.__free_slots.append(slot)
+
+    def __dimension_code(self, dimension: str) -> int:
+        code = self.__dimension_codes.get(dimension)
+        if code is None:
+            code = len(self.dimension_names)
+            self.dimension_names.append(dimension)
+            self.__dimension_codes[dimension] = code
+        return code
+
+    def players(self) -> list[str]:
+        """記録中のプレイヤー名のリストを返します。"""
+        with self.__lock:
+            return sorted(self.__slots)
+
+    def __history_index(self, slot: int, n: int | None) -> np.ndarray:
+        """直近n件の記録の位置を古い順に返します。"""
+        count = int(self.counts[slot])
+        available = min(count, self.capacity)
+        n = available if n is None else min(n, available)
+        return np.arange(count - n, count) % self.capacity
+
+    def last_positions(self, name: str, n: int | None = None) -> np.ndarray:
+        """直近n件の座標を古い順に(n, 3)の配列で返します。Noneの場合は保持している全件"""
+        with self.__lock:
+            slot = self.__slots[name]
+            return self.positions[slot, self.__history_index(slot, n)]
+
+    def last_times(self, name: str, n: int | None = None) -> np.ndarray:
+        """直近n件の記録時刻(time.monotonic)を古い順に返します。"""
+        with self.__lock:
+            slot = self.__slots[name]
+            return self.times[slot, self.__history_index(slot, n)]
+
+    def velocity(self, name: str) -> np.ndarray:
+        """直近2件の記録から速度(ブロック/秒)を(3,)の配列で返します。"""
+        with self.__lock:
+            slot = self.__slots[name]
+            index = self.__history_index(slot, 2)
+            if len(index) < 2 or len(set(self.dimensions[slot, index])) != 1:
+                return np.zeros(3)
+            positions = self.positions[slot, index]
+            times = self.times[slot, index]
+            return (positions[1] - positions[0]) / (times[1] - times[0])
+
+    def velocities(self) -> dict[str, np.ndarray]:
+        """全てのプレイヤーの速度(ブロック/秒)をまとめて計算します。"""
+        with self.__lock:
+            names = [
+                name for name, slot in self.__slots.items() if self.counts[slot] >= 2
+            ]
+            if not names:
+                return {}
+            slots = np.array([self.__slots[name] for name in names])
+            last = (self.counts[slots] - 1) % self.capacity
+            previous = (self.counts[slots] - 2) % self.capacity
+            delta = self.positions[slots, last] - self.positions[slots, previous]
+            dt = self.times[slots, last] - self.times[slots, previous]
+            result = delta / dt[:, np.newaxis]
+            # ディメンションを移動した場合は座標に連続性がない
+            moved = self.dimensions[slots, last] != self.dimensions[slots, previous]
+            result[moved] = 0.0
+            return dict(zip(names, result))
+
+    def distance_travelled(self, name: str) -> float:
+        """保持している記録の範囲での移動距離(ブロック)を返します。
+
+        ディメンションを移動した区間は含みません。
+        """
+        with self.__lock:
+            slot = self.__slots[name]
+            index = self.__history_index(slot, None)
+            positions = self.positions[slot, index]
+            dimensions = self.dimensions[slot, index]
+        if len(index) < 2:
+            return 0.0
+        steps = np.linalg.norm(np.diff(positions, axis=0), axis=1)
+        same_dimension = dimensions[1:] == dimensions[:-1]
+        return float(steps[same_dimension].sum())
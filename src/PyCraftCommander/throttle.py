@@ -0,0 +1,154 @@
+import re
+import threading
+import time
+
+# tick queryのレスポンスから1tickあたりの平均処理時間を取り出す
+# 例: "Average time per tick: 3.2ms (Target: 50.0ms)"
+_AVERAGE_TICK_TIME = re.compile(r"Average time per tick: ([\d.]+)ms")
+
+
+def parse_tick_query(response: str) -> float | None:
+    """tick queryのレスポンスから1tickあたりの平均処理時間(ミリ秒)を取り出します。
+
+    tick queryに対応していないサーバーの場合はNoneを返します。
+    """
+    match = _AVERAGE_TICK_TIME.search(response)
+    if match is None:
+        return None
+    return float(match.group(1))
+
+
+class AdaptiveRateLimiter:
+    """サーバーの負荷に合わせて送信レートを調整するトークンバケット
+
+    コマンドの送信前にacquireでトークンを取得し、レスポンスを受け取ったらobserveで
+    往復時間を報告します。往復時間がtarget_rttを超えるか、tick queryで得た
+    1tickあたりの処理時間(MSPT)がtarget_msptを超えるとレートを下げ(乗算的減少)、
+    それ以外の場合は少しずつレートを上げます(加算的増加)。
+
+    RCONにrate_limiterとして渡すと、固定のtime.sleepの代わりに使用できます。
+
+    Example:
+    --------
+    ```python
+    limiter = AdaptiveRateLimiter(rate=500)
+    with PyCraftCommander(host, port, password, rate_limiter=limiter) as server:
+        server.auth()
+        for pos in positions:
+            server.set_block(pos, MCID.STONE)
+        print(limiter.rate, limiter.mspt)
+    ```
+    """
+
+    def __init__(
+        self,
+        rate: float = 200.0,
+        min_rate: float = 10.0,
+        max_rate: float = 20000.0,
+        burst: float = 32.0,
+        target_rtt: float = 0.1,
+        target_mspt: float = 40.0,
+        increase: float = 2.0,
+        decrease: float = 0.7,
+        adjust_interval: float = 0.1,
+        tick_query_interval: float | None = 5.0,
+    ):
+        """
+        Args:
+        -----
+            rate (float): 初期の送信レート(コマンド/秒)
+            min_rate (float): 送信レートの下限
+            max_rate (float): 送信レートの上限
+            burst (float): バケットに溜められるトークン数
+            target_rtt (float): 往復時間(秒)の目標値
+            target_mspt (float): 1tickあたりの処理時間(ミリ秒)の目標値。20TPSを保つには50未満
+            increase (float): 負荷に余裕がある場合にレスポンス1件ごとに上げるレート
+            decrease (float): 負荷が高い場合にレートに掛ける係数
+            adjust_interval (float): レートを下げる最短の間隔(秒)
+            tick_query_interval (float | None): tick queryでMSPTを取得する間隔(秒)。Noneの場合は取得しません。
+        """
+        self.rate = rate
+        self.min_rate = min_rate
+        self.max_rate = max_rate
+        self.burst = burst
+        self.target_rtt = target_rtt
+        self.target_mspt = target_mspt
+        self.increase = increase
+        self.decrease = decrease
+        self.adjust_interval = adjust_interval
+        self.tick_query_interval = tick_query_interval
+
+        # 往復時間の指数移動平均(秒)
+        self.rtt: float | None = None
+        # 直近のtick queryで得た1tickあたりの処理時間(ミリ秒)
+        self.mspt: float | None = None
+
+        self.__tokens = burst
+        self.__last_refill = time.monotonic()
+        self.__last_decrease = 0.0
+        self.__last_tick_query = time.monotonic()
+        self.__lock = threading.Lock()
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """トークンを取得できた場合はTrueを返します。待ちません。"""
+        return self.__take(tokens) == 0.0
+
+    def acquire(self, tokens: float = 1.0):
+        """トークンを取得します。足りない場合は溜まるまで待ちます。"""
+        while True:
+            wait = self.__take(tokens)
+            if wait == 0.0:
+                return
+            time.sleep(wait)
+
+    def __take(self, tokens: float) -> float:
+        """トークンを取得し、足りない場合は溜まるまでの秒数を返します。"""
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(
+                self.burst, self.__tokens + (now - self.__last_refill) * self.rate
+            )
+            self.__last_refill = now
+            if self.__tokens >= tokens:
+                self.__tokens -= tokens
+                return 0.0
+            return (tokens - self.__tokens) / self.rate
+
+    def observe(self, rtt: float):
+        """コマンドの往復時間(秒)を報告します。"""
+        with self.__lock:
+            self.rtt = rtt if self.rtt is None else self.rtt * 0.9 + rtt * 0.1
+            if self.rtt > self.target_rtt or (
+                self.mspt is not None and self.mspt > self.target_mspt
+            ):
+                self.__slow_down()
+            else:
+                self.rate = min(self.max_rate, self.rate + self.increase)
+
+    def observe_tick(self, mspt: float):
+        """tick queryで得た1tickあたりの処理時間(ミリ秒)を報告します。"""
+        with self.__lock:
+            self.mspt = mspt
+            if mspt > self.target_mspt:
+                self.__slow_down()
+
+    def tick_query_due(self) -> bool:
+        """tick queryを送信する時刻になっているかを返します。"""
+        if self.tick_query_interval is None:
+            return False
+        now = time.monotonic()
+        if now - self.__last_tick_query < self.tick_query_interval:
+            return False
+        self.__last_tick_query = now
+        return True
+
+    def disable_tick_query(self):
+        """tick queryに対応していないサーバーの場合に、以降の取得を止めます。"""
+        self.tick_query_interval = None
+
+    def __slow_down(self):
+        now = time.monotonic()
+        if now - self.__last_decrease < self.adjust_interval:
+            return
+        self.__last_decrease = now
+        self.rate = max(self.min_rate, self.rate * self.decrease)
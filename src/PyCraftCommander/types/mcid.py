@@ -1,1041 +1,403 @@
-from enum import StrEnum, unique
-from typing import Literal
-
-
-@unique
-class V1_21(StrEnum):
-    """v1.21のマインクラフトIDの列挙型です。"""
-
-    # A
-    ACACIA_BOAT = "minecraft:acacia_boat"
-    ACACIA_BUTTON = "minecraft:acacia_button"
-    ACACIA_CHEST_BOAT = "minecraft:acacia_chest_boat"
-    ACACIA_DOOR = "minecraft:acacia_door"
-    ACACIA_FENCE = "minecraft:acacia_fence"
-    ACACIA_FENCE_GATE = "minecraft:acacia_fence_gate"
-    ACACIA_HANGING_SIGN = "minecraft:acacia_hanging_sign"
-    ACACIA_LEAVES = "minecraft:acacia_leaves"
-    ACACIA_LOG = "minecraft:acacia_log"
-    ACACIA_PLANKS = "minecraft:acacia_planks"
-    ACACIA_PRESSURE_PLATE = "minecraft:acacia_pressure_plate"
-    ACACIA_SAPLING = "minecraft:acacia_sapling"
-    ACACIA_SIGN = "minecraft:acacia_sign"
-    ACACIA_SLAB = "minecraft:acacia_slab"
-    ACACIA_STAIRS = "minecraft:acacia_stairs"
-    ACACIA_TRAPDOOR = "minecraft:acacia_trapdoor"
-    ACACIA_WOOD = "minecraft:acacia_wood"
-    ACTIVATOR_RAIL = "minecraft:activator_rail"
-    AIR = "minecraft:air"
-    ALLAY_SPAWN_EGG = "minecraft:allay_spawn_egg"
-    ALLIUM = "minecraft:allium"
-    AMETHYST_BLOCK = "minecraft:amethyst_block"
-    AMETHYST_CLUSTER = "minecraft:amethyst_cluster"
-    AMETHYST_SHARD = "minecraft:amethyst_shard"
-    ANCIENT_DEBRIS = "minecraft:ancient_debris"
-    ANDESITE = "minecraft:andesite"
-    ANDESITE_SLAB = "minecraft:andesite_slab"
-    ANDESITE_STAIRS = "minecraft:andesite_stairs"
-    ANDESITE_WALL = "minecraft:andesite_wall"
-    ANGLER_POTTERY_SHARD = "minecraft:angler_pottery_shard"
-    ANVIL = "minecraft:anvil"
-    APPLE = "minecraft:apple"
-    ARCHER_POTTERY_SHARD = "minecraft:archer_pottery_shard"
-    ARMADILLO_SCUTE = "minecraft:armadillo_scute"
-    ARMADILLO_SPAWN_EGG = "minecraft:armadillo_spawn_egg"
-    ARMOR_STAND = "minecraft:armor_stand"
-    ARMS_UP_POTTERY_SHARD = "minecraft:arms_up_pottery_shard"
-    ARROW = "minecraft:arrow"
-    AXOLOTL_BUCKET = "minecraft:axolotl_bucket"
-    AXOLOTL_SPAWN_EGG = "minecraft:axolotl_spawn_egg"
-    AZALEA = "minecraft:azalea"
-    AZALEA_LEAVES = "minecraft:azalea_leaves"
-    AZURE_BLUET = "minecraft:azure_bluet"
-
-    # B
-    BAKED_POTATO = "minecraft:baked_potato"
-    BAMBOO = "minecraft:bamboo"
-    BAMBOO_BLOCK = "minecraft:bamboo_block"
-    BAMBOO_BUTTON = "minecraft:bamboo_button"
-    BAMBOO_CHEST_RAFT = "minecraft:bamboo_chest_raft"
-    BAMBOO_DOOR = "minecraft:bamboo_door"
-    BAMBOO_FENCE = "minecraft:bamboo_fence"
-    BAMBOO_FENCE_GATE = "minecraft:bamboo_fence_gate"
-    BAMBOO_HANGING_SIGN = "minecraft:bamboo_hanging_sign"
-    BAMBOO_MOSAIC = "minecraft:bamboo_mosaic"
-    BAMBOO_MOSAIC_SLAB = "minecraft:bamboo_mosaic_slab"
-    BAMBOO_MOSAIC_STAIRS = "minecraft:bamboo_mosaic_stairs"
-    BAMBOO_PLANKS = "minecraft:bamboo_planks"
-    BAMBOO_PRESSURE_PLATE = "minecraft:bamboo_pressure_plate"
-    BAMBOO_RAFT = "minecraft:bamboo_raft"
-    BAMBOO_SIGN = "minecraft:bamboo_sign"
-    BAMBOO_SLAB = "minecraft:bamboo_slab"
-    BAMBOO_STAIRS = "minecraft:bamboo_stairs"
-    BAMBOO_TRAPDOOR = "minecraft:bamboo_trapdoor"
-    BARREL = "minecraft:barrel"
-    BARRIER = "minecraft:barrier"
-    BASALT = "minecraft:basalt"
-    BAT_SPAWN_EGG = "minecraft:bat_spawn_egg"
-    BEACON = "minecraft:beacon"
-    BEDROCK = "minecraft:bedrock"
-    BEE_NEST = "minecraft:bee_nest"
-    BEE_SPAWN_EGG = "minecraft:bee_spawn_egg"
-    BEEF = "minecraft:beef"
-    BEEHIVE = "minecraft:beehive"
-    BEETROOT = "minecraft:beetroot"
-    BEETROOT_SEEDS = "minecraft:beetroot_seeds"
-    BEETROOT_SOUP = "minecraft:beetroot_soup"
-    BELL = "minecraft:bell"
-    BIG_DRIPLEAF = "minecraft:big_dripleaf"
-    BIRCH_BOAT = "minecraft:birch_boat"
-    BIRCH_BUTTON = "minecraft:birch_button"
-    BIRCH_CHEST_BOAT = "minecraft:birch_chest_boat"
-    BIRCH_DOOR = "minecraft:birch_door"
-    BIRCH_FENCE = "minecraft:birch_fence"
-    BIRCH_FENCE_GATE = "minecraft:birch_fence_gate"
-    BIRCH_HANGING_SIGN = "minecraft:birch_hanging_sign"
-    BIRCH_LEAVES = "minecraft:birch_leaves"
-    BIRCH_LOG = "minecraft:birch_log"
-    BIRCH_PLANKS = "minecraft:birch_planks"
-    BIRCH_PRESSURE_PLATE = "minecraft:birch_pressure_plate"
-    BIRCH_SAPLING = "minecraft:birch_sapling"
-    BIRCH_SIGN = "minecraft:birch_sign"
-    BIRCH_SLAB = "minecraft:birch_slab"
-    BIRCH_STAIRS = "minecraft:birch_stairs"
-    BIRCH_TRAPDOOR = "minecraft:birch_trapdoor"
-    BIRCH_WOOD = "minecraft:birch_wood"
-    BLACK_BANNER = "minecraft:black_banner"
-    BLACK_BED = "minecraft:black_bed"
-    BLACK_CANDLE = "minecraft:black_candle"
-    BLACK_CARPET = "minecraft:black_carpet"
-    BLACK_CONCRETE = "minecraft:black_concrete"
-    BLACK_CONCRETE_POWDER = "minecraft:black_concrete_powder"
-    BLACK_DYE = "minecraft:black_dye"
-    BLACK_GLAZED_TERRACOTTA = "minecraft:black_glazed_terracotta"
-    BLACK_SHULKER_BOX = "minecraft:black_shulker_box"
-    BLACK_STAINED_GLASS = "minecraft:black_stained_glass"
-    BLACK_STAINED_GLASS_PANE = "minecraft:black_stained_glass_pane"
-    BLACK_TERRACOTTA = "minecraft:black_terracotta"
-    BLACK_WOOL = "minecraft:black_wool"
-    BLACKSTONE = "minecraft:blackstone"
-    BLACKSTONE_SLAB = "minecraft:blackstone_slab"
-    BLACKSTONE_STAIRS = "minecraft:blackstone_stairs"
-    BLACKSTONE_WALL = "minecraft:blackstone_wall"
-    BLADE_POTTERTY_SHARD = "minecraft:blade_pottery_shard"
-    BLAST_FURNACE = "minecraft:blast_furnace"
-    BLAZE_POWDER = "minecraft:blaze_powder"
-    BLAZE_ROD = "minecraft:blaze_rod"
-    BLAZE_SPAWN_EGG = "minecraft:blaze_spawn_egg"
-    BLUE_BANNER = "minecraft:blue_banner"
-    BLUE_BED = "minecraft:blue_bed"
-    BLUE_CANDLE = "minecraft:blue_candle"
-    BLUE_CARPET = "minecraft:blue_carpet"
-    BLUE_CONCRETE = "minecraft:blue_concrete"
-    BLUE_CONCRETE_POWDER = "minecraft:blue_concrete_powder"
-    BLUE_DYE = "minecraft:blue_dye"
-    BLUE_GLAZED_TERRACOTTA = "minecraft:blue_glazed_terracotta"
-    BLUE_ICE = "minecraft:blue_ice"
-    BLUE_ORCHID = "minecraft:blue_orchid"
-    BLUE_SHULKER_BOX = "minecraft:blue_shulker_box"
-    BLUE_STAINED_GLASS = "minecraft:blue_stained_glass"
-    BLUE_STAINED_GLASS_PANE = "minecraft:blue_stained_glass_pane"
-    BLUE_TERRACOTTA = "minecraft:blue_terracotta"
-    BLUE_WOOL = "minecraft:blue_wool"
-    BOGGED_SPAWN_EGG = "minecraft:bogged_spawn_egg"
-    BOLT_ARMOR_TRIM_SMITHING_TEMPLATE = "minecraft:bolt_armor_trim_smithing_template"
-    BONE = "minecraft:bone"
-    BONE_BLOCK = "minecraft:bone_block"
-    BONE_MEAL = "minecraft:bone_meal"
-    BOOK = "minecraft:book"
-    BOOKSHELF = "minecraft:bookshelf"
-    BOW = "minecraft:bow"
-    BOWL = "minecraft:bowl"
-    BRAIN_CORAL = "minecraft:brain_coral"
-    BRAIN_CORAL_BLOCK = "minecraft:brain_coral_block"
-    BRAIN_CORAL_FAN = "minecraft:brain_coral_fan"
-    BREAD = "minecraft:bread"
-    BREEZE_ROD = "minecraft:breeze_rod"
-    BREEZE_SPAWN_EGG = "minecraft:breeze_spawn_egg"
-    BREWER_POTTERY_SHARD = "minecraft:brewer_pottery_shard"
-    BREWING_STAND = "minecraft:brewing_stand"
-    BRICK = "minecraft:brick"
-    BRICK_SLAB = "minecraft:brick_slab"
-    BRICK_STAIRS = "minecraft:brick_stairs"
-    BRICK_WALL = "minecraft:brick_wall"
-    BRICKS = "minecraft:bricks"
-    BROWN_BANNER = "minecraft:brown_banner"
-    BROWN_BED = "minecraft:brown_bed"
-    BROWN_CANDLE = "minecraft:brown_candle"
-    BROWN_CARPET = "minecraft:brown_carpet"
-    BROWN_CONCRETE = "minecraft:brown_concrete"
-    BROWN_CONCRETE_POWDER = "minecraft:brown_concrete_powder"
-    BROWN_DYE = "minecraft:brown_dye"
-    BROWN_GLAZED_TERRACOTTA = "minecraft:brown_glazed_terracotta"
-    BROWN_MUSHROOM = "minecraft:brown_mushroom"
-    BROWN_MUSHROOM_BLOCK = "minecraft:brown_mushroom_block"
-    BROWN_SHULKER_BOX = "minecraft:brown_shulker_box"
-    BROWN_STAINED_GLASS = "minecraft:brown_stained_glass"
-    BROWN_STAINED_GLASS_PANE = "minecraft:brown_stained_glass_pane"
-    BROWN_TERRACOTTA = "minecraft:brown_terracotta"
-    BROWN_WOOL = "minecraft:brown_wool"
-    BRUSH = "minecraft:brush"
-    BUBBLE_CORAL = "minecraft:bubble_coral"
-    BUBBLE_CORAL_BLOCK = "minecraft:bubble_coral_block"
-    BUBBLE_CORAL_FAN = "minecraft:bubble_coral_fan"
-    BUCKET = "minecraft:bucket"
-    BUDDING_AMETHYST = "minecraft:budding_amethyst"
-    BUNDLE = "minecraft:bundle"
-    BURN_POTTERY_SHARD = "minecraft:burn_pottery_shard"
-
-    # C
-    CACTUS = "minecraft:cactus"
-    CAKE = "minecraft:cake"
-    CALCITE = "minecraft:calcite"
-    CALIBRATED_SCULK_SENSOR = "minecraft:calibrated_sculk_sensor"
-    CAMEL_SPAWN_EGG = "minecraft:camel_spawn_egg"
-    CAMPFIRE = "minecraft:campfire"
-    CANDLE = "minecraft:candle"
-    CARROT = "minecraft:carrot"
-    CARROT_ON_A_STICK = "minecraft:carrot_on_a_stick"
-    CARTOGRAPHY_TABLE = "minecraft:cartography_table"
-    CARVED_PUMPKIN = "minecraft:carved_pumpkin"
-    CAT_SPAWN_EGG = "minecraft:cat_spawn_egg"
-    CAULDRON = "minecraft:cauldron"
-    CAVE_SPIDER_SPAWN_EGG = "minecraft:cave_spider_spawn_egg"
-    CHAIN = "minecraft:chain"
-    CHAIN_COMMAND_BLOCK = "minecraft:chain_command_block"
-    CHAINMAIL_BOOTS = "minecraft:chainmail_boots"
-    CHAINMAIL_CHESTPLATE = "minecraft:chainmail_chestplate"
-    CHAINMAIL_HELMET = "minecraft:chainmail_helmet"
-    CHAINMAIL_LEGGINGS = "minecraft:chainmail_leggings"
-    CHARCOAL = "minecraft:charcoal"
-    CHERRY_BOAT = "minecraft:cherry_boat"
-    CHERRY_BUTTON = "minecraft:cherry_button"
-    CHERRY_CHEST_BOAT = "minecraft:cherry_chest_boat"
-    CHERRY_DOOR = "minecraft:cherry_door"
-    CHERRY_FENCE = "minecraft:cherry_fence"
-    CHERRY_FENCE_GATE = "minecraft:cherry_fence_gate"
-    CHERRY_HANGING_SIGN = "minecraft:cherry_hanging_sign"
-    CHERRY_LEAVES = "minecraft:cherry_leaves"
-    CHERRY_LOG = "minecraft:cherry_log"
-    CHERRY_PLANKS = "minecraft:cherry_planks"
-    CHERRY_PRESSURE_PLATE = "minecraft:cherry_pressure_plate"
-    CHERRY_SAPLING = "minecraft:cherry_sapling"
-    CHERRY_SIGN = "minecraft:cherry_sign"
-    CHERRY_SLAB = "minecraft:cherry_slab"
-    CHERRY_STAIRS = "minecraft:cherry_stairs"
-    CHERRY_TRAPDOOR = "minecraft:cherry_trapdoor"
-    CHERRY_WOOD = "minecraft:cherry_wood"
-    CHEST = "minecraft:chest"
-    CHEST_MINECART = "minecraft:chest_minecart"
-    CHICKEN = "minecraft:chicken"
-    CHICKEN_SPAWN_EGG = "minecraft:chicken_spawn_egg"
-    CHIPPED_ANVIL = "minecraft:chipped_anvil"
-    CHISELED_BOOKSHELF = "minecraft:chiseled_bookshelf"
-    CHISELED_COPPER = "minecraft:chiseled_copper"
-    CHISELED_DEEPSLATE = "minecraft:chiseled_deepslate"
-    CHISELED_NETHER_BRICKS = "minecraft:chiseled_nether_bricks"
-    CHISELED_POLISHED_BLACKSTONE = "minecraft:chiseled_polished_blackstone"
-    CHISELED_QUARTZ_BLOCK = "minecraft:chiseled_quartz_block"
-    CHISELED_RED_SANDSTONE = "minecraft:chiseled_red_sandstone"
-    CHISELED_SANDSTONE = "minecraft:chiseled_sandstone"
-    CHISELED_STONE_BRICKS = "minecraft:chiseled_stone_bricks"
-    CHISELED_TUFF = "minecraft:chiseled_tuff"
-    CHISELED_TUFF_BRICKS = "minecraft:chiseled_tuff_bricks"
-    CHORUS_FLOWER = "minecraft:chorus_flower"
-    CHORUS_FRUIT = "minecraft:chorus_fruit"
-    CHORUS_PLANT = "minecraft:chorus_plant"
-    CLAY = "minecraft:clay"
-    CLAY_BALL = "minecraft:clay_ball"
-    CLOCK = "minecraft:clock"
-    COAL = "minecraft:coal"
-    COAL_BLOCK = "minecraft:coal_block"
-    COAL_ORE = "minecraft:coal_ore"
-    COARSE_DIRT = "minecraft:coarse_dirt"
-    COAST_ARMOR_TRIM_SMITHING_TEMPLATE = "minecraft:coast_armor_trim_smithing_template"
-    COBBLED_DEEPSLATE = "minecraft:cobbled_deepslate"
-    COBBLED_DEEPSLATE_SLAB = "minecraft:cobbled_deepslate_slab"
-    COBBLED_DEEPSLATE_STAIRS = "minecraft:cobbled_deepslate_stairs"
-    COBBLED_DEEPSLATE_WALL = "minecraft:cobbled_deepslate_wall"
-    COBBLESTONE = "minecraft:cobblestone"
-    COBBLESTONE_SLAB = "minecraft:cobblestone_slab"
-    COBBLESTONE_STAIRS = "minecraft:cobblestone_stairs"
-    COBBLESTONE_WALL = "minecraft:cobblestone_wall"
-    COBWEB = "minecraft:cobweb"
-    COCOA_BEANS = "minecraft:cocoa_beans"
-    COD = "minecraft:cod"
-    COD_BUCKET = "minecraft:cod_bucket"
-    COD_SPAWN_EGG = "minecraft:cod_spawn_egg"
-    COMMAND_BLOCK = "minecraft:command_block"
-    COMMAND_BLOCK_MINECART = "minecraft:command_block_minecart"
-    COMPARATOR = "minecraft:comparator"
-    COMPASS = "minecraft:compass"
-    COMPOSTER = "minecraft:composter"
-    CONDUIT = "minecraft:conduit"
-    COOKED_BEEF = "minecraft:cooked_beef"
-    COOKED_CHICKEN = "minecraft:cooked_chicken"
-    COOKED_COD = "minecraft:cooked_cod"
-    COOKED_MUTTON = "minecraft:cooked_mutton"
-    COOKED_PORKCHOP = "minecraft:cooked_porkchop"
-    COOKED_RABBIT = "minecraft:cooked_rabbit"
-    COOKED_SALMON = "minecraft:cooked_salmon"
-    COOKIE = "minecraft:cookie"
-    COPPER_BLOCK = "minecraft:copper_block"
-    COPPER_BULB = "minecraft:copper_bulb"
-    COPPER_DOOR = "minecraft:copper_door"
-    COPPER_GRATE = "minecraft:copper_grate"
-    COPPER_INGOT = "minecraft:copper_ingot"
-    COPPER_ORE = "minecraft:copper_ore"
-    COPPER_TRAPDOOR = "minecraft:copper_trapdoor"
-    CORNFLOWER = "minecraft:cornflower"
-    COW_SPAWN_EGG = "minecraft:cow_spawn_egg"
-    CRACKED_DEEPSLATE_BRICKS = "minecraft:cracked_deepslate_bricks"
-    CRACKED_DEEPSLATE_TILES = "minecraft:cracked_deepslate_tiles"
-    CRACKED_NETHER_BRICKS = "minecraft:cracked_nether_bricks"
-    CRACKED_POLISHED_BLACKSTONE_BRICKS = "minecraft:cracked_polished_blackstone_bricks"
-    CRACKED_STONE_BRICKS = "minecraft:cracked_stone_bricks"
-    CRAFTER = "minecraft:crafter"
-    CRAFTING_TABLE = "minecraft:crafting_table"
-    CREEPER_BANNER_PATTERN = "minecraft:creeper_banner_pattern"
-    CREEPER_HEAD = "minecraft:creeper_head"
-    CREEPER_SPAWN_EGG = "minecraft:creeper_spawn_egg"
-    CRIMSON_BUTTON = "minecraft:crimson_button"
-    CRIMSON_DOOR = "minecraft:crimson_door"
-    CRIMSON_FENCE = "minecraft:crimson_fence"
-    CRIMSON_FENCE_GATE = "minecraft:crimson_fence_gate"
-    CRIMSON_FUNGUS = "minecraft:crimson_fungus"
-    CRIMSON_HANGING_SIGN = "minecraft:crimson_hanging_sign"
-    CRIMSON_HYPHAE = "minecraft:crimson_hyphae"
-    CRIMSON_NYLIUM = "minecraft:crimson_nylium"
-    CRIMSON_PLANKS = "minecraft:crimson_planks"
-    CRIMSON_PRESSURE_PLATE = "minecraft:crimson_pressure_plate"
-    CRIMSON_ROOTS = "minecraft:crimson_roots"
-    CRIMSON_SIGN = "minecraft:crimson_sign"
-    CRIMSON_SLAB = "minecraft:crimson_slab"
-    CRIMSON_STAIRS = "minecraft:crimson_stairs"
-    CRIMSON_STEM = "minecraft:crimson_stem"
-    CRIMSON_TRAPDOOR = "minecraft:crimson_trapdoor"
-    CROSSBOW = "minecraft:crossbow"
-    CRYING_OBSIDIAN = "minecraft:crying_obsidian"
-    CUT_COPPER = "minecraft:cut_copper"
-    CUT_COPPER_SLAB = "minecraft:cut_copper_slab"
-    CUT_COPPER_STAIRS = "minecraft:cut_copper_stairs"
-    CUT_RED_SANDSTONE = "minecraft:cut_red_sandstone"
-    CUT_RED_SANDSTONE_SLAB = "minecraft:cut_red_sandstone_slab"
-    CUT_SANDSTONE = "minecraft:cut_sandstone"
-    CUT_SANDSTONE_SLAB = "minecraft:cut_sandstone_slab"
-    CYAN_BANNER = "minecraft:cyan_banner"
-    CYAN_BED = "minecraft:cyan_bed"
-    CYAN_CANDLE = "minecraft:cyan_candle"
-    CYAN_CARPET = "minecraft:cyan_carpet"
-    CYAN_CONCRETE = "minecraft:cyan_concrete"
-    CYAN_CONCRETE_POWDER = "minecraft:cyan_concrete_powder"
-    CYAN_DYE = "minecraft:cyan_dye"
-    CYAN_GLAZED_TERRACOTTA = "minecraft:cyan_glazed_terracotta"
-    CYAN_SHULKER_BOX = "minecraft:cyan_shulker_box"
-    CYAN_STAINED_GLASS = "minecraft:cyan_stained_glass"
-    CYAN_STAINED_GLASS_PANE = "minecraft:cyan_stained_glass_pane"
-    CYAN_TERRACOTTA = "minecraft:cyan_terracotta"
-    CYAN_WOOL = "minecraft:cyan_wool"
-
-    # D
-    DAMAGED_ANVIL = "minecraft:damaged_anvil"
-    DANDELION = "minecraft:dandelion"
-    DANGER_PPOTTERY_SHARD = "minecraft:danger_ppottery_shard"
-    DARK_OAK_BOAT = "minecraft:dark_oak_boat"
-    DARK_OAK_BUTTON = "minecraft:dark_oak_button"
-    DARK_OAK_CHEST_BOAT = "minecraft:dark_oak_chest_boat"
-    DARK_OAK_DOOR = "minecraft:dark_oak_door"
-    DARK_OAK_FENCE = "minecraft:dark_oak_fence"
-    DARK_OAK_FENCE_GATE = "minecraft:dark_oak_fence_gate"
-    DARK_OAK_HANGING_SIGN = "minecraft:dark_oak_hanging_sign"
-    DARK_OAK_LEAVES = "minecraft:dark_oak_leaves"
-    DARK_OAK_LOG = "minecraft:dark_oak_log"
-    DARK_OAK_PLANKS = "minecraft:dark_oak_planks"
-    DARK_OAK_PRESSURE_PLATE = "minecraft:dark_oak_pressure_plate"
-    DARK_OAK_SAPLING = "minecraft:dark_oak_sapling"
-    DARK_OAK_SIGN = "minecraft:dark_oak_sign"
-    DARK_OAK_SLAB = "minecraft:dark_oak_slab"
-    DARK_OAK_STAIRS = "minecraft:dark_oak_stairs"
-    DARK_OAK_TRAPDOOR = "minecraft:dark_oak_trapdoor"
-    DARK_OAK_WOOD = "minecraft:dark_oak_wood"
-    DARK_PRISMARINE = "minecraft:dark_prismarine"
-    DARK_PRISMARINE_SLAB = "minecraft:dark_prismarine_slab"
-    DARK_PRISMARINE_STAIRS = "minecraft:dark_prismarine_stairs"
-    DAYLIGHT_DETECTOR = "minecraft:daylight_detector"
-    DEAD_BRAIN_CORAL = "minecraft:dead_brain_coral"
-    DEAD_BRAIN_CORAL_BLOCK = "minecraft:dead_brain_coral_block"
-    DEAD_BRAIN_CORAL_FAN = "minecraft:dead_brain_coral_fan"
-    DEAD_BUBBLE_CORAL = "minecraft:dead_bubble_coral"
-    DEAD_BUBBLE_CORAL_BLOCK = "minecraft:dead_bubble_coral_block"
-    DEAD_BUBBLE_CORAL_FAN = "minecraft:dead_bubble_coral_fan"
-    DEAD_BUSH = "minecraft:dead_bush"
-    DEAD_FIRE_CORAL = "minecraft:dead_fire_coral"
-    DEAD_FIRE_CORAL_BLOCK = "minecraft:dead_fire_coral_block"
-    DEAD_FIRE_CORAL_FAN = "minecraft:dead_fire_coral_fan"
-    DEAD_HORN_CORAL = "minecraft:dead_horn_coral"
-    DEAD_HORN_CORAL_BLOCK = "minecraft:dead_horn_coral_block"
-    DEAD_HORN_CORAL_FAN = "minecraft:dead_horn_coral_fan"
-    DEAD_TUBE_CORAL = "minecraft:dead_tube_coral"
-    DEAD_TUBE_CORAL_BLOCK = "minecraft:dead_tube_coral_block"
-    DEAD_TUBE_CORAL_FAN = "minecraft:dead_tube_coral_fan"
-    DEBUG_STICK = "minecraft:debug_stick"
-    DECORATED_POT = "minecraft:decorated_pot"
-    DEEPSLATE = "minecraft:deepslate"
-    DEEPSLATE_BRICK_SLAB = "minecraft:deepslate_brick_slab"
-    DEEPSLATE_BRICK_STAIRS = "minecraft:deepslate_brick_stairs"
-    DEEPSLATE_BRICK_WALL = "minecraft:deepslate_brick_wall"
-    DEEPSLATE_BRICKS = "minecraft:deepslate_bricks"
-    DEEPSLATE_COAL_ORE = "minecraft:deepslate_coal_ore"
-    DEEPSLATE_COPPER_ORE = "minecraft:deepslate_copper_ore"
-    DEEPSLATE_DIAMOND_ORE = "minecraft:deepslate_diamond_ore"
-    DEEPSLATE_EMERALD_ORE = "minecraft:deepslate_emerald_ore"
-    DEEPSLATE_GOLD_ORE = "minecraft:deepslate_gold_ore"
-    DEEPSLATE_IRON_ORE = "minecraft:deepslate_iron_ore"
-    DEEPSLATE_LAPIS_ORE = "minecraft:deepslate_lapis_ore"
-    DEEPSLATE_REDSTONE_ORE = "minecraft:deepslate_redstone_ore"
-    DEEPSLATE_TILE_SLAB = "minecraft:deepslate_tile_slab"
-    DEEPSLATE_TILE_STAIRS = "minecraft:deepslate_tile_stairs"
-    DEEPSLATE_TILE_WALL = "minecraft:deepslate_tile_wall"
-    DEEPSLATE_TILES = "minecraft:deepslate_tiles"
-    DETECTOR_RAIL = "minecraft:detector_rail"
-    DIAMOND = "minecraft:diamond"
-    DIAMOND_AXE = "minecraft:diamond_axe"
-    DIAMOND_BLOCK = "minecraft:diamond_block"
-    DIAMOND_BOOTS = "minecraft:diamond_boots"
-    DIAMOND_CHESTPLATE = "minecraft:diamond_chestplate"
-    DIAMOND_HELMET = "minecraft:diamond_helmet"
-    DIAMOND_HOE = "minecraft:diamond_hoe"
-    DIAMOND_HORSE_ARMOR = "minecraft:diamond_horse_armor"
-    DIAMOND_LEGGINGS = "minecraft:diamond_leggings"
-    DIAMOND_ORE = "minecraft:diamond_ore"
-    DIAMOND_PICKAXE = "minecraft:diamond_pickaxe"
-    DIAMOND_SHOVEL = "minecraft:diamond_shovel"
-    DIAMOND_SWORD = "minecraft:diamond_sword"
-    DIORITE = "minecraft:diorite"
-    DIORITE_SLAB = "minecraft:diorite_slab"
-    DIORITE_STAIRS = "minecraft:diorite_stairs"
-    DIORITE_WALL = "minecraft:diorite_wall"
-    DIRT = "minecraft:dirt"
-    DIRT_PATH = "minecraft:dirt_path"
-    DISC_FRAGMENT_5 = "minecraft:disc_fragment_5"
-    DISPENSER = "minecraft:dispenser"
-    DOLPHIN_SPAWN_EGG = "minecraft:dolphin_spawn_egg"
-    DONKEY_SPAWN_EGG = "minecraft:donkey_spawn_egg"
-    DRAGON_BREATH = "minecraft:dragon_breath"
-    DRAGON_EGG = "minecraft:dragon_egg"
-    DRAGON_HEAD = "minecraft:dragon_head"
-    DRIED_KELP = "minecraft:dried_kelp"
-    DRIED_KELP_BLOCK = "minecraft:dried_kelp_block"
-    DRIPSTONE_BLOCK = "minecraft:dripstone_block"
-    DROPPER = "minecraft:dropper"
-    DROWNED_SPAWN_EGG = "minecraft:drowned_spawn_egg"
-    DUNE_ARMOR_TRIM_SMITHING_TEMPLATE = "minecraft:dune_armor_trim_smithing_template"
-
-    # E
-    ECHO_SHARD = "minecraft:echo_shard"
-    EGG = "minecraft:egg"
-    ELDER_GUARDIAN_SPAWN_EGG = "minecraft:elder_guardian_spawn_egg"
-    ELYTRA = "minecraft:elytra"
-    EMERALD = "minecraft:emerald"
-    EMERALD_BLOCK = "minecraft:emerald_block"
-    EMERALD_ORE = "minecraft:emerald_ore"
-    ENCHANTED_BOOK = "minecraft:enchanted_book"
-    ENCHANTED_GOLDEN_APPLE = "minecraft:enchanted_golden_apple"
-    ENCHANTING_TABLE = "minecraft:enchanting_table"
-    END_CRYSTAL = "minecraft:end_crystal"
-    END_PORTAL_FRAME = "minecraft:end_portal_frame"
-    END_ROD = "minecraft:end_rod"
-    END_STONE = "minecraft:end_stone"
-    END_STONE_BRICK_SLAB = "minecraft:end_stone_brick_slab"
-    END_STONE_BRICK_STAIRS = "minecraft:end_stone_brick_stairs"
-    END_STONE_BRICK_WALL = "minecraft:end_stone_brick_wall"
-    END_STONE_BRICKS = "minecraft:end_stone_bricks"
-    ENDER_CHEST = "minecraft:ender_chest"
-    ENDER_DRAGON_SPAWN_EGG = "minecraft:ender_dragon_spawn_egg"
-    ENDER_EYE = "minecraft:ender_eye"
-    ENDER_PEARL = "minecraft:ender_pearl"
-    ENDERMAN_SPAWN_EGG = "minecraft:enderman_spawn_egg"
-    ENDERMITE_SPAWN_EGG = "minecraft:endermite_spawn_egg"
-    EVOKER_SPAWN_EGG = "minecraft:evoker_spawn_egg"
-    EXPERIENCE_BOTTLE = "minecraft:experience_bottle"
-    EXPLORER_POTTERY_SHARD = "minecraft:explorer_pottery_shard"
-    EXPOSED_CHISELED_COPPER = "minecraft:exposed_chiseled_copper"
-    EXPOSED_COPPER = "minecraft:exposed_copper"
-    EXPOSED_COPPER_BULB = "minecraft:exposed_copper_bulb"
-    EXPOSED_COPPER_DOOR = "minecraft:exposed_copper_door"
-    EXPOSED_COPPER_GRATE = "minecraft:exposed_copper_grate"
-    EXPOSED_CUT_COPPER = "minecraft:exposed_cut_copper"
-    EXPOSED_CUT_COPPER_SLAB = "minecraft:exposed_cut_copper_slab"
-    EXPOSED_CUT_COPPER_STAIRS = "minecraft:exposed_cut_copper_stairs"
-    EYE_ARMOR_TRIM_SMITHING_TEMPLATE = "minecraft:eye_armor_trim_smithing_template"
-
-    # F
-    FARMLAND = "minecraft:farmland"
-    FEATHER = "minecraft:feather"
-    FERMENTED_SPIDER_EYE = "minecraft:fermented_spider_eye"
-    FERN = "minecraft:fern"
-    FILLED_MAP = "minecraft:filled_map"
-    FIRE_CHARGE = "minecraft:fire_charge"
-    FIRE_CORAL = "minecraft:fire_coral"
-    FIRE_CORAL_BLOCK = "minecraft:fire_coral_block"
-    FIRE_CORAL_FAN = "minecraft:fire_coral_fan"
-    FIREWORK_ROCKET = "minecraft:firework_rocket"
-    FIREWORK_STAR = "minecraft:firework_star"
-    FISHING_ROD = "minecraft:fishing_rod"
-    FLETCHING_TABLE = "minecraft:fletching_table"
-    FLINT = "minecraft:flint"
-    FLINT_AND_STEEL = "minecraft:flint_and_steel"
-    FLOW_ARMOR_TRIM_SMITHING_TEMPLATE = "minecraft:flow_armor_trim_smithing_template"
-    FLOW_BANNER_PATTERN = "minecraft:flow_banner_pattern"
-    FLOW_POTTERTY_SHARD = "minecraft:flow_ppottery_shard"
-    FLOWER_BANNER_PATTERN = "minecraft:flower_banner_pattern"
-    FLOWER_POT = "minecraft:flower_pot"
-    FLOWERING_AZALEA = "minecraft:flowering_azalea"
-    FLOWERING_AZALEA_LEAVES = "minecraft:flowering_azalea_leaves"
-    FOX_SPAWN_EGG = "minecraft:fox_spawn_egg"
-    FRIEND_POTTERY_SHARD = "minecraft:friend_pottery_shard"
-    FROG_SPAWN_EGG = "minecraft:frog_spawn_egg"
-    FROGSPAWN = "minecraft:frogspawn"
-    FURNACE = "minecraft:furnace"
-    FURNACE_MINECART = "minecraft:furnace_minecart"
-
-    # G
-    GHAST_SPAWN_EGG = "minecraft:ghast_spawn_egg"
-    GHAST_TEAR = "minecraft:ghast_tear"
-    GILDED_BLACKSTONE = "minecraft:gilded_blackstone"
-    GLASS = "minecraft:glass"
-    GLASS_BOTTLE = "minecraft:glass_bottle"
-    GLASS_PANE = "minecraft:glass_pane"
-    GLISTERING_MELON_SLICE = "minecraft:glistering_melon_slice"
-    GLOBE_BANNER_PATTERN = "minecraft:globe_banner_pattern"
-    GLOW_BERRIES = "minecraft:glow_berries"
-    GLOW_INK_SAC = "minecraft:glow_ink_sac"
-    GLOW_ITEM_FRAME = "minecraft:glow_item_frame"
-    GLOW_LICHEN = "minecraft:glow_lichen"
-    GLOW_SQUID_SPAWN_EGG = "minecraft:glow_squid_spawn_egg"
-    GLOWSTONE = "minecraft:glowstone"
-    GLOWSTONE_DUST = "minecraft:glowstone_dust"
-    GOAT_HORN = "minecraft:goat_horn"
-    GOAT_SPAWN_EGG = "minecraft:goat_spawn_egg"
-    GOLD_BLOCK = "minecraft:gold_block"
-    GOLD_INGOT = "minecraft:gold_ingot"
-    GOLD_NUGGET = "minecraft:gold_nugget"
-    GOLD_ORE = "minecraft:gold_ore"
-    GOLDEN_APPLE = "minecraft:golden_apple"
-    GOLDEN_AXE = "minecraft:golden_axe"
-    GOLDEN_BOOTS = "minecraft:golden_boots"
-    GOLDEN_CARROT = "minecraft:golden_carrot"
-    GOLDEN_CHESTPLATE = "minecraft:golden_chestplate"
-    GOLDEN_HELMET = "minecraft:golden_helmet"
-    GOLDEN_HOE = "minecraft:golden_hoe"
-    GOLDEN_HORSE_ARMOR = "minecraft:golden_horse_armor"
-    GOLDEN_LEGGINGS = "minecraft:golden_leggings"
-    GOLDEN_PICKAXE = "minecraft:golden_pickaxe"
-    GOLDEN_SHOVEL = "minecraft:golden_shovel"
-    GOLDEN_SWORD = "minecraft:golden_sword"
-    GRANITE = "minecraft:granite"
-    GRANITE_SLAB = "minecraft:granite_slab"
-    GRANITE_STAIRS = "minecraft:granite_stairs"
-    GRANITE_WALL = "minecraft:granite_wall"
-    GRASS_BLOCK = "minecraft:grass_block"
-    GRAVEL = "minecraft:gravel"
-    GRAY_BANNER = "minecraft:gray_banner"
-    GRAY_BED = "minecraft:gray_bed"
-    GRAY_CANDLE = "minecraft:gray_candle"
-    GRAY_CARPET = "minecraft:gray_carpet"
-    GRAY_CONCRETE = "minecraft:gray_concrete"
-    GRAY_CONCRETE_POWDER = "minecraft:gray_concrete_powder"
-    GRAY_DYE = "minecraft:gray_dye"
-    GRAY_GLAZED_TERRACOTTA = "minecraft:gray_glazed_terracotta"
-    GRAY_SHULKER_BOX = "minecraft:gray_shulker_box"
-    GRAY_STAINED_GLASS = "minecraft:gray_stained_glass"
-    GRAY_STAINED_GLASS_PANE = "minecraft:gray_stained_glass_pane"
-    GRAY_TERRACOTTA = "minecraft:gray_terracotta"
-    GRAY_WOOL = "minecraft:gray_wool"
-    GREEN_BANNER = "minecraft:green_banner"
-    GREEN_BED = "minecraft:green_bed"
-    GREEN_CANDLE = "minecraft:green_candle"
-    GREEN_CARPET = "minecraft:green_carpet"
-    GREEN_CONCRETE = "minecraft:green_concrete"
-    GREEN_CONCRETE_POWDER = "minecraft:green_concrete_powder"
-    GREEN_DYE = "minecraft:green_dye"
-    GREEN_GLAZED_TERRACOTTA = "minecraft:green_glazed_terracotta"
-    GREEN_SHULKER_BOX = "minecraft:green_shulker_box"
-    GREEN_STAINED_GLASS = "minecraft:green_stained_glass"
-    GREEN_STAINED_GLASS_PANE = "minecraft:green_stained_glass_pane"
-    GREEN_TERRACOTTA = "minecraft:green_terracotta"
-    GREEN_WOOL = "minecraft:green_wool"
-    GRINDSTONE = "minecraft:grindstone"
-    GUARDIAN_SPAWN_EGG = "minecraft:guardian_spawn_egg"
-    GUNPOWDER = "minecraft:gunpowder"
-    GUSTER_BANNER_PATTERN = "minecraft:guster_banner_pattern"
-    GUSTER_POTTERY_SHARD = "minecraft:guster_ppottery_shard"
-
-    # H
-    HANGING_ROOTS = "minecraft:hanging_roots"
-    HAY_BLOCK = "minecraft:hay_block"
-    HEART_OF_THE_SEA = "minecraft:heart_of_the_sea"
-    HEART_POTTERY_SHARD = "minecraft:heart_pottery_shard"
-    HEARTBREAK_POTTERY_SHARD = "minecraft:heartbreak_pottery_shard"
-    HEAVY_CORE = "minecraft:heavy_core"
-    HEAVY_WEIGHTED_PRESSURE_PLATE = "minecraft:heavy_weighted_pressure_plate"
-    HOGLIN_SPAWN_EGG = "minecraft:hoglin_spawn_egg"
-    HONEY_BLOCK = "minecraft:honey_block"
-    HONEY_BOTTLE = "minecraft:honey_bottle"
-    HONEYCOMB = "minecraft:honeycomb"
-    HONEYCOMB_BLOCK = "minecraft:honeycomb_block"
-    HOPPER = "minecraft:hopper"
-    HOPPER_MINECART = "minecraft:hopper_minecart"
-    HORN_CORAL = "minecraft:horn_coral"
-    HORN_CORAL_BLOCK = "minecraft:horn_coral_block"
-    HORN_CORAL_FAN = "minecraft:horn_coral_fan"
-    HORSE_SPAWN_EGG = "minecraft:horse_spawn_egg"
-    HOST_ARMOR_TRIM_SMITHING_TEMPLATE = "minecraft:host_armor_trim_smithing_template"
-    HOWL_POTTERY_SHARD = "minecraft:howl_pottery_shard"
-    HUSK_SPAWN_EGG = "minecraft:husk_spawn_egg"
-
-    # I
-    ICE = "minecraft:ice"
-    INFESTED_CHISELED_STONE_BRICKS = "minecraft:infested_chiseled_stone_bricks"
-    INFESTED_COBBLESTONE = "minecraft:infested_cobblestone"
-    INFESTED_CRACKED_STONE_BRICKS = "minecraft:infested_cracked_stone_bricks"
-    INFESTED_DEEPSLATE = "minecraft:infested_deepslate"
-    INFESTED_MOSSY_STONE_BRICKS = "minecraft:infested_mossy_stone_bricks"
-    INFESTED_STONE = "minecraft:infested_stone"
-    INFESTED_STONE_BRICKS = "minecraft:infested_stone_bricks"
-    INK_SAC = "minecraft:ink_sac"
-    IRON_AXE = "minecraft:iron_axe"
-    IRON_BARS = "minecraft:iron_bars"
-    IRON_BLOCK = "minecraft:iron_block"
-    IRON_BOOTS = "minecraft:iron_boots"
-    IRON_CHESTPLATE = "minecraft:iron_chestplate"
-    IRON_DOOR = "minecraft:iron_door"
-    IRON_GOLEM_SPAWN_EGG = "minecraft:iron_golem_spawn_egg"
-    IRON_HELMET = "minecraft:iron_helmet"
-    IRON_HOE = "minecraft:iron_hoe"
-    IRON_HORSE_ARMOR = "minecraft:iron_horse_armor"
-    IRON_INGOT = "minecraft:iron_ingot"
-    IRON_LEGGINGS = "minecraft:iron_leggings"
-    IRON_NUGGET = "minecraft:iron_nugget"
-    IRON_ORE = "minecraft:iron_ore"
-    IRON_PICKAXE = "minecraft:iron_pickaxe"
-    IRON_SHOVEL = "minecraft:iron_shovel"
-    IRON_SWORD = "minecraft:iron_sword"
-    IRON_TRAPDOOR = "minecraft:iron_trapdoor"
-    ITEM_FRAME = "minecraft:item_frame"
-
-    # J
-    JACK_O_LANTERN = "minecraft:jack_o_lantern"
-    JIGSAW = "minecraft:jigsaw"
-    JUKEBOX = "minecraft:jukebox"
-    JUNGLE_BOAT = "minecraft:jungle_boat"
-    JUNGLE_BUTTON = "minecraft:jungle_button"
-    JUNGLE_CHEST_BOAT = "minecraft:jungle_chest_boat"
-    JUNGLE_DOOR = "minecraft:jungle_door"
-    JUNGLE_FENCE = "minecraft:jungle_fence"
-    JUNGLE_FENCE_GATE = "minecraft:jungle_fence_gate"
-    JUNGLE_HANGING_SIGN = "minecraft:jungle_hanging_sign"
-    JUNGLE_LEAVES = "minecraft:jungle_leaves"
-    JUNGLE_LOG = "minecraft:jungle_log"
-    JUNGLE_PLANKS = "minecraft:jungle_planks"
-    JUNGLE_PRESSURE_PLATE = "minecraft:jungle_pressure_plate"
-    JUNGLE_SAPLING = "minecraft:jungle_sapling"
-    JUNGLE_SIGN = "minecraft:jungle_sign"
-    JUNGLE_SLAB = "minecraft:jungle_slab"
-    JUNGLE_STAIRS = "minecraft:jungle_stairs"
-    JUNGLE_TRAPDOOR = "minecraft:jungle_trapdoor"
-    JUNGLE_WOOD = "minecraft:jungle_wood"
-
-    # K
-    KELP = "minecraft:kelp"
-    KNOWLEDGE_BOOK = "minecraft:knowledge_book"
-
-    # L
-    LADDER = "minecraft:ladder"
-    LANTERN = "minecraft:lantern"
-    LAPIS_BLOCK = "minecraft:lapis_block"
-    LAPIS_LAZULI = "minecraft:lapis_lazuli"
-    LAPIS_ORE = "minecraft:lapis_ore"
-    LARGE_AMETHYST_BUD = "minecraft:large_amethyst_bud"
-    LARGE_FERN = "minecraft:large_fern"
-    LAVA_BUCKET = "minecraft:lava_bucket"
-    LEAD = "minecraft:lead"
-    LEATHER = "minecraft:leather"
-    LEATHER_BOOTS = "minecraft:leather_boots"
-    LEATHER_CHESTPLATE = "minecraft:leather_chestplate"
-    LEATHER_HELMET = "minecraft:leather_helmet"
-    LEATHER_HORSE_ARMOR = "minecraft:leather_horse_armor"
-    LEATHER_LEGGINGS = "minecraft:leather_leggings"
-    LECTERN = "minecraft:lectern"
-    LEVER = "minecraft:lever"
-    LIGHT = "minecraft:light"
-    LIGHT_BLUE_BANNER = "minecraft:light_blue_banner"
-    LIGHT_BLUE_BED = "minecraft:light_blue_bed"
-    LIGHT_BLUE_CANDLE = "minecraft:light_blue_candle"
-    LIGHT_BLUE_CARPET = "minecraft:light_blue_carpet"
-    LIGHT_BLUE_CONCRETE = "minecraft:light_blue_concrete"
-    LIGHT_BLUE_CONCRETE_POWDER = "minecraft:light_blue_concrete_powder"
-    LIGHT_BLUE_DYE = "minecraft:light_blue_dye"
-    LIGHT_BLUE_GLAZED_TERRACOTTA = "minecraft:light_blue_glazed_terracotta"
-    LIGHT_BLUE_SHULKER_BOX = "minecraft:light_blue_shulker_box"
-    LIGHT_BLUE_STAINED_GLASS = "minecraft:light_blue_stained_glass"
-    LIGHT_BLUE_STAINED_GLASS_PANE = "minecraft:light_blue_stained_glass_pane"
-    LIGHT_BLUE_TERRACOTTA = "minecraft:light_blue_terracotta"
-    LIGHT_BLUE_WOOL = "minecraft:light_blue_wool"
-    LIGHT_GRAY_BANNER = "minecraft:light_gray_banner"
-    LIGHT_GRAY_BED = "minecraft:light_gray_bed"
-    LIGHT_GRAY_CANDLE = "minecraft:light_gray_candle"
-    LIGHT_GRAY_CARPET = "minecraft:light_gray_carpet"
-    LIGHT_GRAY_CONCRETE = "minecraft:light_gray_concrete"
-    LIGHT_GRAY_CONCRETE_POWDER = "minecraft:light_gray_concrete_powder"
-    LIGHT_GRAY_DYE = "minecraft:light_gray_dye"
-    LIGHT_GRAY_GLAZED_TERRACOTTA = "minecraft:light_gray_glazed_terracotta"
-    LIGHT_GRAY_SHULKER_BOX = "minecraft:light_gray_shulker_box"
-    LIGHT_GRAY_STAINED_GLASS = "minecraft:light_gray_stained_glass"
-    LIGHT_GRAY_STAINED_GLASS_PANE = "minecraft:light_gray_stained_glass_pane"
-    LIGHT_GRAY_TERRACOTTA = "minecraft:light_gray_terracotta"
-    LIGHT_GRAY_WOOL = "minecraft:light_gray_wool"
-    LIGHT_WEIGHTED_PRESSURE_PLATE = "minecraft:light_weighted_pressure_plate"
-    LIGHTNING_ROD = "minecraft:lightning_rod"
-    LILAC = "minecraft:lilac"
-    LILY_OF_THE_VALLEY = "minecraft:lily_of_the_valley"
-    LILY_PAD = "minecraft:lily_pad"
-    LIME_BANNER = "minecraft:lime_banner"
-    LIME_BED = "minecraft:lime_bed"
-    LIME_CANDLE = "minecraft:lime_candle"
-    LIME_CARPET = "minecraft:lime_carpet"
-    LIME_CONCRETE = "minecraft:lime_concrete"
-    LIME_CONCRETE_POWDER = "minecraft:lime_concrete_powder"
-    LIME_DYE = "minecraft:lime_dye"
-    LIME_GLAZED_TERRACOTTA = "minecraft:lime_glazed_terracotta"
-    LIME_SHULKER_BOX = "minecraft:lime_shulker_box"
-    LIME_STAINED_GLASS = "minecraft:lime_stained_glass"
-    LIME_STAINED_GLASS_PANE = "minecraft:lime_stained_glass_pane"
-    LIME_TERRACOTTA = "minecraft:lime_terracotta"
-    LIME_WOOL = "minecraft:lime_wool"
-    LINGERING_POTION = "minecraft:lingering_potion"
-    LLAMA_SPAWN_EGG = "minecraft:llama_spawn_egg"
-    LODESTONE = "minecraft:lodestone"
-    LOOM = "minecraft:loom"
-
-    # M
-    MACE = "minecraft:mace"
-    MAGENTA_BANNER = "minecraft:magenta_banner"
-    MAGENTA_BED = "minecraft:magenta_bed"
-    MAGENTA_CANDLE = "minecraft:magenta_candle"
-    MAGENTA_CARPET = "minecraft:magenta_carpet"
-    MAGENTA_CONCRETE = "minecraft:magenta_concrete"
-    MAGENTA_CONCRETE_POWDER = "minecraft:magenta_concrete_powder"
-    MAGENTA_DYE = "minecraft:magenta_dye"
-    MAGENTA_GLAZED_TERRACOTTA = "minecraft:magenta_glazed_terracotta"
-    MAGENTA_SHULKER_BOX = "minecraft:magenta_shulker_box"
-    MAGENTA_STAINED_GLASS = "minecraft:magenta_stained_glass"
-    MAGENTA_STAINED_GLASS_PANE = "minecraft:magenta_stained_glass_pane"
-    MAGENTA_TERRACOTTA = "minecraft:magenta_terracotta"
-    MAGENTA_WOOL = "minecraft:magenta_wool"
-    MAGMA_BLOCK = "minecraft:magma_block"
-    MAGMA_CREAM = "minecraft:magma_cream"
-    MAGMA_CUBE_SPAWN_EGG = "minecraft:magma_cube_spawn_egg"
-    MANGROVE_BOAT = "minecraft:mangrove_boat"
-    MANGROVE_BUTTON = "minecraft:mangrove_button"
-    MANGROVE_CHEST_BOAT = "minecraft:mangrove_chest_boat"
-    MANGROVE_DOOR = "minecraft:mangrove_door"
-    MANGROVE_FENCE = "minecraft:mangrove_fence"
-    MANGROVE_FENCE_GATE = "minecraft:mangrove_fence_gate"
-    MANGROVE_HANGING_SIGN = "minecraft:mangrove_hanging_sign"
-    MANGROVE_LEAVES = "minecraft:mangrove_leaves"
-    MANGROVE_LOG = "minecraft:mangrove_log"
-    MANGROVE_PLANKS = "minecraft:mangrove_planks"
-    MANGROVE_PRESSURE_PLATE = "minecraft:mangrove_pressure_plate"
-    MANGROVE_PROPAGULE = "minecraft:mangrove_propagule"
-    MANGROVE_ROOTS = "minecraft:mangrove_roots"
-    MANGROVE_SIGN = "minecraft:mangrove_sign"
-    MANGROVE_SLAB = "minecraft:mangrove_slab"
-    MANGROVE_STAIRS = "minecraft:mangrove_stairs"
-    MANGROVE_TRAPDOOR = "minecraft:mangrove_trapdoor"
-    MANGROVE_WOOD = "minecraft:mangrove_wood"
-    MAP = "minecraft:map"
-    MEDIUM_AMETHYST_BUD = "minecraft:medium_amethyst_bud"
-    MELON = "minecraft:melon"
-    MELON_SEEDS = "minecraft:melon_seeds"
-    MELON_SLICE = "minecraft:melon_slice"
-    MILK_BUCKET = "minecraft:milk_bucket"
-    MINECART = "minecraft:minecart"
-    MINER_POTTERY_SHARD = "minecraft:miner_pottery_shard"
-    MOJANG_BANNER_PATTERN = "minecraft:mojang_banner_pattern"
-    MOOSHROOM_SPAWN_EGG = "minecraft:mooshroom_spawn_egg"
-    MOSS_BLOCK = "minecraft:moss_block"
-    MOSS_CARPET = "minecraft:moss_carpet"
-    MOSSY_COBBLESTONE = "minecraft:mossy_cobblestone"
-    MOSSY_COBBLESTONE_SLAB = "minecraft:mossy_cobblestone_slab"
-    MOSSY_COBBLESTONE_STAIRS = "minecraft:mossy_cobblestone_stairs"
-    MOSSY_COBBLESTONE_WALL = "minecraft:mossy_cobblestone_wall"
-    MOSSY_STONE_BRICK_SLAB = "minecraft:mossy_stone_brick_slab"
-    MOSSY_STONE_BRICK_STAIRS = "minecraft:mossy_stone_brick_stairs"
-    MOSSY_STONE_BRICK_WALL = "minecraft:mossy_stone_brick_wall"
-    MOSSY_STONE_BRICKS = "minecraft:mossy_stone_bricks"
-    MOURNER_POTTERY_SHARD = "minecraft:mourner_pottery_shard"
-    MUD = "minecraft:mud"
-    MUD_BRICKS_SLAB = "minecraft:mud_bricks_slab"
-    MUD_BRICKS_STAIRS = "minecraft:mud_bricks_stairs"
-    MUD_BRICKS_WALL = "minecraft:mud_bricks_wall"
-    MUD_BRICKS = "minecraft:mud_bricks"
-    MUDDY_MANGROVE_ROOTS = "minecraft:muddy_mangrove_roots"
-    MULE_SPAWN_EGG = "minecraft:mule_spawn_egg"
-    MUSHROOM_STEM = "minecraft:mushroom_stem"
-    MUSHROOM_STEW = "minecraft:mushroom_stew"
-    MUSIC_DISC_11 = "minecraft:music_disc_11"
-    MUSIC_DISC_13 = "minecraft:music_disc_13"
-    MUSIC_DISC_5 = "minecraft:music_disc_5"
-    MUSIC_DISC_BLOCKS = "minecraft:music_disc_blocks"
-    MUSIC_DISC_CAT = "minecraft:music_disc_cat"
-    MUSIC_DISC_CHIRP = "minecraft:music_disc_chirp"
-    MUSIC_DISC_CREATOR = "minecraft:music_disc_creator"
-    MUSIC_DISC_CREATOR_MUSIC_BOX = "minecraft:music_disc_creator_music_box"
-    MUSIC_DISC_FAR = "minecraft:music_disc_far"
-    MUSIC_DISC_MALL = "minecraft:music_disc_mall"
-    MUSIC_DISC_MELLOHI = "minecraft:music_disc_mellohi"
-    MUSIC_DISC_OTHERSIDE = "minecraft:music_disc_otherside"
-    MUSIC_DISC_PIGSTEP = "minecraft:music_disc_pigstep"
-    MUSIC_DISC_PRECIPICE = "minecraft:music_disc_precipice"
-    MUSIC_DISC_RELIC = "minecraft:music_disc_relic"
-    MUSIC_DISC_STAL = "minecraft:music_disc_stal"
-    MUSIC_DISC_STRAD = "minecraft:music_disc_strad"
-    MUSIC_DISC_WAIT = "minecraft:music_disc_wait"
-    MUSIC_DISC_WARD = "minecraft:music_disc_ward"
-    MUTTON = "minecraft:mutton"
-    MYCELIUM = "minecraft:mycelium"
-
-    # N
-    NAME_TAG = "minecraft:name_tag"
-    NAUTILUS_SHELL = "minecraft:nautilus_shell"
-    NETHER_BRICK = "minecraft:nether_brick"
-    NETHER_BRICK_FENCE = "minecraft:nether_brick_fence"
-    NETHER_BRICK_SLAB = "minecraft:nether_brick_slab"
-    NETHER_BRICK_STAIRS = "minecraft:nether_brick_stairs"
-    NETHER_BRICK_WALL = "minecraft:nether_brick_wall"
-    NETHER_BRICKS = "minecraft:nether_bricks"
-    NETHER_GOLD_ORE = "minecraft:nether_gold_ore"
-    NETHER_QUARTZ_ORE = "minecraft:nether_quartz_ore"
-    NETHER_SPROUTS = "minecraft:nether_sprouts"
-    NETHER_STAR = "minecraft:nether_star"
-    NETHER_WART = "minecraft:nether_wart"
-    NETHER_WART_BLOCK = "minecraft:nether_wart_block"
-    NETHERITE_AXE = "minecraft:netherite_axe"
-    NETHERITE_BLOCK = "minecraft:netherite_block"
-    NETHERITE_BOOTS = "minecraft:netherite_boots"
-    NETHERITE_CHESTPLATE = "minecraft:netherite_chestplate"
-    NETHERITE_HELMET = "minecraft:netherite_helmet"
-    NETHERITE_HOE = "minecraft:netherite_hoe"
-    NETHERITE_INGOT = "minecraft:netherite_ingot"
-    NETHERITE_LEGGINGS = "minecraft:netherite_leggings"
-    NETHERITE_PICKAXE = "minecraft:netherite_pickaxe"
-    NETHERITE_SCRAP = "minecraft:netherite_scrap"
-    NETHERITE_SHOVEL = "minecraft:netherite_shovel"
-    NETHERITE_SWORD = "minecraft:netherite_sword"
-    NETHERITE_UPGRADE_SMITHING_TEMPLATE = (
-        "minecraft:netherite_upgrade_smithing_template"
+import mmap
+import struct
+import sys
+import zlib
+from typing import Iterable, Iterator, Literal
+
+MinecraftVersion = Literal["1.21"]
+
+# 名前空間を省略したIDに付ける名前空間
+DEFAULT_NAMESPACE = "minecraft"
+
+
+class MinecraftId(str):
+    """マインクラフトID
+
+    文字列としてそのままコマンドに使用できます。列挙型の要素と同様にnameとvalueを持ちます。
+    """
+
+    name: str
+
+    @property
+    def value(self) -> str:
+        return str(self)
+
+
+class IdRegistry:
+    """複数バージョンのマインクラフトIDを1つのデータファイルで管理するクラス
+
+    データファイルはメモリマップで読み込み、Pythonのオブジェクトには展開しません。
+    全てのバージョンのIDは重複なく1つの文字列表に格納され、IDごとに
+    「そのIDを含むバージョン」のビット(バージョンごとのメンバーシップのビット集合)を
+    持ちます。そのため、バージョンを増やしても増えるのはIDごとの1ビットだけで、
+    あるIDを含むバージョンの取得も定数時間で行えます。
+    IDと名前からの検索には、ファイルに格納したオープンアドレス法のハッシュ表を使用します。
+
+    ファイルの形式(リトルエンディアン):
+        ヘッダー: マジック(4) | 形式(u16) | バージョン数(u16) | ID数(u32) | ハッシュ表の大きさ(u32)
+        バージョン名: バージョン数 x 16バイト(NUL埋め)
+        メンバーシップ: ID数 x u32 (ビットvがv番目のバージョンを表す)
+        文字列のオフセット: (ID数 x 2 + 1) x u32 (IDと名前を交互に格納)
+        IDのハッシュ表, 名前のハッシュ表: ハッシュ表の大きさ x (CRC32(u32), インデックス + 1(u32))
+            (インデックスの部分が0の場合は空)
+        文字列: UTF-8
+    """
+
+    MAGIC = b"MCID"
+    FORMAT = 1
+    # u32のビット数
+    MAX_VERSIONS = 32
+
+    __header = struct.Struct("<4sHHII")
+    __u32 = struct.Struct("<I")
+
+    def __init__(self, data: bytes | mmap.mmap):
+        """
+        Args:
+        -----
+            data (bytes | mmap.mmap): build_registryで作成したデータ
+        """
+        magic, format, version_count, self.__count, self.__hash_size = (
+            self.__header.unpack_from(data, 0)
+        )
+        if magic != self.MAGIC or format != self.FORMAT:
+            raise ValueError("マインクラフトIDのデータファイルの形式が不正です。")
+        self.__data = data
+
+        offset = self.__header.size
+        self.versions: tuple[str, ...] = tuple(
+            bytes(data[offset + i * 16 : offset + (i + 1) * 16])
+            .rstrip(b"\0")
+            .decode("ascii")
+            for i in range(version_count)
+        )
+        offset += version_count * 16
+        self.__masks = offset
+        offset += self.__count * 4
+        self.__offsets = offset
+        offset += (self.__count * 2 + 1) * 4
+        self.__id_hash = offset
+        offset += self.__hash_size * 8
+        self.__name_hash = offset
+        offset += self.__hash_size * 8
+        self.__strings = offset
+        # ヘッダー以降の文字列の手前までは全て4バイト境界に揃っている
+        if sys.byteorder == "little":
+            self.__words = memoryview(data)[:offset].cast("I")
+        else:
+            self.__words = None
+
+        self.__tables: dict[str, IdTable] = {}
+
+    @classmethod
+    def open(cls, path) -> "IdRegistry":
+        """データファイルをメモリマップで開きます。"""
+        with open(path, "rb") as f:
+            return cls(mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ))
+
+    def __len__(self) -> int:
+        """全てのバージョンを合わせたIDの数"""
+        return self.__count
+
+    def __contains__(self, id: object) -> bool:
+        """いずれかのバージョンにIDが含まれるかを返します。"""
+        return isinstance(id, str) and self.index(id) is not None
+
+    def __read_u32(self, offset: int) -> int:
+        if self.__words is not None:
+            return self.__words[offset >> 2]
+        return self.__u32.unpack_from(self.__data, offset)[0]
+
+    def __string(self, slot: int) -> bytes:
+        start = self.__read_u32(self.__offsets + slot * 4)
+        end = self.__read_u32(self.__offsets + slot * 4 + 4)
+        return self.__data[self.__strings + start : self.__strings + end]
+
+    def id(self, index: int) -> str:
+        """インデックスのIDを返します。"""
+        return self.__string(index * 2).decode("utf-8")
+
+    def name(self, index: int) -> str:
+        """インデックスの名前(MCID.STONEのSTONE)を返します。"""
+        return self.__string(index * 2 + 1).decode("utf-8")
+
+    def mask(self, index: int) -> int:
+        """インデックスのIDを含むバージョンのビット集合を返します。"""
+        return self.__read_u32(self.__masks + index * 4)
+
+    def __lookup(self, table: int, key: str, slot_offset: int) -> Iterator[int]:
+        # 同じIDや名前がバージョンによって別の項目になっている場合があるため、
+        # 一致する項目を全て返す
+        encoded = key.encode("utf-8")
+        hash = zlib.crc32(encoded)
+        mask = self.__hash_size - 1
+        slot = hash & mask
+        while True:
+            value = self.__read_u32(table + slot * 8 + 4)
+            if value == 0:
+                return
+            # 文字列の比較はハッシュ値が一致した場合のみ行う
+            if self.__read_u32(table + slot * 8) == hash and (
+                self.__string((value - 1) * 2 + slot_offset) == encoded
+            ):
+                yield value - 1
+            slot = (slot + 1) & mask
+
+    def __first(self, indices: Iterator[int], bit: int | None) -> int | None:
+        for index in indices:
+            if bit is None or self.mask(index) >> bit & 1:
+                return index
+        return None
+
+    def index(self, id: str, bit: int | None = None) -> int | None:
+        """IDのインデックスを返します。存在しない場合はNone
+
+        bitを指定した場合は、そのビットのバージョンに含まれる項目のみを返します。
+        """
+        return self.__first(self.__lookup(self.__id_hash, id, 0), bit)
+
+    def index_of_name(self, name: str, bit: int | None = None) -> int | None:
+        """名前のインデックスを返します。存在しない場合はNone
+
+        bitを指定した場合は、そのビットのバージョンに含まれる項目のみを返します。
+        """
+        return self.__first(self.__lookup(self.__name_hash, name, 1), bit)
+
+    def versions_of(self, id: str) -> tuple[str, ...]:
+        """IDを含むバージョンを返します。"""
+        mask = 0
+        for index in self.__lookup(self.__id_hash, id, 0):
+            mask |= self.mask(index)
+        return tuple(
+            version for bit, version in enumerate(self.versions) if mask >> bit & 1
+        )
+
+    def table(self, version: str) -> "IdTable":
+        """バージョンのIDの表を返します。"""
+        table = self.__tables.get(version)
+        if table is None:
+            if version not in self.versions:
+                raise ValueError("バージョン非対応です。")
+            table = self.__tables[version] = IdTable(
+                version, self, self.versions.index(version)
+            )
+        return table
+
+
+class IdTable:
+    """バージョンごとのマインクラフトIDの表
+
+    列挙型と同様に、MCID.STONEのように属性としてIDを取得できます。
+    IDの文字列(MinecraftId)は初めてアクセスしたときにIdRegistryから取り出し、
+    以降は通常の属性として辞書の参照だけで取得できます。
+
+    Example:
+    --------
+    ```python
+    MCID = GET_MCID("1.21")
+    server.set_block(pos, MCID.STONE)
+    MCID("minecraft:stone")  # -> MCID.STONE
+    "minecraft:stone" in MCID  # -> True
+    ```
+    """
+
+    def __init__(self, version: str, registry: IdRegistry, bit: int):
+        """
+        Args:
+        -----
+            version (str): マインクラフトのバージョン
+            registry (IdRegistry): IDを格納しているIdRegistry
+            bit (int): メンバーシップのビット集合でこのバージョンを表すビットの位置
+        """
+        self.version = version
+        self._registry = registry
+        self._bit = bit
+        self._len: int | None = None
+
+    def __getattr__(self, name: str) -> MinecraftId:
+        # 通常の属性として見つからなかった場合のみ呼ばれる
+        registry = self.__dict__.get("_registry")
+        index = None if registry is None else registry.index_of_name(name, self._bit)
+        if index is None:
+            version = self.__dict__.get("version")
+            raise AttributeError(f"{name}はバージョン{version}のIDにありません。")
+        return self.__member(index, name)
+
+    def __member(self, index: int, name: str) -> MinecraftId:
+        member = MinecraftId(self._registry.id(index))
+        member.name = name
+        setattr(self, name, member)
+        return member
+
+    def __indices(self) -> Iterator[int]:
+        registry = self._registry
+        for index in range(len(registry)):
+            if registry.mask(index) >> self._bit & 1:
+                yield index
+
+    def __getitem__(self, name: str) -> MinecraftId:
+        """名前からIDを取得します。"""
+        try:
+            return getattr(self, name)
+        except AttributeError:
+            raise KeyError(name) from None
+
+    def __call__(self, value: str) -> MinecraftId:
+        """IDの文字列から対応するIDを取得します。"""
+        index = self._registry.index(value, self._bit)
+        if index is None:
+            raise ValueError(f"{value}はバージョン{self.version}のIDにありません。")
+        return getattr(self, self._registry.name(index))
+
+    def __contains__(self, value: object) -> bool:
+        if not isinstance(value, str):
+            return False
+        return self._registry.index(value, self._bit) is not None
+
+    def __iter__(self) -> Iterator[MinecraftId]:
+        return (getattr(self, self._registry.name(i)) for i in self.__indices())
+
+    def __len__(self) -> int:
+        if self._len is None:
+            self._len = sum(1 for _ in self.__indices())
+        return self._len
+
+    def __dir__(self) -> list[str]:
+        names = [self._registry.name(i) for i in self.__indices()]
+        return [*super().__dir__(), *names]
+
+    def __repr__(self) -> str:
+        return f"<IdTable {self.version}: {len(self)} ids>"
+
+
+def read_id_list(text: str) -> list[str | tuple[str, str]]:
+    """IDのリスト(mcid_<バージョン>.txt)を読み込み、build_registryに渡せる形式で返します。
+
+    1行に1つのIDを名前空間を省略して記述します。名前がIDを大文字にしたものと
+    異なる場合のみ、"名前 ID"の形式で記述します。
+    """
+    ids: list[str | tuple[str, str]] = []
+    for line in text.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        name, _, id = line.rpartition(" ")
+        ids.append(
+            (name, id if ":" in id else f"{DEFAULT_NAMESPACE}:{id}") if name else id
+        )
+    return ids
+
+
+def build_registry(versions: dict[str, Iterable[str | tuple[str, str]]]) -> bytes:
+    """IdRegistryのデータファイルの内容を作成します。
+
+    Args:
+    -----
+        versions (dict[str, Iterable[str | tuple[str, str]]]): バージョン -> IDのリスト。
+            名前がIDを大文字にしたものと異なる場合は(名前, ID)のタプルで指定します。
+
+    Returns:
+    -------
+        bytes: データファイルの内容
+    """
+    if len(versions) > IdRegistry.MAX_VERSIONS:
+        raise ValueError(f"バージョンは{IdRegistry.MAX_VERSIONS}個までです。")
+
+    # (ID, 名前) -> インデックス。バージョン間で同じものは1つにまとめる
+    entries: dict[tuple[str, str], int] = {}
+    masks: list[int] = []
+    for bit, ids in enumerate(versions.values()):
+        for item in ids:
+            if isinstance(item, str):
+                id = item if ":" in item else f"{DEFAULT_NAMESPACE}:{item}"
+                name = id.partition(":")[2].upper()
+            else:
+                name, id = item
+            index = entries.setdefault((id, name), len(entries))
+            if index == len(masks):
+                masks.append(0)
+            masks[index] |= 1 << bit
+
+    hash_size = 1
+    while hash_size < len(entries) * 2:
+        hash_size *= 2
+    id_hash = [0] * (hash_size * 2)
+    name_hash = [0] * (hash_size * 2)
+    offsets = [0]
+    strings = bytearray()
+    for index, (id, name) in enumerate(entries):
+        for table, key in ((id_hash, id), (name_hash, name)):
+            encoded = key.encode("utf-8")
+            hash = zlib.crc32(encoded)
+            slot = hash & (hash_size - 1)
+            while table[slot * 2 + 1]:
+                slot = (slot + 1) & (hash_size - 1)
+            table[slot * 2] = hash
+            table[slot * 2 + 1] = index + 1
+            strings += encoded
+            offsets.append(len(strings))
+
+    header = struct.pack(
+        "<4sHHII",
+        IdRegistry.MAGIC,
+        IdRegistry.FORMAT,
+        len(versions),
+        len(entries),
+        hash_size,
+    )
+    names = b"".join(v.encode("ascii").ljust(16, b"\0")[:16] for v in versions)
+    return b"".join(
+        [
+            header,
+            names,
+            struct.pack(f"<{len(masks)}I", *masks),
+            struct.pack(f"<{len(offsets)}I", *offsets),
+            struct.pack(f"<{hash_size * 2}I", *id_hash),
+            struct.pack(f"<{hash_size * 2}I", *name_hash),
+            bytes(strings),
+        ]
     )
-    NETHERRACK = "minecraft:netherrack"
-    NOTE_BLOCK = "minecraft:note_block"
-
-    # O
-    OAK_BOAT = "minecraft:oak_boat"
-    OAK_BUTTON = "minecraft:oak_button"
-    OAK_CHEST_BOAT = "minecraft:oak_chest_boat"
-    OAK_DOOR = "minecraft:oak_door"
-    OAK_FENCE = "minecraft:oak_fence"
-    OAK_FENCE_GATE = "minecraft:oak_fence_gate"
-    OAK_HANGING_SIGN = "minecraft:oak_hanging_sign"
-    OAK_LEAVES = "minecraft:oak_leaves"
-    OAK_LOG = "minecraft:oak_log"
-    OAK_PLANKS = "minecraft:oak_planks"
-    OAK_PRESSURE_PLATE = "minecraft:oak_pressure_plate"
-    OAK_SAPLING = "minecraft:oak_sapling"
-    OAK_SIGN = "minecraft:oak_sign"
-    OAK_SLAB = "minecraft:oak_slab"
-    OAK_STAIRS = "minecraft:oak_stairs"
-    OAK_TRAPDOOR = "minecraft:oak_trapdoor"
-    OAK_WOOD = "minecraft:oak_wood"
-    OBSERVER = "minecraft:observer"
-    OBSIDIAN = "minecraft:obsidian"
-    OCELOT_SPAWN_EGG = "minecraft:ocelot_spawn_egg"
-    OCHRE_FROGLIGHT = "minecraft:ochre_froglight"
-    OMINOUS_BOTTLE = "minecraft:ominous_bottle"
-    OMINOUS_TRIAL_KEY = "minecraft:ominous_trial_key"
-    ORANGE_BANNER = "minecraft:orange_banner"
-    ORANGE_BED = "minecraft:orange_bed"
-    ORANGE_CANDLE = "minecraft:orange_candle"
-    ORANGE_CARPET = "minecraft:orange_carpet"
-    ORANGE_CONCRETE = "minecraft:orange_concrete"
-    ORANGE_CONCRETE_POWDER = "minecraft:orange_concrete_powder"
-    ORANGE_DYE = "minecraft:orange_dye"
-    ORANGE_GLAZED_TERRACOTTA = "minecraft:orange_glazed_terracotta"
-    ORANGE_SHULKER_BOX = "minecraft:orange_shulker_box"
-    ORANGE_STAINED_GLASS = "minecraft:orange_stained_glass"
-    ORANGE_STAINED_GLASS_PANE = "minecraft:orange_stained_glass_pane"
-    ORANGE_TERRACOTTA = "minecraft:orange_terracotta"
-    ORANGE_TULIP = "minecraft:orange_tulip"
-    ORANGE_WOOL = "minecraft:orange_wool"
-    OXEYE_DAISY = "minecraft:oxeye_daisy"
-    OXIDIZED_CHISELED_COPPER = "minecraft:oxidized_chiseled_copper"
-    OXIDIZED_COPPER = "minecraft:oxidized_copper"
-    OXIDIZED_COPPER_BULB = "minecraft:oxidized_copper_bulb"
-    OXIDIZED_COPPER_DOOR = "minecraft:oxidized_copper_door"
-    OXIDIZED_COPPER_GRATE = "minecraft:oxidized_copper_grate"
-    OXIDIZED_COPPER_TRAPDOOR = "minecraft:oxidized_copper_trapdoor"
-    OXIDIZED_CUT_COPPER = "minecraft:oxidized_cut_copper"
-    OXIDIZED_CUT_COPPER_SLAB = "minecraft:oxidized_cut_copper_slab"
-    OXIDIZED_CUT_COPPER_STAIRS = "minecraft:oxidized_cut_copper_stairs"
-
-    # P
-    PACKED_ICE = "minecraft:packed_ice"
-    PACKED_MUD = "minecraft:packed_mud"
-    PAINTING = "minecraft:painting"
-    PANDA_SPAWN_EGG = "minecraft:panda_spawn_egg"
-    PAPER = "minecraft:paper"
-    PARROT_SPAWN_EGG = "minecraft:parrot_spawn_egg"
-    PEONY = "minecraft:peony"
-    PETRIFIED_OAK_SLAB = "minecraft:petrified_oak_slab"
-    PHANTOM_MEMBRANE = "minecraft:phantom_membrane"
-    PHANTOM_SPAWN_EGG = "minecraft:phantom_spawn_egg"
-    PIG_SPAWN_EGG = "minecraft:pig_spawn_egg"
-    PIGLIN_BANNER_PATTERN = "minecraft:piglin_banner_pattern"
-    PIGLIN_BRUTE_SPAWN_EGG = "minecraft:piglin_brute_spawn_egg"
-    PIGLIN_HEAD = "minecraft:piglin_head"
-    PIGLIN_SPAWN_EGG = "minecraft:piglin_spawn_egg"
-    PILLAGER_SPAWN_EGG = "minecraft:pillager_spawn_egg"
-    PINK_BANNER = "minecraft:pink_banner"
-    PINK_BED = "minecraft:pink_bed"
-    PINK_CANDLE = "minecraft:pink_candle"
-    PINK_CARPET = "minecraft:pink_carpet"
-    PINK_CONCRETE = "minecraft:pink_concrete"
-    PINK_CONCRETE_POWDER = "minecraft:pink_concrete_powder"
-    PINK_DYE = "minecraft:pink_dye"
-    PINK_GLAZED_TERRACOTTA = "minecraft:pink_glazed_terracotta"
-    PINK_PETALS = "minecraft:pink_petals"
-    PINK_SHULKER_BOX = "minecraft:pink_shulker_box"
-    PINK_STAINED_GLASS = "minecraft:pink_stained_glass"
-    PINK_STAINED_GLASS_PANE = "minecraft:pink_stained_glass_pane"
-    PINK_TERRACOTTA = "minecraft:pink_terracotta"
-    PINK_TULIP = "minecraft:pink_tulip"
-    PINK_WOOL = "minecraft:pink_wool"
-    PISTON = "minecraft:piston"
-    PITCHER_PLANT = "minecraft:pitcher_plant"
-    PITCHER_POD = "minecraft:pitcher_pod"
-    PITCHER_HEAD = "minecraft:pitcher_head"
-    PLENTY_POTTERY_SHARD = "minecraft:plenty_pottery_shard"
-    PODZOL = "minecraft:podzol"
-    POINTED_DRIPSTONE = "minecraft:pointed_dripstone"
-    POISONOUS_POTATO = "minecraft:poisonous_potato"
-    POLAR_BEAR_SPAWN_EGG = "minecraft:polar_bear_spawn_egg"
-    POLISHED_ANDESITE = "minecraft:polished_andesite"
-    POLISHED_ANDESITE_SLAB = "minecraft:polished_andesite_slab"
-    POLISHED_ANDESITE_STAIRS = "minecraft:polished_andesite_stairs"
-    POLISHED_BASALT = "minecraft:polished_basalt"
-    POLISHED_BLACKSTONE = "minecraft:polished_blackstone"
-    POLISHED_BLACKSTONE_BRICK_SLAB = "minecraft:polished_blackstone_brick_slab"
-    POLISHED_BLACKSTONE_BRICK_STAIRS = "minecraft:polished_blackstone_brick_stairs"
-    POLISHED_BLACKSTONE_BRICK_WALL = "minecraft:polished_blackstone_brick_wall"
-    POLISHED_BLACKSTONE_BRICKS = "minecraft:polished_blackstone_bricks"
-    POLISHED_BLACKSTONE_BUTTON = "minecraft:polished_blackstone_button"
-    POLISHED_BLACKSTONE_PRESSURE_PLATE = "minecraft:polished_blackstone_pressure_plate"
-    POLISHED_BLACKSTONE_SLAB = "minecraft:polished_blackstone_slab"
-    POLISHED_BLACKSTONE_STAIRS = "minecraft:polished_blackstone_stairs"
-    POLISHED_BLACKSTONE_WALL = "minecraft:polished_blackstone_wall"
-    POLISHED_DEEPSLATE = "minecraft:polished_deepslate"
-    POLISHED_DEEPSLATE_SLAB = "minecraft:polished_deepslate_slab"
-    POLISHED_DEEPSLATE_STAIRS = "minecraft:polished_deepslate_stairs"
-    POLISHED_DEEPSLATE_WALL = "minecraft:polished_deepslate_wall"
-    POLISHED_DIORITE = "minecraft:polished_diorite"
-    POLISHED_DIORITE_SLAB = "minecraft:polished_diorite_slab"
-    POLISHED_DIORITE_STAIRS = "minecraft:polished_diorite_stairs"
-    POLISHED_GRANITE = "minecraft:polished_granite"
-    POLISHED_GRANITE_SLAB = "minecraft:polished_granite_slab"
-    POLISHED_GRANITE_STAIRS = "minecraft:polished_granite_stairs"
-    POLISHED_TUFF = "minecraft:polished_tuff"
-    POLISHED_TUFF_SLAB = "minecraft:polished_tuff_slab"
-    POLISHED_TUFF_STAIRS = "minecraft:polished_tuff_stairs"
-    POLISHED_TUFF_WALL = "minecraft:polished_tuff_wall"
-    POLISHED_TUFF_FRUIT = "minecraft:polished_tuff_fruit"
-    POPPY = "minecraft:poppy"
-    PORKCHOP = "minecraft:porkchop"
-    POTATO = "minecraft:potato"
-    POTION = "minecraft:potion"
-    POWDER_SNOW_BUCKET = "minecraft:powder_snow_bucket"
-    POWERED_RAIL = "minecraft:powered_rail"
-    PRISMARINE = "minecraft:prismarine"
-    PRISMARINE_BRICK_SLAB = "minecraft:prismarine_brick_slab"
-    PRISMARINE_BRICK_STAIRS = "minecraft:prismarine_brick_stairs"
-    PRISMARINE_BRICKS = "minecraft:prismarine_bricks"
-    PRISMARINE_CRYSTALS = "minecraft:prismarine_crystals"
-    PRISMARINE_SHARD = "minecraft:prismarine_shard"
-    PRISMARINE_SLAB = "minecraft:prismarine_slab"
-    PRISMARINE_STAIRS = "minecraft:prismarine_stairs"
-    PRISMARINE_WALL = "minecraft:prismarine_wall"
-    PRIZE_POTTERY_SHARD = "minecraft:prize_pottery_shard"
-    PUFFERFISH = "minecraft:pufferfish"
-    PUFFERFISH_BUCKET = "minecraft:pufferfish_bucket"
-    PUFFERFISH_SPAWN_EGG = "minecraft:pufferfish_spawn_egg"
-    PUMPKIN = "minecraft:pumpkin"
-    PUMPKIN_PIE = "minecraft:pumpkin_pie"
-    PUMPKIN_SEEDS = "minecraft:pumpkin_seeds"
-    PURPLE_BANNER = "minecraft:purple_banner"
-    PURPLE_BED = "minecraft:purple_bed"
-    PURPLE_CANDLE = "minecraft:purple_candle"
-    PURPLE_CARPET = "minecraft:purple_carpet"
-    PURPLE_CONCRETE = "minecraft:purple_concrete"
-    PURPLE_CONCRETE_POWDER = "minecraft:purple_concrete_powder"
-    PURPLE_DYE = "minecraft:purple_dye"
-    PURPLE_GLAZED_TERRACOTTA = "minecraft:purple_glazed_terracotta"
-    PURPLE_SHULKER_BOX = "minecraft:purple_shulker_box"
-    PURPLE_STAINED_GLASS = "minecraft:purple_stained_glass"
-    PURPLE_STAINED_GLASS_PANE = "minecraft:purple_stained_glass_pane"
-    PURPLE_TERRACOTTA = "minecraft:purple_terracotta"
-    PURPLE_WOOL = "minecraft:purple_wool"
-    PURPUR_BLOCK = "minecraft:purpur_block"
-    PURPUR_PILLAR = "minecraft:purpur_pillar"
-    PURPUR_SLAB = "minecraft:purpur_slab"
-    PURPUR_STAIRS = "minecraft:purpur_stairs"
-
-    # Q
-    QUARTZ = "minecraft:quartz"
-    QUARTZ_BLOCK = "minecraft:quartz_block"
-    QUARTZ_BRICKS = "minecraft:quartz_bricks"
-    QUARTZ_PILLAR = "minecraft:quartz_pillar"
-    QUARTZ_SLAB = "minecraft:quartz_slab"
-    QUARTZ_STAIRS = "minecraft:quartz_stairs"
-
-    # R
-
-    # S
-
-    # T
-
-    # U
-
-    # V
-
-    # W
-
-    # X
-
-    # Y
-
-    # Z
 
 
-MinecraftVersion = Literal["1.21"]
+_registry: IdRegistry | None = None
 
 
-def GET_MCID(MinecraftVersion: MinecraftVersion):
-    """マインクラフトIDの列挙型を取得します。
+def get_registry() -> IdRegistry:
+    """パッケージに同梱されているマインクラフトIDのIdRegistryを返します。
+
+    データファイルは初めて呼び出したときにメモリマップで開きます。
+    (zipからインポートした場合など、ファイルとして存在しない場合はメモリに読み込みます)
+    データファイルはscripts/build_mcid.pyでmcid_<バージョン>.txtから作成します。
+    """
+    global _registry
+    if _registry is None:
+        from importlib.resources import files
+        from pathlib import Path
+
+        resource = files("PyCraftCommander").joinpath("mcid.dat")
+        if isinstance(resource, Path):
+            _registry = IdRegistry.open(resource)
+        else:
+            _registry = IdRegistry(resource.read_bytes())
+    return _registry
+
+
+def GET_MCID(MinecraftVersion: MinecraftVersion) -> IdTable:
+    """マインクラフトIDの表を取得します。
+
+    IDは初めて取得したときにデータファイルから読み込まれます。
+    対応バージョンはget_registry().versionsで確認できます。
 
     対応バージョン:
         - 1.21
     """
+    return get_registry().table(MinecraftVersion)
+
 
-    if MinecraftVersion == "1.21":
-        return V1_21
-    else:
-        raise ValueError("バージョン非対応です。")
+def __getattr__(name: str):
+    # 以前の列挙型(V1_21など)は、使用されたときに表を読み込んで返す
+    if name.startswith("V1_"):
+        version = name[1:].replace("_", ".")
+        if version in get_registry().versions:
+            return GET_MCID(version)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
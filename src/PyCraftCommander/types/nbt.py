@@ -0,0 +1,188 @@
+"""バイナリ形式のNBTを先頭から順に読み込むリーダー
+
+構造物ファイル(.nbt)やschematic(.schem, .litematic)の読み込みに使用します。
+値全体をPythonの値に変換するreadの他に、コンパウンドやリストの要素を1つずつ
+取り出すiter_compound・read_list_header、読み飛ばすskipを持つため、
+巨大なリストをまとめて展開せずに処理できます。
+
+| NBT                               | Python      |
+| --------------------------------- | ----------- |
+| Compound                          | dict        |
+| List                              | list        |
+| Byte Array                        | bytes       |
+| Int Array, Long Array             | array.array |
+| Byte, Short, Int, Long            | int         |
+| Float, Double                     | float       |
+| String                            | str         |
+
+Example:
+--------
+```python
+with open_nbt("house.nbt") as reader:
+    type, name = reader.read_tag()
+    for type, name in reader.iter_compound():
+        if name == "size":
+            size = reader.read(type)
+        else:
+            reader.skip(type)
+```
+"""
+
+import gzip
+import struct
+import sys
+from array import array
+from typing import Any, BinaryIO, Iterator
+
+TAG_END = 0
+TAG_BYTE = 1
+TAG_SHORT = 2
+TAG_INT = 3
+TAG_LONG = 4
+TAG_FLOAT = 5
+TAG_DOUBLE = 6
+TAG_BYTE_ARRAY = 7
+TAG_STRING = 8
+TAG_LIST = 9
+TAG_COMPOUND = 10
+TAG_INT_ARRAY = 11
+TAG_LONG_ARRAY = 12
+
+# 固定長の値の形式
+_SCALARS = {
+    TAG_BYTE: struct.Struct(">b"),
+    TAG_SHORT: struct.Struct(">h"),
+    TAG_INT: struct.Struct(">i"),
+    TAG_LONG: struct.Struct(">q"),
+    TAG_FLOAT: struct.Struct(">f"),
+    TAG_DOUBLE: struct.Struct(">d"),
+}
+# 配列の要素のarrayの型と要素のバイト数
+_ARRAYS = {TAG_INT_ARRAY: ("i", 4), TAG_LONG_ARRAY: ("q", 8)}
+
+_U16 = struct.Struct(">H")
+_I32 = struct.Struct(">i")
+
+
+class NBTReader:
+    """バイナリ形式のNBTを先頭から順に読み込むクラス"""
+
+    def __init__(self, stream: BinaryIO):
+        """
+        Args:
+        -----
+            stream (BinaryIO): 展開済みのNBTを読み込めるファイルオブジェクト
+        """
+        self.__stream = stream
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        self.__stream.close()
+
+    def __read(self, size: int) -> bytes:
+        data = self.__stream.read(size)
+        if len(data) != size:
+            raise ValueError("NBTのデータが途中で終わっています。")
+        return data
+
+    def read_tag(self) -> tuple[int, str]:
+        """タグの種類と名前を読み込みます。TAG_ENDの場合、名前は空文字列です。"""
+        type = self.__read(1)[0]
+        if type == TAG_END:
+            return TAG_END, ""
+        return type, self.read_string()
+
+    def read_string(self) -> str:
+        """文字列の値を読み込みます。"""
+        (length,) = _U16.unpack(self.__read(2))
+        # NBTの文字列はModified UTF-8だが、ブロックIDなどの範囲ではUTF-8と同じ
+        return self.__read(length).decode("utf-8", errors="surrogateescape")
+
+    def read_list_header(self) -> tuple[int, int]:
+        """リストの要素の種類と要素数を読み込みます。
+
+        続けて要素数だけread(要素の種類)またはskip(要素の種類)を呼び出してください。
+        """
+        type = self.__read(1)[0]
+        (length,) = _I32.unpack(self.__read(4))
+        return type, max(length, 0)
+
+    def iter_compound(self) -> Iterator[tuple[int, str]]:
+        """コンパウンドの要素の種類と名前を順番に返します。
+
+        要素ごとに、次の要素に進む前にread(種類)またはskip(種類)で値を読んでください。
+        """
+        while True:
+            type, name = self.read_tag()
+            if type == TAG_END:
+                return
+            yield type, name
+
+    def read(self, type: int) -> Any:
+        """値を読み込み、Pythonの値に変換します。"""
+        scalar = _SCALARS.get(type)
+        if scalar is not None:
+            return scalar.unpack(self.__read(scalar.size))[0]
+        if type == TAG_STRING:
+            return self.read_string()
+        if type == TAG_BYTE_ARRAY:
+            (length,) = _I32.unpack(self.__read(4))
+            return self.__read(length)
+        if type in _ARRAYS:
+            typecode, size = _ARRAYS[type]
+            (length,) = _I32.unpack(self.__read(4))
+            values = array(typecode, self.__read(length * size))
+            if sys.byteorder == "little":
+                values.byteswap()
+            return values
+        if type == TAG_LIST:
+            element_type, length = self.read_list_header()
+            return [self.read(element_type) for _ in range(length)]
+        if type == TAG_COMPOUND:
+            return {
+                name: self.read(value_type) for value_type, name in self.iter_compound()
+            }
+        raise ValueError(f"不明なNBTのタグです。: {type}")
+
+    def skip(self, type: int):
+        """値を読み飛ばします。"""
+        scalar = _SCALARS.get(type)
+        if scalar is not None:
+            self.__read(scalar.size)
+        elif type == TAG_STRING:
+            (length,) = _U16.unpack(self.__read(2))
+            self.__skip_bytes(length)
+        elif type == TAG_BYTE_ARRAY:
+            (length,) = _I32.unpack(self.__read(4))
+            self.__skip_bytes(length)
+        elif type in _ARRAYS:
+            (length,) = _I32.unpack(self.__read(4))
+            self.__skip_bytes(length * _ARRAYS[type][1])
+        elif type == TAG_LIST:
+            element_type, length = self.read_list_header()
+            for _ in range(length):
+                self.skip(element_type)
+        elif type == TAG_COMPOUND:
+            for value_type, _ in self.iter_compound():
+                self.skip(value_type)
+        else:
+            raise ValueError(f"不明なNBTのタグです。: {type}")
+
+    def __skip_bytes(self, size: int):
+        # 大きな配列を読み飛ばす場合も一度に確保しない
+        while size > 0:
+            size -= len(self.__read(min(size, 65536)))
+
+
+def open_nbt(path) -> NBTReader:
+    """NBTファイルを開きます。gzipで圧縮されている場合は展開しながら読み込みます。"""
+    with open(path, "rb") as f:
+        compressed = f.read(2) == b"\x1f\x8b"
+    if compressed:
+        return NBTReader(gzip.open(path, "rb"))
+    return NBTReader(open(path, "rb"))
@@ -27,8 +27,8 @@ class Player:
     ----------
     name: プレイヤー名
     Pos: プレイヤーの座標(x,y,z)
-    dimension: プレイヤーのディメンション
-    gamemode: ゲームモード
+    dimension: プレイヤーのディメンション(minecraft:overworldなど)
+    gamemode: ゲームモード(GameMode)
     """
 
     name: str
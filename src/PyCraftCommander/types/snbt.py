@@ -0,0 +1,202 @@
+"""SNBT(文字列形式のNBT)のパーサー
+
+`data get`コマンドのレスポンスをPythonの値に変換します。
+
+| SNBT                       | Python      |
+| -------------------------- | ----------- |
+| {a: 1b}                    | dict        |
+| [1.0d, 2.0d]               | list        |
+| [B; ...] [I; ...] [L; ...] | array.array |
+| 1b, 1s, 1, 1L              | int         |
+| 1.0f, 1.0d, 1.0            | float       |
+| true, false                | bool        |
+| "abc", 'abc', abc          | str         |
+
+Example:
+--------
+```python
+response, status = server.send_command("data get entity Steve", multi_packet=True)
+data = snbt.parse_data_get(response)
+print(data["Pos"], data["Inventory"])
+```
+"""
+
+import re
+from array import array
+from typing import Any
+
+# data getのレスポンスの前置き部分
+# 例: "Steve has the following entity data: "
+_DATA_GET_PREFIX = re.compile(
+    r"^.*? has the following (?:entity data|block data|contents): ", re.S
+)
+# 1つのトークン。先頭の空白を読み飛ばし、どの選択肢に一致したかをlastindexで判別する
+# 文字列の直後に':'がある場合はコンパウンドのキーとして':'まで1つのトークンにする
+_TOKEN = re.compile(
+    r"[ \t\r\n]*(?:"
+    r"\[([BIL]);([^\]]*)\]"  # 1, 2: 型付き配列 [B; ...], [I; ...], [L; ...]
+    r"|([{}\[\],:])"  # 3: 記号
+    r'|"([^"\\]*(?:\\.[^"\\]*)*)"(?:[ \t\r\n]*(:))?'  # 4, 5: ダブルクォート文字列
+    r"|'([^'\\]*(?:\\.[^'\\]*)*)'(?:[ \t\r\n]*(:))?"  # 6, 7: シングルクォート文字列
+    r"|([A-Za-z0-9._+\-]+)(?:[ \t\r\n]*(:))?"  # 8, 9: 引用符なしの値
+    r"|([^ \t\r\n]))",  # 10: 不正な文字
+    re.S,
+)
+_TYPED_ARRAY = 2
+_SYMBOL = 3
+_DOUBLE_QUOTED = 4
+_DOUBLE_QUOTED_KEY = 5
+_SINGLE_QUOTED = 6
+_SINGLE_QUOTED_KEY = 7
+_BARE = 8
+_BARE_KEY = 9
+# 整数(b, s, Lの接尾辞あり)または小数(f, dの接尾辞あり)
+_NUMBER = re.compile(
+    r"([-+]?\d+)[bBsSlL]?|([-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?)[fFdD]?"
+)
+# 型付き配列の要素
+_ARRAY_ITEM = re.compile(r"[-+]?\d+")
+_ARRAY_TYPES = {"B": "b", "I": "i", "L": "q"}
+# 数値になりうる引用符なしの値の先頭の文字
+_NUMBER_START = frozenset("0123456789+-.")
+_ESCAPE = re.compile(r"\\(.)", re.S)
+
+# パーサーの状態
+_VALUE = 0  # 値を待っている
+_KEY = 1  # コンパウンドのキーを待っている
+_SEPARATOR = 2  # 値の後の','または閉じ括弧を待っている
+_END = 3  # 全体の値を読み終えた
+
+
+class SNBTDecodeError(ValueError):
+    """SNBTの解析に失敗したときに送出される例外"""
+
+    def __init__(self, message: str, text: str, pos: int):
+        super().__init__(f"{message}: {pos}文字目 {text[pos:pos + 20]!r}")
+        self.text = text
+        self.pos = pos
+
+
+def loads(text: str) -> Any:
+    """SNBTの文字列をPythonの値に変換します。
+
+    1つの正規表現のfinditerでトークンを順番に読み、再帰を使わずにスタックで入れ子を
+    組み立てます。型付き配列とキーの後の':'はトークンの段階でまとめて読みます。
+    """
+    # (親のコンテナ, 親のキー)のスタック
+    stack: list[tuple[dict | list | None, str | None]] = []
+    container: dict | list | None = None
+    key: str | None = None
+    state = _VALUE
+    result: Any = None
+
+    for token in _TOKEN.finditer(text):
+        kind = token.lastindex
+        symbol = token.group(_SYMBOL) if kind == _SYMBOL else None
+
+        if state == _SEPARATOR:
+            if symbol == ",":
+                state = _KEY if type(container) is dict else _VALUE
+                continue
+            if symbol != ("}" if type(container) is dict else "]"):
+                raise SNBTDecodeError(
+                    "','または閉じ括弧が必要です", text, token.start(kind)
+                )
+            value = container
+            container, key = stack.pop()
+
+        elif state == _KEY:
+            if kind == _BARE_KEY:
+                key = token.group(_BARE)
+                state = _VALUE
+                continue
+            if kind == _DOUBLE_QUOTED_KEY or kind == _SINGLE_QUOTED_KEY:
+                key = _unescape(token.group(kind - 1))
+                state = _VALUE
+                continue
+            if kind == _DOUBLE_QUOTED or kind == _SINGLE_QUOTED or kind == _BARE:
+                raise SNBTDecodeError("':'が必要です", text, token.end())
+            if symbol != "}" or container:
+                raise SNBTDecodeError("キーが必要です", text, token.start(kind))
+            value = container
+            container, key = stack.pop()
+
+        elif state == _END:
+            raise SNBTDecodeError("余分な文字があります", text, token.start(kind))
+
+        elif kind == _BARE:
+            value = _scalar(token.group(kind))
+        elif kind == _DOUBLE_QUOTED or kind == _SINGLE_QUOTED:
+            value = _unescape(token.group(kind))
+        elif symbol == "{" or symbol == "[":
+            stack.append((container, key))
+            if symbol == "{":
+                container = {}
+                state = _KEY
+            else:
+                container = []
+            key = None
+            continue
+        elif kind == _TYPED_ARRAY:
+            value = array(
+                _ARRAY_TYPES[token.group(1)],
+                map(int, _ARRAY_ITEM.findall(token.group(kind))),
+            )
+        elif symbol == "]" and type(container) is list and not container:
+            value = container
+            container, key = stack.pop()
+        else:
+            raise SNBTDecodeError("値が必要です", text, token.start(kind))
+
+        if container is None:
+            result = value
+            state = _END
+        elif type(container) is dict:
+            container[key] = value
+            state = _SEPARATOR
+        else:
+            container.append(value)
+            state = _SEPARATOR
+
+    if state != _END:
+        raise SNBTDecodeError("SNBTが途中で終わっています", text, len(text))
+    return result
+
+
+def _unescape(value: str) -> str:
+    if "\\" in value:
+        return _ESCAPE.sub(r"\1", value)
+    return value
+
+
+def _scalar(token: str) -> int | float | bool | str:
+    """引用符なしの値を数値・真偽値・文字列に変換します。"""
+    if token[0] in _NUMBER_START:
+        number = _NUMBER.fullmatch(token)
+        if number is not None:
+            integer, decimal = number.groups()
+            if integer is not None:
+                return int(integer)
+            return float(decimal)
+    elif token == "true":
+        return True
+    elif token == "false":
+        return False
+    return token
+
+
+def parse_data_get(response: str) -> Any:
+    """data getコマンドのレスポンスをPythonの値に変換します。
+
+    Args:
+    -----
+        response (str): "Steve has the following entity data: {...}"のようなレスポンス
+
+    Returns:
+    -------
+        Any: データの値
+    """
+    match = _DATA_GET_PREFIX.match(response)
+    if match is None:
+        raise SNBTDecodeError("data getのレスポンスではありません", response, 0)
+    return loads(response[match.end() :])
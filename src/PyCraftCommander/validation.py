@@ -0,0 +1,175 @@
+import difflib
+from typing import Iterable
+from PyCraftCommander.types.mcid import DEFAULT_NAMESPACE, GET_MCID
+
+
+class UnknownBlockIdError(ValueError):
+    """存在しないブロックIDの場合に送出される例外
+
+    候補の計算には時間がかかるため、メッセージを表示するときに初めて求めます。
+    """
+
+    def __init__(self, block_id: str, validator: "BlockIdValidator"):
+        super().__init__(block_id)
+        self.block_id = block_id
+        self.__validator = validator
+        self.__suggestions: list[str] | None = None
+
+    @property
+    def suggestions(self) -> list[str]:
+        """正しいIDの候補"""
+        if self.__suggestions is None:
+            self.__suggestions = self.__validator.suggest(self.block_id)
+        return self.__suggestions
+
+    def __str__(self) -> str:
+        message = f"不明なブロックIDです。: {self.block_id}"
+        if self.suggestions:
+            message += f"\n候補: {', '.join(self.suggestions)}"
+        return message
+
+
+class BlockIdValidator:
+    """ブロックIDをサーバーに送信する前に検証するクラス
+
+    IDの表からハッシュ集合を作成し、存在しないIDをO(1)で検出します。
+    誤ったIDの場合は、トライ木による前方一致の候補とdifflibによる
+    似たIDの候補をエラーメッセージに含めます。
+    候補はエラーメッセージを表示するときに求めるため、検証自体はマイクロ秒単位で失敗します。
+    トライ木は初めて候補を求めたときに作成します。
+
+    PyCraftCommanderにblock_id_validatorとして渡すと、set_block・set_blocks・fill・
+    fill_voxels・バッチのset_block/fillで、コマンドを送信する前に検証されます。
+
+    ブロックの状態([facing=east])やNBT({...})は無視し、名前空間を省略した場合は
+    minecraft:として扱います。IDの表にはアイテムのIDも含まれるため、
+    ブロックではないIDは検出できません。
+
+    Example:
+    --------
+    ```python
+    validator = BlockIdValidator(GET_MCID("1.21"))
+    with PyCraftCommander(host, port, password, block_id_validator=validator) as server:
+        server.auth()
+        server.set_block(pos, "minecraft:diamnd_block")
+        # UnknownBlockIdError: 不明なブロックIDです。: minecraft:diamnd_block
+        # 候補: minecraft:diamond_block, ...
+    ```
+    """
+
+    def __init__(self, ids: Iterable[str] | None = None):
+        """
+        Args:
+        -----
+            ids (Iterable[str] | None): 有効なIDのリスト(GET_MCIDの表など)。
+                Noneの場合はGET_MCID("1.21")を使用します。
+        """
+        if ids is None:
+            ids = GET_MCID("1.21")
+        self.ids = frozenset(str(id) for id in ids)
+        # 文字 -> 子ノード。IDの終端は""をキーにIDを格納する
+        self.__trie: dict | None = None
+
+    def normalize(self, block_id: str) -> str:
+        """ブロックの状態とNBTを取り除き、名前空間を補ったIDを返します。"""
+        block_id = block_id.partition("[")[0].partition("{")[0].strip()
+        if ":" not in block_id:
+            block_id = f"{DEFAULT_NAMESPACE}:{block_id}"
+        return block_id
+
+    def is_valid(self, block_id: str) -> bool:
+        """有効なブロックIDかどうかを返します。"""
+        return block_id in self.ids or self.normalize(block_id) in self.ids
+
+    def validate(self, block_id: str) -> str:
+        """ブロックIDを検証します。
+
+        Args:
+        -----
+            block_id (str): ブロックID
+
+        Returns:
+        -------
+            str: 渡されたブロックID
+
+        Raises:
+        -------
+            UnknownBlockIdError: 存在しないIDの場合(ValueErrorのサブクラス)。候補をメッセージに含みます。
+        """
+        if block_id in self.ids or self.normalize(block_id) in self.ids:
+            return block_id
+        raise UnknownBlockIdError(block_id, self)
+
+    def validate_all(self, block_ids: Iterable[str]):
+        """複数のブロックIDを検証します。同じIDは1回だけ検証します。"""
+        for block_id in set(block_ids):
+            self.validate(block_id)
+
+    def complete(self, prefix: str, limit: int = 10) -> list[str]:
+        """prefixで始まるIDを短い順に最大limit個返します。"""
+        node = self.__trie_root()
+        for char in prefix:
+            node = node.get(char)
+            if node is None:
+                return []
+        return self.__collect(node, limit)
+
+    def suggest(self, block_id: str, limit: int = 5) -> list[str]:
+        """誤ったブロックIDに対する候補を返します。
+
+        入力と一致する最も長い前方一致の候補と、綴りの似たIDを合わせて返します。
+        """
+        block_id = self.normalize(block_id)
+        # 共通の名前空間で類似度が高くならないように、名前空間を除いて比較する
+        namespace, _, path = block_id.rpartition(":")
+        paths = {
+            id.partition(":")[2]: id
+            for id in self.ids
+            if id.partition(":")[0] == namespace
+        }
+        suggestions = [
+            paths[match]
+            for match in difflib.get_close_matches(path, paths, n=limit, cutoff=0.7)
+        ]
+
+        # 名前空間だけが一致する場合は候補にしない
+        node = self.__trie_root()
+        matched = 0
+        for char in block_id:
+            child = node.get(char)
+            if child is None:
+                break
+            node = child
+            matched += 1
+        if matched > block_id.find(":") + 1:
+            for id in self.__collect(node, limit):
+                if id not in suggestions:
+                    suggestions.append(id)
+        return suggestions[:limit]
+
+    def __trie_root(self) -> dict:
+        if self.__trie is None:
+            root: dict = {}
+            for id in self.ids:
+                node = root
+                for char in id:
+                    node = node.setdefault(char, {})
+                node[""] = id
+            self.__trie = root
+        return self.__trie
+
+    @staticmethod
+    def __collect(node: dict, limit: int) -> list[str]:
+        """ノード以下のIDを短い順に最大limit個返します。"""
+        result = []
+        level = [node]
+        while level and len(result) < limit:
+            next_level = []
+            for current in level:
+                for char, child in sorted(current.items()):
+                    if char == "":
+                        result.append(child)
+                    else:
+                        next_level.append(child)
+            level = next_level
+        return sorted(result, key=lambda id: (len(id), id))[:limit]
@@ -0,0 +1,310 @@
+"""3次元のブロック配列をfillコマンドに変換するモジュール
+
+ボクセルごとにsetblockを送る代わりに、同じブロックが並ぶ範囲を直方体にまとめて
+fillコマンドとして送信することで、コマンド数を大幅に減らします。
+"""
+
+from dataclasses import dataclass
+from itertools import groupby
+from typing import Any, Callable, Iterable, Iterator, Literal, Sequence
+from PyCraftCommander import commands
+from PyCraftCommander.types.player import Pos
+
+# fillコマンドで一度に変更できるブロック数の上限
+MAX_FILL_VOLUME = 32768
+
+
+@dataclass
+class Box:
+    """ボクセル配列内の直方体を表すデータクラス
+
+    Attributes:
+    ----------
+    x1, y1, z1: 開始インデックス
+    x2, y2, z2: 終了インデックス(この位置を含む)
+    value: 直方体内のブロックの値
+    """
+
+    x1: int
+    y1: int
+    z1: int
+    x2: int
+    y2: int
+    z2: int
+    value: Any
+
+    @property
+    def volume(self) -> int:
+        """直方体に含まれるブロック数"""
+        return (
+            (self.x2 - self.x1 + 1) * (self.y2 - self.y1 + 1) * (self.z2 - self.z1 + 1)
+        )
+
+
+def _flatten(voxels, shape: tuple[int, int, int] | None) -> tuple[list, tuple]:
+    """ボクセル配列を[x][y][z]順の1次元リストに変換します。"""
+    if shape is not None:
+        # パレットのインデックスが並んだ1次元のバッファ
+        sx, sy, sz = shape
+        if len(voxels) != sx * sy * sz:
+            raise ValueError("ボクセル数がshapeと一致しません。")
+        return list(voxels), (sx, sy, sz)
+
+    if hasattr(voxels, "tolist"):
+        # NumPy配列は要素ごとのアクセスが遅いため、先にリストに変換する
+        voxels = voxels.tolist()
+
+    sx = len(voxels)
+    sy = len(voxels[0]) if sx else 0
+    sz = len(voxels[0][0]) if sy else 0
+    cells = []
+    for plane in voxels:
+        for row in plane:
+            if len(row) != sz:
+                raise ValueError("ボクセル配列の形が揃っていません。")
+            cells.extend(row)
+    if len(cells) != sx * sy * sz:
+        raise ValueError("ボクセル配列の形が揃っていません。")
+    return cells, (sx, sy, sz)
+
+
+def greedy_boxes(
+    voxels: Sequence,
+    skip: Any = None,
+    max_volume: int = MAX_FILL_VOLUME,
+    shape: tuple[int, int, int] | None = None,
+) -> list[Box]:
+    """ボクセル配列を同じ値の直方体に分割します。
+
+    z, y, xの順に同じ値が続く限り直方体を広げる貪欲法で分割します。
+    各直方体のブロック数はmax_volume以下になります。
+
+    Args:
+    -----
+        voxels (Sequence): [x][y][z]でアクセスできる3次元配列(NumPy配列も可)、
+            またはshapeを指定した場合は[x][y][z]順に並んだ1次元のバッファ
+        skip (Any): この値のボクセルは直方体に含めません(空気や変更不要な位置など)
+        max_volume (int): 1つの直方体に含めるブロック数の上限
+        shape (tuple[int, int, int] | None): 1次元のバッファを渡す場合の(x, y, z)の大きさ
+
+    Returns:
+    -------
+        list[Box]: 直方体のリスト
+    """
+    cells, (sx, sy, sz) = _flatten(voxels, shape)
+    syz = sy * sz
+    visited = bytearray(len(cells))
+    boxes: list[Box] = []
+
+    def row_matches(x: int, y: int, z1: int, z2: int, value) -> bool:
+        base = x * syz + y * sz
+        for i in range(base + z1, base + z2 + 1):
+            if visited[i] or cells[i] != value:
+                return False
+        return True
+
+    for x in range(sx):
+        for y in range(sy):
+            base = x * syz + y * sz
+            for z in range(sz):
+                i = base + z
+                value = cells[i]
+                if visited[i] or value == skip:
+                    continue
+
+                # z方向に広げる
+                z2 = z
+                while (
+                    z2 + 1 < sz
+                    and z2 + 2 - z <= max_volume
+                    and not visited[i + z2 + 1 - z]
+                    and cells[i + z2 + 1 - z] == value
+                ):
+                    z2 += 1
+                depth = z2 - z + 1
+
+                # y方向に広げる
+                y2 = y
+                while (
+                    y2 + 1 < sy
+                    and (y2 + 2 - y) * depth <= max_volume
+                    and row_matches(x, y2 + 1, z, z2, value)
+                ):
+                    y2 += 1
+                area = (y2 - y + 1) * depth
+
+                # x方向に広げる
+                x2 = x
+                while (
+                    x2 + 1 < sx
+                    and (x2 + 2 - x) * area <= max_volume
+                    and all(
+                        row_matches(x2 + 1, yy, z, z2, value) for yy in range(y, y2 + 1)
+                    )
+                ):
+                    x2 += 1
+
+                for xx in range(x, x2 + 1):
+                    for yy in range(y, y2 + 1):
+                        start = xx * syz + yy * sz
+                        visited[start + z : start + z2 + 1] = b"\x01" * depth
+
+                boxes.append(Box(x, y, z, x2, y2, z2, value))
+
+    return boxes
+
+
+def compile_fill_commands(
+    voxels: Sequence,
+    origin: Pos,
+    palette: Sequence[str] | dict | None = None,
+    skip: Any = None,
+    mode: Literal["replace", "keep", "destroy"] = "replace",
+    shape: tuple[int, int, int] | None = None,
+) -> list[str]:
+    """ボクセル配列を設置するためのfill/setblockコマンドのリストを返します。
+
+    Args:
+    -----
+        voxels (Sequence): ブロックIDまたはパレットのインデックスの3次元配列
+        origin (Pos): voxels[0][0][0]を設置する座標
+        palette (Sequence[str] | dict | None): インデックスからブロックIDへの対応。
+            Noneの場合はvoxelsの値をそのままブロックIDとして使用します。
+        skip (Any): 設置しない値(Noneや空気のインデックスなど)
+        mode: fill/setblockのモード
+        shape (tuple[int, int, int] | None): 1次元のバッファを渡す場合の(x, y, z)の大きさ
+
+    Returns:
+    -------
+        list[str]: コマンドのリスト
+    """
+    return [
+        box_command(box, origin, palette, mode)
+        for box in greedy_boxes(voxels, skip=skip, shape=shape)
+    ]
+
+
+def box_command(
+    box: Box,
+    origin: Pos,
+    palette: Sequence[str] | dict | None = None,
+    mode: Literal["replace", "keep", "destroy"] = "replace",
+) -> str:
+    """直方体を設置するコマンドを返します。1ブロックの場合はsetblockになります。"""
+    ox, oy, oz = int(origin.x), int(origin.y), int(origin.z)
+    block_id = box.value if palette is None else palette[box.value]
+    pos1 = Pos(ox + box.x1, oy + box.y1, oz + box.z1)
+    if box.volume == 1:
+        return commands.set_block(pos1, block_id, mode)
+    pos2 = Pos(ox + box.x2, oy + box.y2, oz + box.z2)
+    return commands.fill(pos1, pos2, block_id, mode)
+
+
+def _layer_rectangles(
+    layer: Iterable[Sequence],
+    skip: Any,
+    max_volume: int,
+    depth: Callable[[Any], int] | None = None,
+) -> Iterator[tuple[int, int, int, int, Any]]:
+    """1層の[z][x]の値から、同じ値が並ぶ長方形を(x1, x2, z1, z2, 値)で返します。
+
+    depthを指定した場合は、長方形の面積にdepth(値)を掛けた体積がmax_volumeを超えないようにします。
+    """
+    # (x1, x2, 値) -> 開始z
+    open: dict[tuple[int, int, Any], int] = {}
+    z = -1
+    for z, row in enumerate(layer):
+        next_open = {}
+        x = 0
+        for value, group in groupby(row):
+            width = sum(1 for _ in group)
+            if value != skip:
+                # 長方形の面積の上限
+                limit = (
+                    max_volume if depth is None else max(1, max_volume // depth(value))
+                )
+                # 1行の長さが上限を超える場合は分割する
+                for x1 in range(x, x + width, limit):
+                    run = (x1, min(x + width, x1 + limit) - 1, value)
+                    start = open.pop(run, None)
+                    if (
+                        start is not None
+                        and (z - start + 1) * (run[1] - run[0] + 1) > limit
+                    ):
+                        yield run[0], run[1], start, z - 1, value
+                        start = None
+                    next_open[run] = z if start is None else start
+            x += width
+        for (x1, x2, value), start in open.items():
+            yield x1, x2, start, z - 1, value
+        open = next_open
+    for (x1, x2, value), start in open.items():
+        yield x1, x2, start, z, value
+
+
+def stream_boxes(
+    layers: Iterable[Iterable[Sequence]],
+    skip: Any = None,
+    max_volume: int = MAX_FILL_VOLUME,
+) -> Iterator[Box]:
+    """y方向の層ごとに渡されたボクセルを、同じ値の直方体に分割しながら順番に返します。
+
+    各層でx方向に同じ値が続く範囲をz方向に伸ばして長方形にし、次の層にまったく同じ
+    長方形があればy方向に伸ばします。保持するのは直前の層の長方形だけなので、
+    greedy_boxesと異なり全体を読み込まずに大きな構造物を処理できます。
+    (分割はgreedy_boxesより粗くなることがあります)
+
+    Args:
+    -----
+        layers (Iterable[Iterable[Sequence]]): yの小さい順の層。各層は[z][x]の順に値を返す
+        skip (Any): この値のボクセルは直方体に含めません
+        max_volume (int): 1つの直方体に含めるブロック数の上限
+
+    Returns:
+    -------
+        Iterator[Box]: 直方体
+    """
+    # (x1, x2, z1, z2, 値) -> 開始y
+    open: dict[tuple[int, int, int, int, Any], int] = {}
+    y = -1
+    for y, layer in enumerate(layers):
+        next_open = {}
+        for rectangle in _layer_rectangles(layer, skip, max_volume):
+            x1, x2, z1, z2, value = rectangle
+            area = (x2 - x1 + 1) * (z2 - z1 + 1)
+            start = open.pop(rectangle, None)
+            if start is not None and (y - start + 1) * area > max_volume:
+                yield Box(x1, start, z1, x2, y - 1, z2, value)
+                start = None
+            next_open[rectangle] = y if start is None else start
+        for (x1, x2, z1, z2, value), start in open.items():
+            yield Box(x1, start, z1, x2, y - 1, z2, value)
+        open = next_open
+    for (x1, x2, z1, z2, value), start in open.items():
+        yield Box(x1, start, z1, x2, y, z2, value)
+
+
+def send_streamed(
+    server, commands: Iterable[str], chunk_size: int = 4096
+) -> tuple[int, int]:
+    """コマンドをchunk_size個ずつパイプラインで送信します。
+
+    全てのコマンドをリストにしないため、メモリ使用量はchunk_sizeに比例します。
+
+    Returns:
+    -------
+        tuple[int, int]: (送信したコマンド数, 失敗したコマンド数)
+    """
+    sent = 0
+    failed = 0
+    chunk = []
+    for command in commands:
+        chunk.append(command)
+        if len(chunk) == chunk_size:
+            failed += sum(not status for _, status in server.send_commands(chunk))
+            sent += len(chunk)
+            chunk = []
+    if chunk:
+        failed += sum(not status for _, status in server.send_commands(chunk))
+        sent += len(chunk)
+    return sent, failed
@@ -0,0 +1,27 @@
+import pytest
+from PyCraftCommander import PyCraftCommander
+from PyCraftCommander.fake_server import FakeRCONServer
+
+PASSWORD = "test"
+
+
+@pytest.fixture
+def fake():
+    with FakeRCONServer(password=PASSWORD, record_commands=True) as server:
+        yield server
+
+
+@pytest.fixture
+def connect(fake):
+    """FakeRCONServerに認証済みのPyCraftCommanderを作成する関数"""
+    opened = []
+
+    def connect(**options) -> PyCraftCommander:
+        server = PyCraftCommander(*fake.address, PASSWORD, timeout=2.0, **options)
+        opened.append(server)
+        server.auth()
+        return server
+
+    yield connect
+    for server in opened:
+        server.__exit__(None, None, None)
@@ -0,0 +1,28 @@
+import asyncio
+import struct
+import pytest
+from PyCraftCommander import AsyncRCON
+
+
+@pytest.mark.parametrize("size", [0, 9, 16 * 1024 * 1024 + 1, -1])
+def test_invalid_packet_size_fails_pending(size):
+    async def main():
+        async def reply(reader, writer):
+            await reader.read(1024)
+            writer.write(struct.pack("<i", size) + b"\0" * 16)
+            await writer.drain()
+            await reader.read()
+            writer.close()
+
+        server = await asyncio.start_server(reply, "127.0.0.1", 0)
+        host, port = server.sockets[0].getsockname()[:2]
+        async with server:
+            rcon = AsyncRCON(host, port, "test", timeout=5.0)
+            await rcon.connect()
+            try:
+                with pytest.raises(ConnectionError, match="不正なパケット"):
+                    await asyncio.wait_for(rcon.auth(), 2.0)
+            finally:
+                await rcon.close()
+
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+import pytest
+from PyCraftCommander import BlockIdValidator, Pos
+
+STONE = "minecraft:stone"
+
+
+def test_results_follow_responses(fake, connect):
+    fake.add_player("Steve")
+    server = connect()
+    with server.batch() as b:
+        b.set_block(Pos(0, 64, 0), STONE)
+        b.set_block(Pos(0, 64, 0), STONE)
+        b.set_block(Pos(0, 64, 0), "minecraft:dirt", "keep")
+        b.fill(Pos(0, 64, 0), Pos(1, 65, 1), STONE)
+        b.player_pos("Steve")
+        b.player_pos("Alex")
+        b.add("unknowncommand")
+
+    assert [status for _, status in b.results] == [
+        True,  # 変更された
+        True,  # 既に同じブロック
+        False,  # keepで設置されなかった
+        True,
+        True,
+        False,  # プレイヤーが見つからない
+        False,
+    ]
+    assert b.results[0][0].startswith("Changed the block")
+    assert len(b.results) == len(fake.commands)
+
+
+def test_only_builders_are_exposed(connect):
+    b = connect().batch()
+    for name in ("snbt", "Pos", "Player", "GameMode", "Literal", "parse_seed"):
+        with pytest.raises(AttributeError):
+            getattr(b, name)
+    assert b.give("Steve", "minecraft:diamond") == 0
+    assert b.commands == ["give Steve minecraft:diamond 1"]
+
+
+def test_missing_block_id_names_builder(connect):
+    b = connect(block_id_validator=BlockIdValidator()).batch()
+    with pytest.raises(TypeError, match="fill"):
+        b.fill(Pos(0, 0, 0), Pos(1, 1, 1))
+    b.fill(Pos(0, 0, 0), Pos(1, 1, 1), block_id=STONE)
+    assert len(b) == 1
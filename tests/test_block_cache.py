@@ -0,0 +1,79 @@
+from PyCraftCommander import AdaptiveRateLimiter, BlockCache, Pos
+
+STONE = "minecraft:stone"
+GLASS = "minecraft:glass"
+DIRT = "minecraft:dirt"
+
+
+def test_set_block_skips_cached_block(fake, connect):
+    server = connect(block_cache=BlockCache())
+    assert server.set_block(Pos(0, 64, 0), GLASS).startswith("Changed")
+    assert server.set_block(Pos(0, 64, 0), GLASS) == ""
+    assert fake.commands.count(f"setblock 0 64 0 {GLASS} replace") == 1
+
+
+def test_batch_updates_cache(fake, connect):
+    # batchで書き換えたブロックを古いキャッシュで省略しない
+    server = connect(block_cache=BlockCache())
+    server.set_block(Pos(0, 64, 0), GLASS)
+    with server.batch() as b:
+        b.set_block(Pos(0, 64, 0), DIRT)
+    assert server.block_cache.get(Pos(0, 64, 0)) == DIRT
+
+    assert server.set_block(Pos(0, 64, 0), GLASS).startswith("Changed")
+    assert fake.world[(0, 64, 0)] == GLASS
+
+
+def test_raw_commands_update_cache(fake, connect):
+    server = connect(block_cache=BlockCache())
+    server.set_block(Pos(1, 64, 1), GLASS)
+    server.send_command(f"setblock 1 64 1 {DIRT}")
+    assert server.block_cache.get(Pos(1, 64, 1)) == DIRT
+
+    server.send_commands([f"fill 0 60 0 3 60 3 {STONE} replace"])
+    assert server.block_cache.get(Pos(3, 60, 3)) == STONE
+
+    # 範囲が分からないコマンドは全て無効にする
+    server.send_command(f"setblock ~ ~ ~ {DIRT}")
+    assert len(server.block_cache) == 0
+
+
+def test_failed_or_keep_commands_are_not_cached(fake, connect):
+    server = connect(block_cache=BlockCache())
+    server.set_block(Pos(0, 64, 0), STONE)
+    server.set_block(Pos(0, 64, 0), GLASS, mode="keep")
+    assert server.block_cache.get(Pos(0, 64, 0)) is None
+    assert fake.world[(0, 64, 0)] == STONE
+
+    # 上限を超えるfillはサーバーに拒否される
+    response = server.fill(Pos(0, 0, 0), Pos(99, 99, 99), GLASS)
+    assert response.startswith("Too many blocks")
+    assert server.block_cache.get(Pos(5, 5, 5)) is None
+
+
+def test_fill_with_filter_invalidates_region(fake, connect):
+    server = connect(block_cache=BlockCache())
+    server.fill(Pos(0, 0, 0), Pos(2, 0, 2), STONE)
+    server.send_command(f"fill 0 0 0 2 0 2 {GLASS} replace {STONE}")
+    assert server.block_cache.get(Pos(1, 0, 1)) is None
+
+
+def test_placement_keeps_recorded_blocks(fake, connect):
+    from PyCraftCommander.schematic import Region, Schematic, place_schematic
+
+    server = connect(block_cache=BlockCache())
+    schematic = Schematic(
+        "nbt", [Region((0, 0, 0), (2, 1, 1), [GLASS, DIRT], bytes([0, 1]))]
+    )
+    assert place_schematic(server, schematic, Pos(0, 64, 0)) == (2, 0)
+    assert server.block_cache.get(Pos(0, 64, 0)) == GLASS
+    assert server.block_cache.get(Pos(1, 64, 0)) == DIRT
+
+    assert server.set_block(Pos(0, 64, 0), GLASS) == ""
+
+
+def test_fill_voxels_empty(fake, connect):
+    server = connect(block_cache=BlockCache(), rate_limiter=AdaptiveRateLimiter())
+    assert server.fill_voxels([], Pos(0, 64, 0)) == []
+    assert server.fill_voxels([[[None]]], Pos(0, 64, 0), skip=None) == []
+    assert fake.commands == []
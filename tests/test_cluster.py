@@ -0,0 +1,44 @@
+import threading
+import time
+from PyCraftCommander import Cluster, PyCraftCommander
+from conftest import PASSWORD
+
+
+def count_closes(monkeypatch) -> list[PyCraftCommander]:
+    closed = []
+    original = PyCraftCommander.__exit__
+
+    def exit(self, *args):
+        closed.append(self)
+        return original(self, *args)
+
+    monkeypatch.setattr(PyCraftCommander, "__exit__", exit)
+    return closed
+
+
+def test_failed_auth_closes_connection(fake, monkeypatch):
+    closed = count_closes(monkeypatch)
+    host, port = fake.address
+    with Cluster({"a": (host, port, "wrong")}, timeout=2.0) as cluster:
+        assert "a" in cluster.connect_errors
+        assert len(closed) == 1
+        assert cluster.connected() == []
+
+
+def test_close_waits_for_running_worker(fake, monkeypatch):
+    closed = count_closes(monkeypatch)
+    release = threading.Event()
+    fake.handlers["slow"] = lambda args: str(release.wait(5.0))
+
+    cluster = Cluster({"a": (*fake.address, PASSWORD)}, timeout=2.0)
+    result = cluster.send_command("slow", timeout=0.1)["a"]
+    assert isinstance(result.error, TimeoutError)
+
+    cluster.close()
+    # 処理中の接続は閉じない
+    assert closed == []
+    release.set()
+    deadline = time.monotonic() + 5.0
+    while not closed and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert len(closed) == 1
@@ -0,0 +1,24 @@
+import pytest
+from PyCraftCommander import BlockIdValidator, Pos
+
+np = pytest.importorskip("numpy")
+from PyCraftCommander.image import DEFAULT_PALETTE, place_image
+
+
+@pytest.mark.parametrize("block_id", DEFAULT_PALETTE)
+def test_default_palette_is_valid(block_id):
+    BlockIdValidator().validate(block_id)
+
+
+def test_place_image_with_validator(fake, connect):
+    server = connect(block_id_validator=BlockIdValidator())
+    image = np.zeros((2, 3, 4), dtype=np.uint8)
+    image[..., 3] = 255
+    image[0] = (207, 213, 214, 255)
+    image[1, 0, 3] = 0  # 透明な画素は設置しない
+
+    sent, failed = place_image(server, image, Pos(0, 64, 0))
+    assert sent > 0 and failed == 0
+    assert fake.world[(2, 64, 0)] == "minecraft:white_concrete"
+    assert fake.world[(1, 64, 1)] == "minecraft:black_concrete"
+    assert (0, 64, 1) not in fake.world
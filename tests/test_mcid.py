@@ -0,0 +1,63 @@
+import re
+from pathlib import Path
+import pytest
+from PyCraftCommander.types.mcid import (
+    GET_MCID,
+    IdRegistry,
+    build_registry,
+    read_id_list,
+)
+
+
+@pytest.fixture
+def registry():
+    # 1.0のGRASSは2.0でSHORT_GRASSに変わり、2.0のGRASSは別のIDを指す
+    return IdRegistry(
+        build_registry(
+            {
+                "1.0": read_id_list("stone\ngrass\n"),
+                "2.0": read_id_list("stone\nSHORT_GRASS grass\nGRASS grass_block\n"),
+            }
+        )
+    )
+
+
+def test_versions_of_merges_entries(registry):
+    assert registry.versions_of("minecraft:stone") == ("1.0", "2.0")
+    assert registry.versions_of("minecraft:grass") == ("1.0", "2.0")
+    assert registry.versions_of("minecraft:grass_block") == ("2.0",)
+    assert registry.versions_of("minecraft:dirt") == ()
+
+
+def test_table_lookup_checks_version(registry):
+    old, new = registry.table("1.0"), registry.table("2.0")
+    assert "minecraft:grass" in old and "minecraft:grass" in new
+    assert "minecraft:grass_block" not in old
+
+    assert old("minecraft:grass").name == "GRASS"
+    assert new("minecraft:grass").name == "SHORT_GRASS"
+    assert old.GRASS == "minecraft:grass"
+    assert new.GRASS == "minecraft:grass_block"
+    with pytest.raises(AttributeError):
+        old.SHORT_GRASS
+    assert sorted(new) == [
+        "minecraft:grass",
+        "minecraft:grass_block",
+        "minecraft:stone",
+    ]
+
+
+def test_bundled_table():
+    MCID = GET_MCID("1.21")
+    assert MCID.STONE == "minecraft:stone"
+    assert MCID("minecraft:stone") is MCID.STONE
+    with pytest.raises(ValueError):
+        MCID("minecraft:stnoe")
+
+
+def test_docstring_examples_use_existing_ids():
+    MCID = GET_MCID("1.21")
+    package = Path(__file__).resolve().parent.parent / "src" / "PyCraftCommander"
+    for path in package.rglob("*.py"):
+        for name in re.findall(r"\bMCID\.([A-Z][A-Z0-9_]*)", path.read_text("utf-8")):
+            assert name in dir(MCID), f"{path.name}: MCID.{name}"
@@ -0,0 +1,40 @@
+import asyncio
+from PyCraftCommander import AsyncPyCraftCommander, GameMode, Pos
+from conftest import PASSWORD
+
+
+def add_players(fake):
+    fake.add_player("Steve", Pos(1.5, 64.0, -2.5), gamemode=GameMode.CREATIVE)
+    fake.add_player("Alex", dimension="minecraft:the_nether")
+
+
+def test_snapshot_matches_default(fake, connect):
+    add_players(fake)
+    server = connect()
+    player = server.get_player_info("Steve")
+    assert player == server.get_player_info("Steve", snapshot=True)
+    assert player.dimension == "minecraft:overworld"
+    assert player.gamemode is GameMode.CREATIVE
+    assert player.int_pos == Pos(1, 64, -2)
+
+    players = server.get_all_player_info()
+    assert [p.name for p in players] == ["Alex", "Steve"]
+    assert players[0].dimension == "minecraft:the_nether"
+
+
+def test_async_matches_sync(fake, connect):
+    add_players(fake)
+    expected = connect().get_all_player_info()
+
+    async def main():
+        async with AsyncPyCraftCommander(*fake.address, PASSWORD) as server:
+            await server.auth()
+            return (
+                await server.get_player_info("Steve"),
+                await server.get_player_info("Steve", snapshot=True),
+                await server.get_all_player_info(),
+            )
+
+    default, snapshot, players = asyncio.run(main())
+    assert default == snapshot == expected[1]
+    assert players == expected
@@ -0,0 +1,84 @@
+import pytest
+from PyCraftCommander import Pos, ReconnectPolicy, is_idempotent
+
+STONE = "minecraft:stone"
+
+
+def test_pipelined_responses_keep_order(fake, connect):
+    server = connect()
+    commands = [f"setblock {x} 64 0 {STONE}" for x in range(200)]
+    results = server.send_commands(commands, window=16)
+
+    assert [response for response, _ in results] == [
+        f"Changed the block at {x}, 64, 0" for x in range(200)
+    ]
+    assert all(status for _, status in results)
+    assert fake.commands == commands
+    assert len(fake.world) == 200
+
+
+def test_multi_packet_response(fake, connect):
+    fake.handlers["long"] = lambda args: "x" * 10000 + args[0]
+    server = connect()
+    response, status = server.send_command("long a", multi_packet=True)
+    assert status and response == "x" * 10000 + "a"
+
+    results = server.send_commands(["long b", "seed", "long c"], multi_packet=True)
+    assert [response[-1] for response, _ in results] == ["b", "]", "c"]
+
+
+def test_reconnect_replays_idempotent_commands(fake, connect):
+    drops = []
+
+    def drop(args):
+        # 1回目は応答せずに接続を切る
+        if not drops:
+            drops.append(args)
+            raise ConnectionError
+        return ""
+
+    fake.handlers["say"] = drop
+    policy = ReconnectPolicy(initial_delay=0.0, jitter=0.0)
+    server = connect(reconnect_policy=policy)
+    results = server.send_commands(
+        [
+            f"setblock 0 64 0 {STONE}",
+            "say hello",
+            f"setblock 1 64 0 {STONE}",
+        ]
+    )
+
+    assert results[0] == ("Changed the block at 0, 64, 0", True)
+    # 実行されたか分からないsayは再送しない
+    assert results[1] == ("", False)
+    assert results[2] == ("Changed the block at 1, 64, 0", True)
+    assert fake.commands.count("say hello") == 1
+    assert fake.world[(1, 64, 0)] == STONE
+
+    # 再接続後も同じ接続で続けて送信できる
+    assert server.set_block(Pos(2, 64, 0), STONE).startswith("Changed")
+
+
+def test_destroy_mode_is_not_idempotent():
+    assert is_idempotent(f"setblock 0 64 0 {STONE} replace")
+    assert is_idempotent(f"fill 0 64 0 1 64 1 {STONE} replace minecraft:dirt")
+    assert not is_idempotent(f"setblock 0 64 0 {STONE} destroy")
+    assert not is_idempotent(f"fill 0 64 0 1 64 1 {STONE} destroy")
+
+
+def test_reconnect_attempts_carry_over(fake, connect):
+    # 接続はできるが、コマンドを送るたびに切れるサーバー
+    def drop(args):
+        raise ConnectionError
+
+    fake.handlers["seed"] = drop
+    policy = ReconnectPolicy(max_attempts=3, initial_delay=0.0, jitter=0.0)
+    server = connect(reconnect_policy=policy)
+    with pytest.raises(ConnectionError):
+        server.send_commands(["seed"])
+    # 最初の送信と、すぐに行う再接続・待ってから行う3回の再接続の後の再送
+    assert fake.commands == ["seed"] * 5
+
+    # 応答を受け取れば、次に切れたときは最初から数え直す
+    del fake.handlers["seed"]
+    assert server.send_command("seed")[1]
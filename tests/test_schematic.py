@@ -0,0 +1,70 @@
+import gzip
+import struct
+import pytest
+from PyCraftCommander import BlockIdValidator, Pos, UnknownBlockIdError
+from PyCraftCommander.schematic import load_schematic, place_schematic
+
+STONE = "minecraft:stone"
+GLASS = "minecraft:glass"
+
+
+def write_sponge(path, size, palette, blocks):
+    """Sponge Schematic(バージョン2)を書き込みます。blocksは[y][z][x]の順のインデックス"""
+
+    def name(text):
+        encoded = text.encode("utf-8")
+        return struct.pack(">H", len(encoded)) + encoded
+
+    width, height, length = size
+    body = b"".join(
+        [
+            b"\x02" + name("Version") + struct.pack(">h", 2),
+            b"\x02" + name("Width") + struct.pack(">h", width),
+            b"\x02" + name("Height") + struct.pack(">h", height),
+            b"\x02" + name("Length") + struct.pack(">h", length),
+            b"\x0a" + name("Palette"),
+            *(
+                b"\x03" + name(state) + struct.pack(">i", index)
+                for index, state in enumerate(palette)
+            ),
+            b"\x00",
+            b"\x07" + name("BlockData") + struct.pack(">i", len(blocks)),
+            bytes(blocks),
+            b"\x00",
+        ]
+    )
+    path.write_bytes(gzip.compress(b"\x0a" + name("Schematic") + body))
+
+
+def test_place_sponge_schematic(fake, connect, tmp_path):
+    path = tmp_path / "house.schem"
+    # 下の層は石、上の層は中央だけガラスで残りは空気
+    write_sponge(
+        path,
+        (3, 2, 3),
+        ["minecraft:air", STONE, GLASS],
+        [1] * 9 + [0, 0, 0, 0, 2, 0, 0, 0, 0],
+    )
+    schematic = load_schematic(path)
+    assert schematic.size == (3, 2, 3)
+
+    server = connect(block_id_validator=BlockIdValidator())
+    sent, failed = place_schematic(server, schematic, Pos(10, 64, 10))
+    assert (sent, failed) == (2, 0)
+    assert fake.commands == [
+        f"fill 10 64 10 12 64 12 {STONE} replace",
+        f"setblock 11 65 11 {GLASS} replace",
+    ]
+    assert len(fake.world) == 10
+
+
+def test_place_schematic_validates_palette(fake, connect, tmp_path):
+    path = tmp_path / "typo.schem"
+    write_sponge(path, (1, 1, 1), ["minecraft:stnoe"], [0])
+    server = connect(block_id_validator=BlockIdValidator())
+    with pytest.raises(UnknownBlockIdError):
+        place_schematic(server, path, Pos(0, 64, 0), version=None)
+    assert fake.commands == []
+
+    # 表にないIDを設置しない
+    assert place_schematic(server, path, Pos(0, 64, 0), on_unknown="skip") == (0, 0)
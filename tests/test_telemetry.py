@@ -0,0 +1,48 @@
+import logging
+import time
+import pytest
+from PyCraftCommander import Pos
+
+pytest.importorskip("numpy")
+from PyCraftCommander.telemetry import PlayerSampler
+
+
+def test_missing_player_keeps_slot_for_grace(fake, connect):
+    fake.add_player("Steve", Pos(0.5, 64.0, 0.5))
+    sampler = PlayerSampler(connect(), grace=60.0)
+    sampler.sample()
+    fake.players["Steve"].pos = Pos(3.5, 64.0, 4.5)
+    sampler.sample()
+
+    # 1回取得できなかっただけでは記録を消さない
+    fake.remove_player("Steve")
+    sampler.sample()
+    assert sampler.players() == ["Steve"]
+    assert sampler.distance_travelled("Steve") == pytest.approx(5.0)
+
+    sampler.grace = 0.0
+    sampler.sample()
+    assert sampler.players() == []
+
+
+def test_unexpected_error_does_not_stop_sampler(fake, connect, caplog):
+    fake.add_player("Steve")
+    server = connect()
+    calls = []
+    get_all_player_info = server.get_all_player_info
+
+    def flaky():
+        calls.append(None)
+        if len(calls) == 1:
+            raise RuntimeError("boom")
+        return get_all_player_info()
+
+    server.get_all_player_info = flaky
+    with caplog.at_level(logging.ERROR, logger="PyCraftCommander.telemetry"):
+        with PlayerSampler(server, hz=100) as sampler:
+            deadline = time.monotonic() + 5.0
+            while len(calls) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+    assert len(calls) >= 3
+    assert sampler.players() == ["Steve"]
+    assert "boom" in caplog.text
@@ -0,0 +1,52 @@
+import pytest
+from PyCraftCommander import BlockIdValidator, Pos, UnknownBlockIdError
+
+# 以前の表から抜けていた基本的なブロック
+BASIC_BLOCKS = [
+    "minecraft:stone",
+    "minecraft:sand",
+    "minecraft:water",
+    "minecraft:lava",
+    "minecraft:air",
+    "minecraft:stone_bricks",
+    "minecraft:smooth_stone",
+    "minecraft:structure_void",
+    "minecraft:white_concrete",
+    "minecraft:yellow_concrete",
+    "minecraft:red_concrete",
+]
+
+
+@pytest.mark.parametrize("block_id", BASIC_BLOCKS)
+def test_default_table_has_basic_blocks(block_id):
+    assert BlockIdValidator().validate(block_id) == block_id
+
+
+def test_normalize_states_and_namespace():
+    validator = BlockIdValidator()
+    assert validator.is_valid("stone")
+    assert validator.is_valid("minecraft:oak_stairs[facing=east]")
+    assert validator.is_valid('minecraft:chest{CustomName:"a"}')
+
+
+def test_unknown_id_suggests_candidates():
+    with pytest.raises(UnknownBlockIdError) as info:
+        BlockIdValidator().validate("minecraft:diamnd_block")
+    assert "minecraft:diamond_block" in info.value.suggestions
+
+
+def test_explicit_ids():
+    validator = BlockIdValidator(["minecraft:stone"])
+    assert validator.is_valid("minecraft:stone")
+    assert not validator.is_valid("minecraft:dirt")
+
+
+def test_validator_blocks_send(fake, connect):
+    server = connect(block_id_validator=BlockIdValidator())
+    server.set_block(Pos(0, 64, 0), "minecraft:stone")
+    with pytest.raises(UnknownBlockIdError):
+        server.set_block(Pos(0, 64, 0), "minecraft:stnoe")
+    with pytest.raises(UnknownBlockIdError):
+        with server.batch() as b:
+            b.fill(Pos(0, 64, 0), Pos(1, 64, 1), "minecraft:stnoe")
+    assert fake.commands == ["setblock 0 64 0 minecraft:stone replace"]